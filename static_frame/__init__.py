@@ -9,7 +9,11 @@ from arraykit import mloc as mloc
 from static_frame.core.archive_npy import NPY as NPY
 from static_frame.core.archive_npy import NPZ as NPZ
 from static_frame.core.batch import Batch as Batch
+from static_frame.core.block_parallel import BlockParallelActive as BlockParallelActive
+from static_frame.core.block_parallel import BlockParallelConfig as BlockParallelConfig
 from static_frame.core.bus import Bus as Bus
+from static_frame.core.consolidate import ConsolidateActive as ConsolidateActive
+from static_frame.core.consolidate import ConsolidateConfig as ConsolidateConfig
 from static_frame.core.display import Display as Display
 from static_frame.core.display import DisplayActive as DisplayActive
 from static_frame.core.display_config import DisplayConfig as DisplayConfig
@@ -73,6 +77,7 @@ from static_frame.core.node_iter import IterNodeApplyType as IterNodeApplyType
 from static_frame.core.node_iter import IterNodeAxis
 from static_frame.core.node_iter import IterNodeDelegate
 from static_frame.core.node_iter import IterNodeDelegateMapable
+from static_frame.core.node_iter import IterNodeDelegateReducible
 from static_frame.core.node_iter import IterNodeDepthLevel
 from static_frame.core.node_iter import IterNodeDepthLevelAxis
 from static_frame.core.node_iter import IterNodeGroup
@@ -95,6 +100,7 @@ from static_frame.core.node_transpose import InterfaceTranspose
 from static_frame.core.node_values import InterfaceBatchValues
 from static_frame.core.node_values import InterfaceValues
 from static_frame.core.platform import Platform as Platform
+from static_frame.core.pool import cost_nbytes as cost_nbytes
 from static_frame.core.quilt import Quilt as Quilt
 from static_frame.core.series import Series as Series
 from static_frame.core.series import SeriesAssign as SeriesAssign
@@ -113,6 +119,8 @@ from static_frame.core.util import IndexSpecifier as IndexSpecifier
 from static_frame.core.util import KeyOrKeys as KeyOrKeys
 from static_frame.core.util import PathSpecifierOrFileLike as PathSpecifierOrFileLike
 from static_frame.core.util import SeriesInitializer as SeriesInitializer
+from static_frame.core.values_cache import ValuesCacheActive as ValuesCacheActive
+from static_frame.core.values_cache import ValuesCacheConfig as ValuesCacheConfig
 from static_frame.core.yarn import Yarn as Yarn
 
 __version__ = '0.9.16'
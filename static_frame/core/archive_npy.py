@@ -5,9 +5,11 @@ import shutil
 import struct
 import typing as tp
 from ast import literal_eval
+from hashlib import blake2b
 from io import BytesIO
 from io import UnsupportedOperation
 from types import TracebackType
+from weakref import WeakValueDictionary
 from zipfile import ZIP_STORED
 from zipfile import ZipFile
 
@@ -576,9 +578,103 @@ class Label:
     KEY_DEPTHS = '__depths__'
     KEY_TYPES_INDEX = '__types_index__'
     KEY_TYPES_COLUMNS = '__types_columns__'
+    KEY_BLOCKS_DICTIONARY = '__blocks_dictionary__'
     FILE_TEMPLATE_VALUES_INDEX = '__values_index_{}__.npy'
     FILE_TEMPLATE_VALUES_COLUMNS = '__values_columns_{}__.npy'
     FILE_TEMPLATE_BLOCKS = '__blocks_{}__.npy'
+    FILE_TEMPLATE_BLOCKS_DICTIONARY = '__blocks_dictionary_{}__.npy'
+
+
+DICTIONARY_ENCODE_KINDS = frozenset(('U', 'S', DTYPE_OBJECT_KIND))
+
+def array_dictionary_encode(
+        array: np.ndarray,
+        ) -> tp.Optional[tp.Tuple[np.ndarray, np.ndarray]]:
+    '''
+    Return integer codes and the unique strings they select if ``array`` is better stored that way: for string arrays, if fewer bytes are required; for object arrays, if all elements are strings (as object arrays cannot otherwise be stored). Otherwise, return None.
+    '''
+    kind = array.dtype.kind
+    if kind not in DICTIONARY_ENCODE_KINDS or array.size == 0:
+        return None
+
+    if kind == DTYPE_OBJECT_KIND:
+        count_max = array.size
+    else: # stop when the unique strings alone outweigh any savings from the smallest codes
+        count_max = (array.nbytes - array.size) // array.dtype.itemsize
+
+    # PERF: hashing is much faster than the sorting done by np.unique
+    positions: tp.Dict[tp.Any, int] = {}
+    codes = []
+    try:
+        for v in array.ravel().tolist():
+            pos = positions.get(v)
+            if pos is None:
+                pos = positions[v] = len(positions)
+                if pos >= count_max:
+                    return None
+            codes.append(pos)
+    except TypeError: # unhashable objects
+        return None
+
+    if kind == DTYPE_OBJECT_KIND:
+        if not all(u.__class__ is str for u in positions):
+            return None
+        uniques = np.array(list(positions), dtype=str)
+    else:
+        uniques = np.array(list(positions), dtype=array.dtype)
+
+    codes_array = np.array(codes, dtype=np.min_scalar_type(len(uniques) - 1))
+    if kind != DTYPE_OBJECT_KIND and codes_array.nbytes + uniques.nbytes >= array.nbytes:
+        return None
+    return codes_array.reshape(array.shape), uniques
+
+def array_dictionary_decode(
+        codes: np.ndarray,
+        uniques: np.ndarray,
+        dtype: np.dtype,
+        ) -> np.ndarray:
+    '''
+    Restore an array of ``dtype`` from the ``codes`` and ``uniques`` returned by :obj:`array_dictionary_encode`.
+    '''
+    array = uniques.astype(dtype)[codes]
+    array.flags.writeable = False
+    return array
+
+
+# NOTE: immutable indices decoded from archives are shared while any container holds them, such that archives of many Frames with the same index or columns (as in a Bus) produce a single instance; equality comparisons between them are then identity checks.
+INDEX_INTERN_CACHE: tp.MutableMapping[tp.Hashable, 'IndexBase'] = WeakValueDictionary()
+
+def name_intern_key(name: NameType) -> tp.Hashable:
+    '''
+    Return a key for ``name`` that includes the type of the name, and of any components of a tuple name, as names of different types can compare equal (i.e., ``1``, ``1.0``, and ``True``).
+    '''
+    if name.__class__ is tuple:
+        return (tuple, tuple(name_intern_key(n) for n in name)) # type: ignore
+    return (name.__class__, name)
+
+def index_intern_key(
+        arrays: tp.Sequence[np.ndarray],
+        cls_index: tp.Type['IndexBase'],
+        name: NameType,
+        index_types: tp.Optional[tp.Sequence[str]],
+        ) -> tp.Optional[tp.Hashable]:
+    '''
+    Return a key identifying an index by its class, name, and a digest of its label arrays; return None if ``name`` is not hashable.
+    '''
+    hasher = blake2b()
+    for array in arrays:
+        hasher.update(f'{array.dtype.str}{array.shape}'.encode())
+        hasher.update(np.ascontiguousarray(array).view(np.uint8).data)
+    key = (cls_index,
+            name_intern_key(name),
+            None if index_types is None else tuple(index_types),
+            hasher.digest(),
+            )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
 
 
 class ArchiveIndexConverter:
@@ -640,22 +736,33 @@ class ArchiveIndexConverter:
         from static_frame.core.type_blocks import TypeBlocks
 
         if key_template_values.format(0) not in archive:
-            index = None
-        elif depth == 1:
-            index = cls_index(archive.read_array(key_template_values.format(0)),
-                    name=name,
-                    )
+            return None
+
+        arrays = [archive.read_array(key_template_values.format(i))
+                for i in range(depth)]
+        index_types = None if depth == 1 else metadata[key_types]
+
+        # NOTE: memory-mapped labels cannot outlive their archive, and so cannot be shared
+        intern_key = None
+        if cls_index.STATIC and not archive._memory_map:
+            intern_key = index_intern_key(arrays, cls_index, name, index_types)
+            if intern_key is not None:
+                index = INDEX_INTERN_CACHE.get(intern_key)
+                if index is not None:
+                    return index
+
+        if depth == 1:
+            index = cls_index(arrays[0], name=name)
         else:
-            index_tb = TypeBlocks.from_blocks(
-                    archive.read_array(key_template_values.format(i))
-                    for i in range(depth)
-                    )
+            index_tb = TypeBlocks.from_blocks(arrays)
             index_constructors = [ContainerMap.str_to_cls(name)
-                    for name in metadata[key_types]]
+                    for name in index_types] # type: ignore
             index = cls_index._from_type_blocks(index_tb, # type: ignore
                     name=name,
                     index_constructors=index_constructors,
                     )
+        if intern_key is not None:
+            INDEX_INTERN_CACHE[intern_key] = index
         return index
 
 
@@ -669,6 +776,7 @@ class ArchiveFrameConverter:
             include_index: bool = True,
             include_columns: bool = True,
             consolidate_blocks: bool = False,
+            dictionary_encode: bool = False,
             ) -> None:
         metadata: tp.Dict[str, tp.Any] = {}
         metadata[Label.KEY_NAMES] = [frame._name,
@@ -710,9 +818,22 @@ class ArchiveFrameConverter:
                 include=include_columns,
                 )
         i = 0
+        # pairs of block position and original dtype str for dictionary-encoded blocks
+        blocks_dictionary: tp.List[tp.Tuple[int, str]] = []
         for i, array in enumerate(block_iter, 1):
+            if dictionary_encode:
+                encoded = array_dictionary_encode(array)
+                if encoded is not None:
+                    blocks_dictionary.append((i-1, array.dtype.str))
+                    array, uniques = encoded
+                    archive.write_array(
+                            Label.FILE_TEMPLATE_BLOCKS_DICTIONARY.format(i-1),
+                            uniques)
             archive.write_array(Label.FILE_TEMPLATE_BLOCKS.format(i-1), array)
 
+        if blocks_dictionary:
+            metadata[Label.KEY_BLOCKS_DICTIONARY] = blocks_dictionary
+
         metadata[Label.KEY_DEPTHS] = [
                 i, # block count
                 depth_index,
@@ -729,6 +850,7 @@ class ArchiveFrameConverter:
             include_index: bool = True,
             include_columns: bool = True,
             consolidate_blocks: bool = False,
+            dictionary_encode: bool = False,
             ) -> None:
         '''
         Write a :obj:`Frame` as an npz file.
@@ -744,6 +866,7 @@ class ArchiveFrameConverter:
                     include_index=include_index,
                     include_columns=include_columns,
                     consolidate_blocks=consolidate_blocks,
+                    dictionary_encode=dictionary_encode,
                     )
         except ErrorNPYEncode:
             archive.close()
@@ -804,10 +927,20 @@ class ArchiveFrameConverter:
                 )
 
         if block_count:
-            tb = TypeBlocks.from_blocks(
-                    archive.read_array(Label.FILE_TEMPLATE_BLOCKS.format(i))
-                    for i in range(block_count)
-                    )
+            blocks_dictionary = dict(metadata.get(Label.KEY_BLOCKS_DICTIONARY, ()))
+
+            def blocks() -> tp.Iterator[np.ndarray]:
+                for i in range(block_count):
+                    array = archive.read_array(Label.FILE_TEMPLATE_BLOCKS.format(i))
+                    if i in blocks_dictionary:
+                        array = array_dictionary_decode(
+                                array,
+                                archive.read_array(Label.FILE_TEMPLATE_BLOCKS_DICTIONARY.format(i)),
+                                np.dtype(blocks_dictionary[i]),
+                                )
+                    yield array
+
+            tb = TypeBlocks.from_blocks(blocks())
         else:
             tb = TypeBlocks.from_zero_size_shape()
 
@@ -1,6 +1,5 @@
 import typing as tp
-from concurrent.futures import ProcessPoolExecutor
-from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import numpy as np
 
@@ -24,6 +23,7 @@ from static_frame.core.node_selector import InterfaceSelectTrio
 from static_frame.core.node_str import InterfaceBatchString
 from static_frame.core.node_transpose import InterfaceBatchTranspose
 from static_frame.core.node_values import InterfaceBatchValues
+from static_frame.core.pool import pool_items
 from static_frame.core.series import Series
 from static_frame.core.store import Store
 from static_frame.core.store_client_mixin import StoreClientMixin
@@ -32,12 +32,15 @@ from static_frame.core.store_config import StoreConfigMapInitializer
 from static_frame.core.store_hdf5 import StoreHDF5
 from static_frame.core.store_sqlite import StoreSQLite
 from static_frame.core.store_xlsx import StoreXLSX
+from static_frame.core.store_zip import PayloadLabelToFrame
 from static_frame.core.store_zip import StoreZipCSV
 from static_frame.core.store_zip import StoreZipNPY
 from static_frame.core.store_zip import StoreZipNPZ
 from static_frame.core.store_zip import StoreZipParquet
 from static_frame.core.store_zip import StoreZipPickle
 from static_frame.core.store_zip import StoreZipTSV
+from static_frame.core.store_zip import _StoreZip
+from static_frame.core.store_zip import zip_file_cache_release
 from static_frame.core.style_config import StyleConfig
 from static_frame.core.util import DEFAULT_SORT_KIND
 from static_frame.core.util import DTYPE_OBJECT
@@ -63,12 +66,9 @@ from static_frame.core.util import UFunc
 
 FrameOrSeries = tp.Union[Frame, Series]
 IteratorFrameItems = tp.Iterator[tp.Tuple[tp.Hashable, FrameOrSeries]]
-GeneratorFrameItems = tp.Callable[..., IteratorFrameItems]
 
 
 #-------------------------------------------------------------------------------
-# family of executor functions normalized in signature (taking a single tuple of args) for usage in processor pool calls
-
 def normalize_container(post: tp.Any
         ) -> FrameOrSeries:
     # post might be an element, promote to a Series to permit concatenation
@@ -83,35 +83,99 @@ def normalize_container(post: tp.Any
         return Series.from_element(post, index=ELEMENT_TUPLE)
     return post
 
-def call_func(bundle: tp.Tuple[FrameOrSeries, AnyCallable]
+#-------------------------------------------------------------------------------
+# family of step functions normalized in signature (taking label, container, and step arguments) for usage in a pipeline
+
+def call_normalize(label: tp.Hashable,
+        container: FrameOrSeries,
+        ) -> FrameOrSeries:
+    return normalize_container(container)
+
+def call_func(label: tp.Hashable,
+        container: FrameOrSeries,
+        func: AnyCallable,
         ) -> FrameOrSeries:
-    container, func = bundle
     return func(container) # type: ignore
 
-def call_func_items(bundle: tp.Tuple[FrameOrSeries, AnyCallable, tp.Hashable]
+def call_func_items(label: tp.Hashable,
+        container: FrameOrSeries,
+        func: AnyCallable,
         ) -> FrameOrSeries:
-    container, func, label = bundle
     return func(label, container) # type: ignore
 
-def call_attr(bundle: tp.Tuple[FrameOrSeries, str, tp.Any, tp.Any]
+def call_attr(label: tp.Hashable,
+        container: FrameOrSeries,
+        attr: str,
+        args: tp.Tuple[tp.Any, ...],
+        kwargs: tp.Dict[str, tp.Any],
         ) -> FrameOrSeries:
-    container, attr, args, kwargs = bundle
     func = getattr(container, attr)
     return func(*args, **kwargs) # type: ignore
 
+
+class PipelineStep(tp.NamedTuple):
+    '''
+    A deferred operation to be applied to each contained :obj:`Frame`.
+    '''
+    caller: tp.Callable[..., FrameOrSeries]
+    args: tp.Tuple[tp.Any, ...]
+    exception: tp.Union[tp.Type[Exception], tp.Tuple[()]]
+
+Pipeline = tp.Tuple[PipelineStep, ...]
+
+
+def cost_payload_nbytes(bundle: tp.Tuple[tp.Hashable, PayloadLabelToFrame, Pipeline]
+        ) -> int:
+    '''
+    Estimate the cost of a pipeline bundle that reads from a Store by the size of the stored file.
+    '''
+    return bundle[1].nbytes
+
+
+def cost_bundle(cost: tp.Callable[[FrameOrSeries], float],
+        bundle: tp.Tuple[tp.Hashable, FrameOrSeries, Pipeline]
+        ) -> float:
+    '''
+    Estimate the cost of a pipeline bundle by applying ``cost`` to its container.
+    '''
+    return cost(bundle[1])
+
+
+class PipelineDropped:
+    '''
+    Sentinel class returned from ``call_pipeline`` when a step raises a silenced exception; a class (and not an instance) is used such that identity is retained after pickling.
+    '''
+
+def call_pipeline(bundle: tp.Tuple[tp.Hashable, FrameOrSeries, Pipeline]
+        ) -> tp.Any:
+    '''
+    Apply all steps of a pipeline to a container, taking a single tuple of args for usage in processor pool calls.
+    '''
+    label, container, pipeline = bundle
+    for step in pipeline:
+        try:
+            container = step.caller(label, container, *step.args)
+        except step.exception:
+            return PipelineDropped
+    return container
+
 #-------------------------------------------------------------------------------
 class Batch(ContainerOperand, StoreClientMixin):
     '''
-    A lazy, sequentially evaluated container of :obj:`Frame` that broadcasts operations on contained :obj:`Frame` by return new :obj:`Batch` instances. Full evaluation of operations only occurs when iterating or calling an exporter, such as ``to_frame()`` or ``to_series()``.
+    A lazy, sequentially evaluated container of :obj:`Frame` that broadcasts operations on contained :obj:`Frame` by return new :obj:`Batch` instances. Full evaluation of operations only occurs when iterating or calling an exporter, such as ``to_frame()`` or ``to_series()``. Operations are recorded as a pipeline and applied to each :obj:`Frame` in a single call, such that, when using ``max_workers``, each :obj:`Frame` is dispatched to a worker only once.
     '''
 
     __slots__ = (
             '_items',
+            '_pipeline',
+            '_store',
             '_name',
             '_config',
             '_max_workers',
             '_chunksize',
             '_use_threads',
+            '_cost',
+            '_ordered',
             )
 
     _config: StoreConfigMap
@@ -125,6 +189,8 @@ class Batch(ContainerOperand, StoreClientMixin):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            cost: tp.Optional[tp.Callable[[Frame], float]] = None,
+            ordered: bool = True,
             ) -> 'Batch':
         '''Return a :obj:`Batch` from an iterable of :obj:`Frame`; labels will be drawn from :obj:`Frame.name`.
         '''
@@ -134,6 +200,8 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                cost=cost,
+                ordered=ordered,
                 )
 
     #---------------------------------------------------------------------------
@@ -147,18 +215,26 @@ class Batch(ContainerOperand, StoreClientMixin):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            cost: tp.Optional[tp.Callable[[Frame], float]] = None,
+            ordered: bool = True,
             ) -> 'Batch':
         config_map = StoreConfigMap.from_initializer(config)
 
         items = ((label, store.read(label, config=config_map[label]))
                 for label in store.labels(config=config_map))
 
-        return cls(items,
+        batch = cls(items,
                 config=config,
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                cost=cost,
+                ordered=ordered,
                 )
+        if isinstance(store, _StoreZip):
+            # permit pool workers to read Frames themselves
+            batch._store = store
+        return batch
 
     @classmethod
     @doc_inject(selector='batch_constructor')
@@ -169,6 +245,8 @@ class Batch(ContainerOperand, StoreClientMixin):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            cost: tp.Optional[tp.Callable[[Frame], float]] = None,
+            ordered: bool = True,
             ) -> 'Batch':
         '''
         Given a file path to zipped TSV :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -181,6 +259,8 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                cost=cost,
+                ordered=ordered,
                 )
 
     @classmethod
@@ -192,6 +272,8 @@ class Batch(ContainerOperand, StoreClientMixin):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            cost: tp.Optional[tp.Callable[[Frame], float]] = None,
+            ordered: bool = True,
             ) -> 'Batch':
         '''
         Given a file path to zipped CSV :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -204,6 +286,8 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                cost=cost,
+                ordered=ordered,
                 )
 
     @classmethod
@@ -215,6 +299,8 @@ class Batch(ContainerOperand, StoreClientMixin):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            cost: tp.Optional[tp.Callable[[Frame], float]] = None,
+            ordered: bool = True,
             ) -> 'Batch':
         '''
         Given a file path to zipped pickle :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -227,6 +313,8 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                cost=cost,
+                ordered=ordered,
                 )
 
     @classmethod
@@ -238,6 +326,8 @@ class Batch(ContainerOperand, StoreClientMixin):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            cost: tp.Optional[tp.Callable[[Frame], float]] = None,
+            ordered: bool = True,
             ) -> 'Batch':
         '''
         Given a file path to zipped NPZ :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -250,6 +340,8 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                cost=cost,
+                ordered=ordered,
                 )
 
     @classmethod
@@ -261,6 +353,8 @@ class Batch(ContainerOperand, StoreClientMixin):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            cost: tp.Optional[tp.Callable[[Frame], float]] = None,
+            ordered: bool = True,
             ) -> 'Batch':
         '''
         Given a file path to zipped NPY :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -273,6 +367,8 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                cost=cost,
+                ordered=ordered,
                 )
 
     @classmethod
@@ -284,6 +380,8 @@ class Batch(ContainerOperand, StoreClientMixin):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            cost: tp.Optional[tp.Callable[[Frame], float]] = None,
+            ordered: bool = True,
             ) -> 'Batch':
         '''
         Given a file path to zipped parquet :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -296,6 +394,8 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                cost=cost,
+                ordered=ordered,
                 )
 
 
@@ -308,6 +408,8 @@ class Batch(ContainerOperand, StoreClientMixin):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            cost: tp.Optional[tp.Callable[[Frame], float]] = None,
+            ordered: bool = True,
             ) -> 'Batch':
         '''
         Given a file path to an XLSX :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -321,6 +423,8 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                cost=cost,
+                ordered=ordered,
                 )
 
 
@@ -333,6 +437,8 @@ class Batch(ContainerOperand, StoreClientMixin):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            cost: tp.Optional[tp.Callable[[Frame], float]] = None,
+            ordered: bool = True,
             ) -> 'Batch':
         '''
         Given a file path to an SQLite :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -345,6 +451,8 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                cost=cost,
+                ordered=ordered,
                 )
 
 
@@ -357,6 +465,8 @@ class Batch(ContainerOperand, StoreClientMixin):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            cost: tp.Optional[tp.Callable[[Frame], float]] = None,
+            ordered: bool = True,
             ) -> 'Batch':
         '''
         Given a file path to a HDF5 :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -369,6 +479,8 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                cost=cost,
+                ordered=ordered,
                 )
 
     #---------------------------------------------------------------------------
@@ -381,6 +493,8 @@ class Batch(ContainerOperand, StoreClientMixin):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            cost: tp.Optional[tp.Callable[[Frame], float]] = None,
+            ordered: bool = True,
             ):
         '''
         Default constructor of a :obj:`Batch`.
@@ -388,6 +502,8 @@ class Batch(ContainerOperand, StoreClientMixin):
         {args}
         '''
         self._items = items # might be a generator!
+        self._pipeline: Pipeline = ()
+        self._store: tp.Optional[_StoreZip] = None
         self._name = name
 
         self._config = StoreConfigMap.from_initializer(config)
@@ -395,31 +511,38 @@ class Batch(ContainerOperand, StoreClientMixin):
         self._max_workers = max_workers
         self._chunksize = chunksize
         self._use_threads = use_threads
+        self._cost = cost
+        self._ordered = ordered
 
     #---------------------------------------------------------------------------
     def _derive(self,
-            gen: GeneratorFrameItems,
-            name: NameType = None,
+            caller: tp.Callable[..., FrameOrSeries],
+            *args: tp.Any,
+            exception: tp.Union[tp.Type[Exception], tp.Tuple[()]] = (),
             ) -> 'Batch':
-        '''Utility for creating derived Batch
+        '''Utility for creating a derived Batch that shares the same items, extending the pipeline with a new step. No evaluation is done until iteration, at which point all steps are applied to each item in a single call.
         '''
-        return self.__class__(gen(),
-                name=name if name is not None else self._name,
+        batch = self.__class__(self._items,
+                name=self._name,
                 config=self._config,
                 max_workers=self._max_workers,
                 chunksize=self._chunksize,
                 use_threads=self._use_threads,
+                cost=self._cost,
+                ordered=self._ordered,
+                )
+        batch._pipeline = self._pipeline + (
+                PipelineStep(caller, args, exception), # pylint: disable=E1121
                 )
+        batch._store = self._store
+        return batch
 
     @property
     def via_container(self) -> 'Batch':
         '''
         Return a new Batch with all values wrapped in either a :obj:`Frame` or :obj:`Series`.
         '''
-        def gen() -> IteratorFrameItems:
-            for label, v in self._items:
-                yield label, normalize_container(v)
-        return self._derive(gen)
+        return self._derive(call_normalize)
 
     #---------------------------------------------------------------------------
     # name interface
@@ -438,7 +561,7 @@ class Batch(ContainerOperand, StoreClientMixin):
         Returns:
             :obj:`tp.Tuple[int]`
         '''
-        items = ((label, f.shape) for label, f in self._items)
+        items = ((label, f.shape) for label, f in self._iter_items())
         return Series.from_items(items, name='shape', dtype=DTYPE_OBJECT)
 
 
@@ -451,7 +574,7 @@ class Batch(ContainerOperand, StoreClientMixin):
         '''
         config = config or DisplayActive.get()
 
-        items = ((label, f.__class__) for label, f in self._items)
+        items = ((label, f.__class__) for label, f in self._iter_items())
         series = Series.from_items(items, name=self._name)
 
         display_cls = Display.from_values((),
@@ -474,7 +597,7 @@ class Batch(ContainerOperand, StoreClientMixin):
     #---------------------------------------------------------------------------
     # core function application routines
 
-    def _iter_items(self) -> IteratorFrameItems:
+    def _iter_source(self) -> IteratorFrameItems:
         '''Iter pairs in items, providing helpful exception of a pair is not found. Thies is necessary as we cannot validate the items until we actually do an iteration, and the iterable might be an iterator.
         '''
         for pair in self._items:
@@ -484,47 +607,54 @@ class Batch(ContainerOperand, StoreClientMixin):
                 raise BatchIterableInvalid() from None
             yield label, frame
 
-    def _apply_pool(self,
-            labels: tp.List[tp.Hashable],
-            arg_iter: tp.Iterator[tp.Tuple[tp.Any, ...]],
-            caller: tp.Callable[..., FrameOrSeries],
-            ) -> 'Batch':
-
-        pool_executor = ThreadPoolExecutor if self._use_threads else ProcessPoolExecutor
-
-        def gen_pool() -> IteratorFrameItems:
-            with pool_executor(max_workers=self._max_workers) as executor:
-                yield from zip(labels,
-                        executor.map(caller, arg_iter, chunksize=self._chunksize)
-                        )
-        return self._derive(gen_pool)
-
-    def _apply_pool_except(self,
-            labels: tp.List[tp.Hashable],
-            arg_iter: tp.Iterator[tp.Tuple[tp.Any, ...]],
-            caller: tp.Callable[..., FrameOrSeries],
-            exception: tp.Type[Exception],
-            ) -> 'Batch':
-
-        if self._chunksize != 1:
-            raise NotImplementedError('Cannot use apply_except idioms with chunksize other than 1')
-
-        pool_executor = ThreadPoolExecutor if self._use_threads else ProcessPoolExecutor
-
-        def gen_pool() -> IteratorFrameItems:
-            futures = []
-            with pool_executor(max_workers=self._max_workers) as executor:
-                for args in arg_iter:
-                    futures.append(executor.submit(caller, args))
-
-                for label, future in zip(labels, futures):
-                    try:
-                        container = future.result()
-                    except exception:
-                        continue
-                    yield label, container
+    def _iter_items(self) -> IteratorFrameItems:
+        '''Iter pairs of label and the result of applying the pipeline to each item. If ``max_workers`` is set, all steps are fused into a single call per item in a pool worker.
+        '''
+        pipeline = self._pipeline
+        if not pipeline:
+            yield from self._iter_source()
+            return
 
-        return self._derive(gen_pool)
+        if self._max_workers is None:
+            for label, frame in self._iter_source():
+                post = call_pipeline((label, frame, pipeline))
+                if post is not PipelineDropped:
+                    yield label, post
+            return
+
+        items: tp.Iterator[tp.Tuple[tp.Hashable, tp.Tuple[tp.Hashable, tp.Any, Pipeline]]]
+        if self._store is not None:
+            # only the store path, label, and config are sent to the worker, which reads the Frame as the first step of the pipeline
+            store = self._store
+            pipeline = (PipelineStep(call_func, (store._payload_to_frame,), ()), # pylint: disable=E1121
+                    ) + pipeline
+            payloads = store._read_many_payloads(
+                    store.labels(config=self._config),
+                    config=self._config,
+                    )
+            items = ((p.name, (p.name, p, pipeline)) for p in payloads)
+            # as Frames are not yet read, cost is estimated by the size of the stored file
+            cost = None if self._cost is None else cost_payload_nbytes
+        else:
+            items = ((label, (label, frame, pipeline))
+                    for label, frame in self._iter_source())
+            cost = None if self._cost is None else partial(cost_bundle, self._cost)
+
+        try:
+            for label, post in pool_items(call_pipeline,
+                    items,
+                    max_workers=self._max_workers,
+                    chunksize=self._chunksize,
+                    use_threads=self._use_threads,
+                    cost=cost,
+                    ordered=self._ordered,
+                    ):
+                if post is not PipelineDropped:
+                    yield label, post
+        finally:
+            if self._store is not None:
+                # if using threads, the zip file was opened in this process
+                zip_file_cache_release()
 
     def _apply_attr(self,
             *args: tp.Any,
@@ -534,37 +664,13 @@ class Batch(ContainerOperand, StoreClientMixin):
         '''
         Apply a method on a Frame given as an attr string.
         '''
-        if self._max_workers is None:
-            def gen() -> IteratorFrameItems:
-                for label, frame in self._iter_items():
-                    yield label, call_attr((frame, attr, args, kwargs))
-            return self._derive(gen)
-
-        labels = []
-        def arg_gen() -> tp.Iterator[tp.Tuple[FrameOrSeries, str, tp.Any, tp.Any]]:
-            for label, frame in self._iter_items():
-                labels.append(label)
-                yield frame, attr, args, kwargs
-
-        return self._apply_pool(labels, arg_gen(), call_attr)
+        return self._derive(call_attr, attr, args, kwargs)
 
     def apply(self, func: AnyCallable) -> 'Batch':
         '''
         Apply a function to each :obj:`Frame` contained in this :obj:`Frame`, where a function is given the :obj:`Frame` as an argument.
         '''
-        if self._max_workers is None:
-            def gen() -> IteratorFrameItems:
-                for label, frame in self._iter_items():
-                    yield label, call_func((frame, func))
-            return self._derive(gen)
-
-        labels = []
-        def arg_gen() -> tp.Iterator[tp.Tuple[FrameOrSeries, AnyCallable]]:
-            for label, frame in self._iter_items():
-                labels.append(label)
-                yield frame, func
-
-        return self._apply_pool(labels, arg_gen(), call_func)
+        return self._derive(call_func, func)
 
     def apply_except(self,
             func: AnyCallable,
@@ -573,44 +679,15 @@ class Batch(ContainerOperand, StoreClientMixin):
         '''
         Apply a function to each :obj:`Frame` contained in this :obj:`Frame`, where a function is given the :obj:`Frame` as an argument. Exceptions raised that matching the `except` argument will be silenced.
         '''
-        if self._max_workers is None:
-            def gen() -> IteratorFrameItems:
-                for label, frame in self._iter_items():
-                    try:
-                        yield label, call_func((frame, func))
-                    except exception:
-                        pass
-            return self._derive(gen)
-
-        labels = []
-        def arg_gen() -> tp.Iterator[tp.Tuple[FrameOrSeries, AnyCallable]]:
-            for label, frame in self._iter_items():
-                labels.append(label)
-                yield frame, func
-
-        return self._apply_pool_except(labels,
-                arg_gen(),
-                call_func,
-                exception,
-                )
+        if self._max_workers is not None and self._chunksize != 1:
+            raise NotImplementedError('Cannot use apply_except idioms with chunksize other than 1')
+        return self._derive(call_func, func, exception=exception)
 
     def apply_items(self, func: AnyCallable) -> 'Batch':
         '''
         Apply a function to each :obj:`Frame` contained in this :obj:`Frame`, where a function is given the pair of label, :obj:`Frame` as an argument.
         '''
-        if self._max_workers is None:
-            def gen() -> IteratorFrameItems:
-                for label, frame in self._iter_items():
-                    yield label, call_func_items((frame, func, label))
-            return self._derive(gen)
-
-        labels = []
-        def arg_gen() -> tp.Iterator[tp.Tuple[FrameOrSeries, AnyCallable, tp.Hashable]]:
-            for label, frame in self._iter_items():
-                labels.append(label)
-                yield frame, func, label
-
-        return self._apply_pool(labels, arg_gen(), call_func_items)
+        return self._derive(call_func_items, func)
 
     def apply_items_except(self,
             func: AnyCallable,
@@ -619,26 +696,9 @@ class Batch(ContainerOperand, StoreClientMixin):
         '''
         Apply a function to each :obj:`Frame` contained in this :obj:`Frame`, where a function is given the pair of label, :obj:`Frame` as an argument. Exceptions raised that matching the `except` argument will be silenced.
         '''
-        if self._max_workers is None:
-            def gen() -> IteratorFrameItems:
-                for label, frame in self._iter_items():
-                    try:
-                        yield label, call_func_items((frame, func, label))
-                    except exception:
-                        pass
-            return self._derive(gen)
-
-        labels = []
-        def arg_gen() -> tp.Iterator[tp.Tuple[FrameOrSeries, AnyCallable, tp.Hashable]]:
-            for label, frame in self._iter_items():
-                labels.append(label)
-                yield frame, func, label
-
-        return self._apply_pool_except(labels,
-                arg_gen(),
-                call_func_items,
-                exception,
-                )
+        if self._max_workers is not None and self._chunksize != 1:
+            raise NotImplementedError('Cannot use apply_except idioms with chunksize other than 1')
+        return self._derive(call_func_items, func, exception=exception)
 
     #---------------------------------------------------------------------------
     # extraction
@@ -1696,7 +1756,7 @@ class Batch(ContainerOperand, StoreClientMixin):
         '''
         Consolidate stored values into a new :obj:`Series` using the stored labels as the index.
         '''
-        return Series.from_items(self._items,
+        return Series.from_items(self._iter_items(),
                 dtype=dtype,
                 name=name,
                 index_constructor=index_constructor,
@@ -1717,7 +1777,7 @@ class Batch(ContainerOperand, StoreClientMixin):
         labels = []
         containers: tp.List[FrameOrSeries] = []
         ndim1d = True
-        for label, container in self._items:
+        for label, container in self._iter_items():
             container = normalize_container(container)
             labels.append(label)
             ndim1d &= container.ndim == 1
@@ -0,0 +1,323 @@
+import typing as tp
+
+import numpy as np
+
+from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import DTYPE_OBJECT
+from static_frame.core.util import KEY_ITERABLE_TYPES
+from static_frame.core.util import GetItemKeyTypeCompound
+from static_frame.core.util import slice_to_ascending_slice
+
+_BIT = tp.Tuple[int, int]
+
+# the maximum number of blocks for which BlockIndex.from_widths() creates a list of pairs rather than arrays
+FROM_WIDTHS_ITER_MAX = 8
+# the maximum number of selected columns for which runs are found by iterating pairs rather than with array operations
+RUNS_ITER_MAX = 32
+
+
+def _run_to_slice(first: int, last: int) -> slice:
+    if last >= first: # ascending, or a single column
+        return slice(first, last + 1)
+    if last == 0:
+        return slice(first, None, -1)
+    return slice(first, last - 1, -1)
+
+
+def pairs_to_block_slices(
+        pairs: tp.Iterable[_BIT],
+        ) -> tp.Iterator[tp.Tuple[int, slice]]:
+    '''Given an iterable of pairs of block index and intra-block column, yield pairs of (block_idx, slice), as done by :obj:`runs_to_block_slices`.
+    '''
+    block = -1
+    first = last = step = 0
+    for b, c in pairs:
+        if b == block:
+            diff = c - last
+            if (diff == step) if step else (diff == 1 or diff == -1):
+                step = diff
+                last = c
+                continue
+        if block >= 0:
+            yield block, _run_to_slice(first, last)
+        block = b
+        first = last = c
+        step = 0
+    if block >= 0:
+        yield block, _run_to_slice(first, last)
+
+
+def runs_to_block_slices(
+        block: np.ndarray,
+        column: np.ndarray,
+        ) -> tp.Iterator[tp.Tuple[int, slice]]:
+    '''Given parallel arrays of block index and intra-block column, yield pairs of (block_idx, slice), where each slice covers a maximal run of consecutive columns (ascending or descending) within the same block.
+    '''
+    count = len(block)
+    if count <= RUNS_ITER_MAX:
+        yield from pairs_to_block_slices(zip(block.tolist(), column.tolist()))
+        return
+
+    step = column[1:] - column[:-1]
+    # a run ends where the block changes or the step is not unit
+    brk = (block[1:] != block[:-1]) | ((step != 1) & (step != -1))
+    if (~brk[:-1] & ~brk[1:] & (step[1:] != step[:-1])).any():
+        # where the direction changes between unit steps, where runs end depends on where prior runs end; this is rare enough to defer to iteration
+        yield from pairs_to_block_slices(zip(block.tolist(), column.tolist()))
+        return
+
+    starts = np.empty(brk.sum() + 1, dtype=DTYPE_INT_DEFAULT)
+    starts[0] = 0
+    starts[1:] = np.flatnonzero(brk) + 1
+    ends = np.empty(len(starts), dtype=DTYPE_INT_DEFAULT)
+    ends[:-1] = starts[1:] - 1
+    ends[-1] = count - 1
+
+    for b, first, last in zip(
+            block[starts].tolist(),
+            column[starts].tolist(),
+            column[ends].tolist(),
+            ):
+        yield b, _run_to_slice(first, last)
+
+
+class BlockIndex:
+    '''
+    A mapping of external column position to (block index, intra-block column), with a table of dtypes per block. The mapping is stored as two integer arrays, with capacity that grows geometrically to support efficient appending of blocks, and as a list of pairs, which supports fast scalar lookups; each representation is created lazily from the other as needed, and both are maintained once created.
+    '''
+
+    __slots__ = (
+            '_block',
+            '_column',
+            '_pairs',
+            '_count',
+            '_dtypes',
+            )
+
+    _block: tp.Optional[np.ndarray]
+    _column: tp.Optional[np.ndarray]
+    _pairs: tp.Optional[tp.List[_BIT]]
+    _count: int
+    _dtypes: tp.List[np.dtype]
+
+    @classmethod
+    def from_pairs(cls,
+            pairs: tp.List[_BIT],
+            dtypes: tp.List[np.dtype],
+            ) -> 'BlockIndex':
+        '''
+        Create from a list of pairs of block index, intra-block column and a list of per-block dtypes. Both lists are owned by the new instance.
+        '''
+        # PERF: avoid __init__ as this is called for each new TypeBlocks
+        obj = cls.__new__(cls)
+        obj._block = None
+        obj._column = None
+        obj._pairs = pairs
+        obj._count = len(pairs)
+        obj._dtypes = dtypes
+        return obj
+
+    @classmethod
+    def from_widths(cls,
+            widths: tp.Sequence[int],
+            dtypes: tp.List[np.dtype],
+            ) -> 'BlockIndex':
+        '''
+        Create from a sequence of block widths (column counts) and a list of per-block dtypes.
+        '''
+        if len(widths) <= FROM_WIDTHS_ITER_MAX:
+            # PERF: for few blocks, a list of pairs is faster to create than arrays
+            return cls.from_pairs(
+                    [(i, j) for i, width in enumerate(widths) for j in range(width)],
+                    dtypes,
+                    )
+
+        widths_array = np.array(widths, dtype=DTYPE_INT_DEFAULT)
+        count = int(widths_array.sum())
+        block = np.repeat(np.arange(len(widths_array), dtype=DTYPE_INT_DEFAULT), widths_array)
+        starts = np.cumsum(widths_array) - widths_array
+        column = np.arange(count, dtype=DTYPE_INT_DEFAULT) - np.repeat(starts, widths_array)
+        return cls(block, column, count, dtypes)
+
+    def __init__(self,
+            block: tp.Optional[np.ndarray] = None,
+            column: tp.Optional[np.ndarray] = None,
+            count: int = 0,
+            dtypes: tp.Optional[tp.List[np.dtype]] = None,
+            pairs: tp.Optional[tp.List[_BIT]] = None,
+            ) -> None:
+        '''
+        Args:
+            block: an array of block indices, of length equal to or greater than ``count``.
+            column: an array of intra-block columns, of length equal to or greater than ``count``.
+            count: the number of columns.
+            dtypes: list of dtypes per block. The list is owned by this instance.
+            pairs: a list of pairs of block index, intra-block column, of length ``count``. The list is owned by this instance. If not provided, and ``block`` and ``column`` are not provided, an empty list is used.
+        '''
+        if block is None and pairs is None:
+            pairs = []
+        self._block = block
+        self._column = column
+        self._pairs = pairs
+        self._count = count
+        self._dtypes = dtypes if dtypes is not None else []
+
+    def _update_arrays(self) -> None:
+        '''Create arrays from pairs.
+        '''
+        array = np.array(self._pairs, dtype=DTYPE_INT_DEFAULT).reshape(-1, 2)
+        self._block = array[:, 0].copy()
+        self._column = array[:, 1].copy()
+
+    def register(self, block: np.ndarray) -> bool:
+        '''Add all columns of ``block`` as a new block. Returns False if the block has no columns and was not registered.
+        '''
+        width = 1 if block.ndim == 1 else block.shape[1]
+        if width == 0:
+            return False
+
+        block_idx = len(self._dtypes)
+        count = self._count + width
+
+        if self._block is not None:
+            if count > len(self._block):
+                capacity = max(count, len(self._block) * 2, 8)
+                for attr in ('_block', '_column'):
+                    grown = np.empty(capacity, dtype=DTYPE_INT_DEFAULT)
+                    grown[:self._count] = getattr(self, attr)[:self._count]
+                    setattr(self, attr, grown)
+            self._block[self._count: count] = block_idx
+            self._column[self._count: count] = np.arange(width) # type: ignore
+        if self._pairs is not None:
+            self._pairs.extend((block_idx, i) for i in range(width))
+
+        self._count = count
+        self._dtypes.append(block.dtype)
+        return True
+
+    def copy(self) -> 'BlockIndex':
+        if self._block is None:
+            return self.__class__(
+                    count=self._count,
+                    dtypes=self._dtypes.copy(),
+                    pairs=self._pairs.copy(), # type: ignore
+                    )
+        return self.__class__(
+                self._block[:self._count].copy(),
+                self._column[:self._count].copy(), # type: ignore
+                self._count,
+                self._dtypes.copy(),
+                None if self._pairs is None else self._pairs.copy(),
+                )
+
+    def __copy__(self) -> 'BlockIndex':
+        return self.copy()
+
+    def __deepcopy__(self, memo: tp.Dict[int, tp.Any]) -> 'BlockIndex':
+        obj = self.copy()
+        memo[id(self)] = obj
+        return obj
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, key: int) -> _BIT:
+        '''Return the pair of block index, intra-block column for an integer column position.
+        '''
+        if self._pairs is None:
+            return self.pairs[key]
+        return self._pairs[key]
+
+    def __iter__(self) -> tp.Iterator[_BIT]:
+        return iter(self.pairs)
+
+    def __reversed__(self) -> tp.Iterator[_BIT]:
+        return reversed(self.pairs)
+
+    #---------------------------------------------------------------------------
+    @property
+    def pairs(self) -> tp.List[_BIT]:
+        '''A list of pairs of block index, intra-block column per column.
+        '''
+        if self._pairs is None:
+            self._pairs = list(zip(self.block.tolist(), self.column.tolist()))
+        return self._pairs
+
+    @property
+    def block(self) -> np.ndarray:
+        '''An array of block indices per column.
+        '''
+        if self._block is None:
+            self._update_arrays()
+        return self._block[:self._count] # type: ignore
+
+    @property
+    def column(self) -> np.ndarray:
+        '''An array of intra-block columns per column.
+        '''
+        if self._column is None:
+            self._update_arrays()
+        return self._column[:self._count] # type: ignore
+
+    @property
+    def dtypes(self) -> np.ndarray:
+        '''An object array of dtypes per column.
+        '''
+        table = np.empty(len(self._dtypes), dtype=DTYPE_OBJECT)
+        table[:] = self._dtypes
+        return table[self.block]
+
+    def dtypes_equal(self, other: 'BlockIndex') -> bool:
+        '''Return True if the dtypes per column are equal, independent of the blocks that contain them.
+        '''
+        if self._count != other._count:
+            return False
+        if self._dtypes == other._dtypes:
+            if self._block is None or other._block is None:
+                if self.pairs == other.pairs:
+                    return True
+            elif (self.block == other.block).all():
+                return True
+        return bool((self.dtypes == other.dtypes).all())
+
+    #---------------------------------------------------------------------------
+    def iter_block_slices(self,
+            key: GetItemKeyTypeCompound,
+            retain_key_order: bool = True,
+            ) -> tp.Iterator[tp.Tuple[int, slice]]:
+        '''
+        For a column key (a slice, iterable of integers, Boolean array), yield pairs of (block_idx, slice) covering contiguous regions of the selection.
+
+        Args:
+            retain_key_order: if False, returned slices will be in ascending order.
+        '''
+        if isinstance(key, slice):
+            if not retain_key_order:
+                key = slice_to_ascending_slice(key, self._count)
+            if self._block is None:
+                yield from pairs_to_block_slices(self._pairs[key]) # type: ignore
+            else:
+                yield from runs_to_block_slices(self.block[key], self.column[key])
+            return
+
+        if key.__class__ is np.ndarray and key.dtype == DTYPE_BOOL: #type: ignore
+            positions = np.flatnonzero(key)
+        elif isinstance(key, KEY_ITERABLE_TYPES):
+            # NOTE: we assume key is a list of integers: if key is a list of Booleans, we will not get the same elementwise selection as if we selected from an array
+            if self._block is None and key.__class__ is list:
+                positions_list = sorted(key) if not retain_key_order else key
+                pairs = self._pairs
+                yield from pairs_to_block_slices(pairs[i] for i in positions_list) # type: ignore
+                return
+            positions = np.array(key, dtype=DTYPE_INT_DEFAULT)
+            if not retain_key_order:
+                positions.sort()
+        else:
+            raise NotImplementedError('Cannot handle key', key)
+
+        if self._block is None:
+            pairs = self._pairs
+            yield from pairs_to_block_slices(pairs[i] for i in positions.tolist()) # type: ignore
+        else:
+            yield from runs_to_block_slices(self.block[positions], self.column[positions])
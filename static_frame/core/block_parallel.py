@@ -0,0 +1,206 @@
+'''
+Tools for applying functions to the blocks of :obj:`TypeBlocks` in a shared thread pool. As NumPy releases the GIL for most operations on numeric arrays, independent blocks, or chunks of a large block, can be processed concurrently.
+'''
+
+import os
+import sys
+import threading
+import typing as tp
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from static_frame.core.util import NULL_SLICE
+from static_frame.core.util import WarningsSilent
+from static_frame.core.util import blocks_to_array_2d
+
+_module = sys.modules[__name__]
+
+# kinds for which NumPy releases the GIL
+DTYPE_PARALLEL_KINDS = frozenset(('b', 'i', 'u', 'f', 'c', 'm', 'M'))
+
+# the approximate bytes of the row-wise tiles formed from many blocks when reducing rows serially; sized to remain in the L2 cache
+TILE_NBYTES = 1 << 20
+
+ChunkFunc = tp.Callable[[slice], tp.Any]
+
+
+class BlockParallelConfig(tp.NamedTuple):
+    '''
+    Define when operations on :obj:`TypeBlocks` are executed in a shared thread pool. Execution in the thread pool is disabled by default.
+
+    Args:
+        active: if False, operations are never executed in the thread pool.
+        nbytes_min: the minimum total bytes of the operands before the thread pool is used.
+        chunk_nbytes: the approximate bytes of the row-wise chunks a large block is divided into.
+        max_workers: the number of threads; if None, the CPU count is used.
+    '''
+    active: bool = False
+    nbytes_min: int = 1 << 26
+    chunk_nbytes: int = 1 << 24
+    max_workers: tp.Optional[int] = None
+
+
+class BlockParallelActive:
+    '''Utility interface for setting and storing the default block-parallel configuration.
+    '''
+
+    @staticmethod
+    def set(config: BlockParallelConfig) -> None:
+        _module._block_parallel_active = config # type: ignore
+
+    @staticmethod
+    def get(**kwargs: tp.Any) -> BlockParallelConfig:
+        config: BlockParallelConfig = _module._block_parallel_active # type: ignore
+        if not kwargs:
+            return config
+        return config._replace(**kwargs)
+
+    @classmethod
+    def update(cls, **kwargs: tp.Any) -> None:
+        cls.set(cls.get(**kwargs))
+
+
+#-------------------------------------------------------------------------------
+
+_EXECUTORS: tp.Dict[int, ThreadPoolExecutor] = {}
+_EXECUTORS_LOCK = threading.Lock()
+
+def get_executor(max_workers: tp.Optional[int]) -> ThreadPoolExecutor:
+    '''Return the shared thread pool for ``max_workers``, creating it if necessary. Pools are never shut down, such that concurrent callers with different configurations can always submit.
+    '''
+    max_workers = max_workers or os.cpu_count() or 1
+    with _EXECUTORS_LOCK:
+        executor = _EXECUTORS.get(max_workers)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            _EXECUTORS[max_workers] = executor
+    return executor
+
+
+def parallel_config(
+        arrays: tp.Iterable[np.ndarray],
+        nbytes: int,
+        ) -> tp.Optional[BlockParallelConfig]:
+    '''Return the active :obj:`BlockParallelConfig` if ``arrays``, with total bytes ``nbytes``, should be processed in the thread pool; otherwise, return None.
+    '''
+    config = BlockParallelActive.get()
+    if not config.active or nbytes < config.nbytes_min:
+        return None
+    if (config.max_workers or os.cpu_count() or 1) < 2:
+        return None
+    for a in arrays:
+        if a.dtype.kind not in DTYPE_PARALLEL_KINDS:
+            return None
+    return config
+
+
+def chunk_slices(
+        length: int,
+        nbytes: int,
+        chunk_nbytes: int,
+        ) -> tp.List[slice]:
+    '''Return slices that partition ``length`` rows, totalling ``nbytes``, into chunks of approximately ``chunk_nbytes``.
+    '''
+    step = max(1, (length * chunk_nbytes) // nbytes) if nbytes else length
+    if step >= length:
+        return [NULL_SLICE]
+    return [slice(start, start + step) for start in range(0, length, step)]
+
+
+def chunk_rows(
+        func: tp.Callable[[np.ndarray], np.ndarray],
+        array: np.ndarray,
+        key: slice,
+        ) -> np.ndarray:
+    '''Apply an element-wise ``func`` to the rows of ``array`` selected by ``key``.
+    '''
+    return func(array[key])
+
+
+def chunk_reduce_rows(
+        func: tp.Callable[..., np.ndarray],
+        array: np.ndarray,
+        key: slice,
+        ) -> np.ndarray:
+    '''Reduce the rows of 2D ``array`` selected by ``key`` along axis 1. As each row is reduced independently, the result is identical to that of reducing all rows at once.
+    '''
+    return func(array=array[key], axis=1)
+
+
+def chunk_reduce_blocks(
+        func: tp.Callable[..., np.ndarray],
+        blocks: tp.Sequence[np.ndarray],
+        dtype: np.dtype,
+        key: slice,
+        ) -> np.ndarray:
+    '''Reduce along axis 1 the rows selected by ``key`` of the 2D array, of ``dtype``, formed by ``blocks``. Only the selected rows are consolidated; as each row is reduced independently, the result is identical to that of reducing the complete array.
+    '''
+    return func(array=blocks_to_array_2d([b[key] for b in blocks], dtype=dtype), axis=1)
+
+
+def _assign(func: ChunkFunc, out: np.ndarray, key: slice) -> None:
+    out[key] = func(key)
+
+
+def apply_calls(
+        calls: tp.Iterable[tp.Callable[[], tp.Any]],
+        config: BlockParallelConfig,
+        ) -> None:
+    '''Call each of ``calls`` in the thread pool, waiting for all to complete. Calls are expected to write their results into disjoint regions of pre-allocated arrays.
+    '''
+    executor = get_executor(config.max_workers)
+    # NOTE: warnings filters are global; silencing here, in the calling thread, prevents concurrent silencing in workers from restoring an incorrect state
+    with WarningsSilent():
+        futures = [executor.submit(call) for call in calls]
+        for future in futures:
+            future.result()
+
+
+def apply_chunked(
+        funcs: tp.Sequence[ChunkFunc],
+        lengths: tp.Sequence[int],
+        nbytes: tp.Sequence[int],
+        config: BlockParallelConfig,
+        ) -> tp.List[tp.Any]:
+    '''
+    For each function in ``funcs``, return the result of calling it with ``NULL_SLICE``. Functions are called in the thread pool. If the bytes processed by a function exceed ``config.chunk_nbytes``, it is instead called with slices that partition its length, and each result is assigned into the corresponding slice of a new immutable array, allocated from the dtype and shape of the first result. Chunked functions must return arrays whose first axis corresponds to the slice.
+
+    Args:
+        funcs: callables that take a slice.
+        lengths: the length of the sliceable axis per function.
+        nbytes: the bytes processed per function.
+    '''
+    executor = get_executor(config.max_workers)
+    results: tp.List[tp.Any] = [None] * len(funcs)
+    futures: tp.List[tp.Tuple[int, bool, Future]] = []
+
+    # NOTE: see apply_calls regarding warnings filters
+    with WarningsSilent():
+        for i, (func, length, nb) in enumerate(zip(funcs, lengths, nbytes)):
+            keys = chunk_slices(length, nb, config.chunk_nbytes)
+            if len(keys) == 1:
+                futures.append((i, False, executor.submit(func, NULL_SLICE)))
+                continue
+            first = func(keys[0])
+            out = np.empty((length,) + first.shape[1:], dtype=first.dtype)
+            out[keys[0]] = first
+            results[i] = out
+            for key in keys[1:]:
+                futures.append((i, True, executor.submit(_assign, func, out, key)))
+
+        for i, assigned, future in futures:
+            result = future.result()
+            if not assigned:
+                results[i] = result
+
+    for r in results:
+        if r.__class__ is np.ndarray:
+            r.flags.writeable = False
+    return results
+
+
+#-------------------------------------------------------------------------------
+
+_module._block_parallel_active = BlockParallelConfig() # type: ignore
@@ -0,0 +1,76 @@
+import sys
+import typing as tp
+
+_module = sys.modules[__name__]
+
+
+class ConsolidateConfig(tp.NamedTuple):
+    '''
+    Define when adjacent blocks of the same dtype are lazily consolidated into a single block, as done on the first row-wise access of a :obj:`Frame`. As consolidated blocks are retained alongside the original blocks, consolidation is by default limited to data of 64 MiB or less.
+
+    Args:
+        active: if False, lazy consolidation is never performed.
+        block_count_min: the minimum number of blocks before consolidation is considered.
+        fragmentation_min: the minimum fragmentation (the share of blocks that can be removed by consolidation, between 0 and 1) before consolidation is performed.
+        nbytes_max: the maximum bytes of data that are consolidated (and thus retained a second time); if None, data of any size is consolidated.
+    '''
+    active: bool = True
+    block_count_min: int = 32
+    fragmentation_min: float = 0.5
+    nbytes_max: tp.Optional[int] = 1 << 26
+
+
+class Fragmentation(tp.NamedTuple):
+    '''
+    Report of block fragmentation.
+
+    Args:
+        block_count: the number of blocks.
+        block_count_consolidated: the number of blocks after consolidating adjacent blocks of the same dtype.
+        column_count: the number of columns.
+    '''
+    block_count: int
+    block_count_consolidated: int
+    column_count: int
+
+    @property
+    def fragmentation(self) -> float:
+        '''The share of blocks, between 0 and 1, that can be removed by consolidation.
+        '''
+        if not self.block_count:
+            return 0.0
+        return 1 - self.block_count_consolidated / self.block_count
+
+    def exceeds(self, config: ConsolidateConfig) -> bool:
+        '''Return True if the fragmentation requires consolidation under ``config``.
+        '''
+        return (config.active
+                and self.block_count >= config.block_count_min
+                and self.block_count > self.block_count_consolidated
+                and self.fragmentation >= config.fragmentation_min
+                )
+
+
+class ConsolidateActive:
+    '''Utility interface for setting and storing the default consolidation configuration.
+    '''
+
+    @staticmethod
+    def set(config: ConsolidateConfig) -> None:
+        _module._consolidate_active = config # type: ignore
+
+    @staticmethod
+    def get(**kwargs: tp.Union[bool, int, float, None]) -> ConsolidateConfig:
+        config: ConsolidateConfig = _module._consolidate_active # type: ignore
+        if not kwargs:
+            return config
+        return config._replace(**kwargs)
+
+    @classmethod
+    def update(cls, **kwargs: tp.Union[bool, int, float, None]) -> None:
+        cls.set(cls.get(**kwargs))
+
+
+#-------------------------------------------------------------------------------
+
+_module._consolidate_active = ConsolidateConfig() # type: ignore
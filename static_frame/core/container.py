@@ -22,8 +22,18 @@ from static_frame.core.util import UFUNC_TO_REVERSE_OPERATOR
 from static_frame.core.util import UFunc
 from static_frame.core.util import ufunc_all
 from static_frame.core.util import ufunc_any
+from static_frame.core.util import ufunc_cumcount
+from static_frame.core.util import ufunc_cummax
+from static_frame.core.util import ufunc_cummean
+from static_frame.core.util import ufunc_cummin
+from static_frame.core.util import ufunc_cumstd
 from static_frame.core.util import ufunc_nanall
 from static_frame.core.util import ufunc_nanany
+from static_frame.core.util import ufunc_nancumcount
+from static_frame.core.util import ufunc_nancummax
+from static_frame.core.util import ufunc_nancummean
+from static_frame.core.util import ufunc_nancummin
+from static_frame.core.util import ufunc_nancumstd
 
 if tp.TYPE_CHECKING:
     from static_frame.core.frame import Frame  # pylint: disable=W0611 #pragma: no cover
@@ -594,6 +604,102 @@ class ContainerOperand(ContainerBase):
                 size_one_unity=True
                 )
 
+    @doc_inject(selector='ufunc_skipna')
+    def cummax(self,
+            axis: int = 0,
+            skipna: bool = True,
+            ) -> tp.Any:
+        '''Return the cumulative maximum over the specified axis.
+
+        {args}
+        '''
+        return self._ufunc_shape_skipna(
+                axis=axis,
+                skipna=skipna,
+                ufunc=ufunc_cummax,
+                ufunc_skipna=ufunc_nancummax,
+                composable=False,
+                dtypes=(),
+                size_one_unity=True
+                )
+
+    @doc_inject(selector='ufunc_skipna')
+    def cummin(self,
+            axis: int = 0,
+            skipna: bool = True,
+            ) -> tp.Any:
+        '''Return the cumulative minimum over the specified axis.
+
+        {args}
+        '''
+        return self._ufunc_shape_skipna(
+                axis=axis,
+                skipna=skipna,
+                ufunc=ufunc_cummin,
+                ufunc_skipna=ufunc_nancummin,
+                composable=False,
+                dtypes=(),
+                size_one_unity=True
+                )
+
+    @doc_inject(selector='ufunc_skipna')
+    def cummean(self,
+            axis: int = 0,
+            skipna: bool = True,
+            ) -> tp.Any:
+        '''Return the cumulative (expanding) mean over the specified axis.
+
+        {args}
+        '''
+        return self._ufunc_shape_skipna(
+                axis=axis,
+                skipna=skipna,
+                ufunc=ufunc_cummean,
+                ufunc_skipna=ufunc_nancummean,
+                composable=False,
+                dtypes=(),
+                size_one_unity=True
+                )
+
+    @doc_inject(selector='ufunc_skipna')
+    def cumstd(self,
+            axis: int = 0,
+            skipna: bool = True,
+            ddof: int = 0,
+            ) -> tp.Any:
+        '''Return the cumulative (expanding) standard deviation over the specified axis.
+
+        {args}
+        '''
+        return self._ufunc_shape_skipna(
+                axis=axis,
+                skipna=skipna,
+                ufunc=partial(ufunc_cumstd, ddof=ddof),
+                ufunc_skipna=partial(ufunc_nancumstd, ddof=ddof),
+                composable=False,
+                dtypes=(),
+                size_one_unity=False
+                )
+
+    @doc_inject(selector='ufunc_skipna')
+    def cumcount(self,
+            axis: int = 0,
+            skipna: bool = True,
+            ) -> tp.Any:
+        '''Return the cumulative count of values over the specified axis.
+
+        {args}
+        '''
+        return self._ufunc_shape_skipna(
+                axis=axis,
+                skipna=skipna,
+                ufunc=ufunc_cumcount,
+                ufunc_skipna=ufunc_nancumcount,
+                composable=False,
+                dtypes=(),
+                size_one_unity=True
+                )
+
     #---------------------------------------------------------------------------
     def _repr_html_(self) -> str:
         '''
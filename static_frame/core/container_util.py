@@ -24,6 +24,11 @@ from static_frame.core.rank import rank_1d
 from static_frame.core.util import BOOL_TYPES
 from static_frame.core.util import DEFAULT_SORT_KIND
 from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_BOOL_KIND
+from static_frame.core.util import DTYPE_FLOAT_KIND
+from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import DTYPE_INT_KINDS
+from static_frame.core.util import DTYPE_NAT_KINDS
 from static_frame.core.util import DTYPE_OBJECT
 from static_frame.core.util import DTYPE_STR
 from static_frame.core.util import DTYPE_STR_KINDS
@@ -37,12 +42,14 @@ from static_frame.core.util import DepthLevelSpecifier
 from static_frame.core.util import DtypeSpecifier
 from static_frame.core.util import DtypesSpecifier
 from static_frame.core.util import GetItemKeyType
+from static_frame.core.util import GroupReduceType
 from static_frame.core.util import IndexConstructor
 from static_frame.core.util import IndexConstructors
 from static_frame.core.util import IndexInitializer
 from static_frame.core.util import NameType
 from static_frame.core.util import UFunc
 from static_frame.core.util import WarningsSilent
+from static_frame.core.util import array_for_sort
 from static_frame.core.util import concat_resolved
 from static_frame.core.util import is_dtype_specifier
 from static_frame.core.util import is_mapping
@@ -675,6 +682,56 @@ def matmul(
             )
 
 
+def axis_window_bounds(*,
+        count: int,
+        size: int,
+        step: int = 1,
+        window_sized: bool = True,
+        label_shift: int = 0,
+        start_shift: int = 0,
+        size_increment: int = 0,
+        ) -> tp.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    '''Return arrays of the label position, start position, and end position of each window along an axis of length ``count``, excluding windows that have no label or, if ``window_sized``, are not of the window size.
+    '''
+    # see doc_str window for docs
+    if size <= 0:
+        raise RuntimeError('window size must be greater than 0')
+    if step < 0:
+        raise RuntimeError('window step cannot be less than than 0')
+
+    if start_shift >= 0:
+        count_window_max = count
+    else: # add for iterations when less than 0
+        count_window_max = count + abs(start_shift)
+    idx_left_max = count_window_max - 1
+
+    # windows are added until the count exceeds count_window_max, the left position exceeds idx_left_max, or the size is less than zero; at least one window is evaluated
+    count_window = count_window_max + 1
+    if step > 0:
+        count_window = min(count_window, max((idx_left_max - start_shift) // step + 1, 1))
+    elif start_shift > idx_left_max:
+        count_window = 1
+    if size_increment < 0:
+        count_window = min(count_window, size // -size_increment + 1)
+
+    increments = np.arange(count_window, dtype=DTYPE_INT_DEFAULT)
+    sizes = size + increments * size_increment
+    idx_left = start_shift + increments * step
+    idx_right = idx_left + sizes - 1
+
+    # floor idx_left at 0 so as to not wrap
+    starts = np.minimum(np.maximum(idx_left, 0), count)
+    ends = np.maximum(np.minimum(np.maximum(idx_right, -1) + 1, count), starts)
+
+    # if we cannot get a label, the window is invalid
+    positions = idx_right + label_shift
+    valid = (positions >= 0) & (positions < count)
+    if window_sized:
+        valid &= (ends - starts) == sizes
+
+    return positions[valid], starts[valid], ends[valid]
+
+
 def axis_window_items( *,
         source: tp.Union['Series', 'Frame', 'Quilt'],
         size: int,
@@ -699,11 +756,6 @@ def axis_window_items( *,
     from static_frame.core.quilt import Quilt
     from static_frame.core.series import Series
 
-    if size <= 0:
-        raise RuntimeError('window size must be greater than 0')
-    if step < 0:
-        raise RuntimeError('window step cannot be less than than 0')
-
     source_ndim = source.ndim
     values: tp.Optional[np.ndarray] = None
 
@@ -715,28 +767,27 @@ def axis_window_items( *,
     else:
         labels = source._index if axis == 0 else source._columns #type: ignore
 
-        if isinstance(source, Frame) and axis == 0 and as_array:
-            # for a Frame, when collecting rows, it is more efficient to pre-consolidate blocks prior to slicing. Note that this results in the same block coercion necessary for each window (which is not the same for axis 1, where block coercion is not required)
-            values = source._blocks.values
-
-    if start_shift >= 0:
-        count_window_max = len(labels)
-    else: # add for iterations when less than 0
-        count_window_max = len(labels) + abs(start_shift)
-
-    idx_left_max = count_window_max - 1
-    idx_left = start_shift
-    count = 0
-
-    while True:
-        # idx_left, size can change over iterations
-        idx_right = idx_left + size - 1
+    positions, starts, ends = axis_window_bounds(
+            count=len(labels),
+            size=size,
+            step=step,
+            window_sized=window_sized,
+            label_shift=label_shift,
+            start_shift=start_shift,
+            size_increment=size_increment,
+            )
 
-        # floor idx_left at 0 so as to not wrap
-        idx_left_floored = idx_left if idx_left > 0 else 0
-        idx_right_floored = idx_right if idx_right > -1 else -1 # will add one
+    if (source_ndim == 2 and isinstance(source, Frame)
+            and axis == 0 and as_array and len(positions)):
+        # for a Frame, when collecting rows, it is more efficient to pre-consolidate blocks prior to slicing. Note that this results in the same block coercion necessary for each window (which is not the same for axis 1, where block coercion is not required)
+        values = source._blocks.values
 
-        key = slice(idx_left_floored, idx_right_floored + 1)
+    for idx_label, idx_start, idx_end in zip(
+            positions.tolist(),
+            starts.tolist(),
+            ends.tolist(),
+            ):
+        key = slice(idx_start, idx_end)
 
         if source_ndim == 1:
             if as_array:
@@ -757,32 +808,97 @@ def axis_window_items( *,
                 else:
                     window = source._extract(column_key=key) #type: ignore
 
-        valid = True
-        try:
-            idx_label = idx_right + label_shift
-            if idx_label < 0: # do not wrap around
-                raise IndexError()
-            #if we cannot get a label, the window is invalid
-            label = labels.iloc[idx_label]
-        except IndexError: # an invalid label has to be dropped
-            valid = False
-
-        if valid and window_sized and window.shape[axis] != size:
-            valid = False
-        if valid and window_valid and not window_valid(window):
-            valid = False
-
-        if valid:
-            if window_func:
-                window = window_func(window)
-            yield label, window
-
-        idx_left += step
-        size += size_increment
-        count += 1
-
-        if count > count_window_max or idx_left > idx_left_max or size < 0:
-            break
+        if window_valid and not window_valid(window):
+            continue
+        if window_func:
+            window = window_func(window)
+        yield labels.iloc[idx_label], window
+
+
+def axis_window_reduce( *,
+        source: tp.Union['Series', 'Frame'],
+        size: int,
+        axis: int = 0,
+        step: int = 1,
+        window_sized: bool = True,
+        window_func: tp.Optional[AnyCallable] = None,
+        window_valid: tp.Optional[AnyCallable] = None,
+        label_shift: int = 0,
+        start_shift: int = 0,
+        size_increment: int = 0,
+        as_array: bool = False,
+        func: GroupReduceType,
+        ) -> tp.Union['Series', 'Frame']:
+    '''Reduce each window with ``func`` without creating a container (or array) per window, returning a container labelled by windows as are the items of :obj:`axis_window_items`. When ndim is 2, axis 0 returns a row per window, axis 1 returns a column per window.
+
+    Args:
+        func: a function of an array and the positions at which each window begins and ends, returning an array with a row per window.
+    '''
+    from static_frame.core.series import Series
+    from static_frame.core.type_blocks import TypeBlocks
+
+    if window_func is not None:
+        raise RuntimeError('window_func is not supported by window reductions; use apply()')
+
+    if source.ndim == 1 or axis == 0:
+        labels = source._index
+    elif axis == 1:
+        labels = source._columns #type: ignore
+    else:
+        raise AxisInvalid(f'invalid axis: {axis}')
+
+    positions, starts, ends = axis_window_bounds(
+            count=len(labels),
+            size=size,
+            step=step,
+            window_sized=window_sized,
+            label_shift=label_shift,
+            start_shift=start_shift,
+            size_increment=size_increment,
+            )
+
+    if window_valid is not None:
+        # windows must be created to be evaluated by window_valid
+        valid = np.fromiter(
+                (bool(window_valid(window)) for _, window in axis_window_items(
+                        source=source,
+                        size=size,
+                        axis=axis,
+                        step=step,
+                        window_sized=window_sized,
+                        label_shift=label_shift,
+                        start_shift=start_shift,
+                        size_increment=size_increment,
+                        as_array=as_array,
+                        )),
+                count=len(positions),
+                dtype=DTYPE_BOOL,
+                )
+        positions, starts, ends = positions[valid], starts[valid], ends[valid]
+
+    index = labels._extract_iloc(positions)
+
+    if source.ndim == 1:
+        return Series(func(source.values, starts, ends),
+                index=index,
+                own_index=True,
+                )
+    if axis == 0:
+        blocks = TypeBlocks.from_blocks(
+                func(block, starts, ends) for block in source._blocks._blocks) #type: ignore
+        return source.__class__(blocks,
+                index=index,
+                columns=source._columns, #type: ignore
+                own_index=True,
+                own_columns=source.STATIC,
+                own_data=True,
+                )
+    # reduce windows of columns for each row as windows of rows of the transpose
+    return source.__class__(func(source._blocks.values.T, starts, ends).T, #type: ignore
+            index=source._index,
+            columns=index,
+            own_index=True,
+            )
 
 def get_block_match(
         width: int,
@@ -1060,6 +1176,24 @@ def apply_binary_operator_blocks(*,
                 operator=operator,
                 )
 
+def apply_binary_operator_chunk(
+        key: slice,
+        *,
+        values: np.ndarray,
+        other: tp.Any,
+        other_sliced: bool,
+        operator: UFunc,
+        ) -> np.ndarray:
+    '''
+    Apply a binary operator to the rows of ``values`` selected by ``key``; ``other`` is sliced by ``key`` only if ``other_sliced``, otherwise it is broadcast.
+    '''
+    return apply_binary_operator(
+            values=values[key],
+            other=other[key] if other_sliced else other,
+            other_is_array=True,
+            operator=operator,
+            )
+
 def apply_binary_operator_blocks_columnar(*,
         values: tp.Iterable[np.ndarray],
         other: np.ndarray,
@@ -1406,6 +1540,31 @@ def frame_to_frame(
     func = getattr(frame, container_to_exporter_attr(container_type))
     return func() # type: ignore
 
+def values_for_lex_descending(array: np.ndarray) -> tp.List[np.ndarray]:
+    '''Return one or two arrays that, given to ``np.lexsort`` (least significant first), order ``array`` descending, with NaN or NaT first (as when an ascending order is reversed). Where possible, an order-reversing transform is used instead of ranking.
+    '''
+    kind = array.dtype.kind
+    if kind == DTYPE_BOOL_KIND:
+        return [~array]
+    if kind in DTYPE_INT_KINDS:
+        # bitwise inversion reverses order without overflow
+        return [~array]
+
+    isna: tp.Optional[np.ndarray] = None
+    if kind in DTYPE_NAT_KINDS:
+        post = ~array.view(DTYPE_INT_DEFAULT)
+        isna = np.isnat(array)
+    elif kind == DTYPE_FLOAT_KIND:
+        post = -array
+        isna = np.isnan(array)
+    else:
+        return [rank_1d(array, method=RankMethod.DENSE, ascending=False)]
+
+    if isna.any():
+        # NaN are ordered last by value; order them first with a more significant key
+        return [post, ~isna]
+    return [post]
+
 def prepare_values_for_lex(
         *,
         ascending: BoolOrBools = True,
@@ -1421,10 +1580,9 @@ def prepare_values_for_lex(
         # values for lex are in reversed order; thus take ascending reversed
         values_for_lex_post = []
         for asc, a in zip(reversed(ascending), values_for_lex):
-            # if not ascending, replace with an inverted dense rank
+            # if not ascending, replace with keys that order descending
             if not asc:
-                values_for_lex_post.append(
-                        rank_1d(a, method=RankMethod.DENSE, ascending=False))
+                values_for_lex_post.extend(values_for_lex_descending(a))
             else:
                 values_for_lex_post.append(a)
         values_for_lex = values_for_lex_post
@@ -1462,6 +1620,7 @@ def sort_index_for_order(
         else: # cfs is an IndexHierarchy
             values_for_lex = [cfs.values_at_depth(i)
                     for i in range(cfs.depth-1, -1, -1)]
+        values_for_lex = [array_for_sort(a) for a in values_for_lex]
 
         asc_is_element, values_for_lex = prepare_values_for_lex( #type: ignore
                 ascending=ascending,
@@ -1475,7 +1634,7 @@ def sort_index_for_order(
             raise RuntimeError('Multiple ascending values not permitted.')
 
         v = cfs if cfs_is_array else cfs.values
-        order = np.argsort(v, kind=kind)
+        order = np.argsort(array_for_sort(v), kind=kind)
 
     if asc_is_element and not ascending:
         # NOTE: if asc is not an element, then ascending Booleans have already been applied to values_for_lex
@@ -24,6 +24,12 @@ AXIS = '''axis: Integer specifying axis, where 0 is rows and 1 is columns. Axis
 
 CHUNKSIZE = 'chunksize: Units of work per executor, as passed to the Thread- or ProcessPoolExecutor.'
 
+COST = 'cost: Optionally provide a function that, given each value to be processed, returns an estimated cost; all values will be realized and submitted in descending order of cost, such that the most expensive work does not start last.'
+
+ORDERED = 'ordered: If True, results are yielded in the order of the values processed; if False, results are yielded in order of completion.'
+
+BATCH_COST = 'cost: Optionally provide a function that, given a :obj:`Frame`, returns an estimated cost of processing; when using ``max_workers``, all :obj:`Frame` will be realized and submitted in descending order of cost. When :obj:`Frame` are read from a zip store within workers, cost is instead estimated by the size of the stored file.'
+
 COLUMNS_CONSTRUCTOR = 'columns_constructor: Optional class or constructor function to create the :obj:`Index` applied to the columns.'
 
 CONSOLIDATE_BLOCKS = 'consolidate_blocks: Optionally consolidate adjacent same-typed columns into contiguous arrays.'
@@ -126,6 +132,8 @@ class DOC_TEMPLATE:
             max_workers=MAX_WORKERS,
             chunksize=CHUNKSIZE,
             use_threads=USE_THREADS,
+            cost=COST,
+            ordered='ordered: If True, results are yielded in the order of the values processed; if False, results are yielded in order of completion. False is only supported where the index of the result is formed from the labels processed, as with groups; otherwise, a RuntimeError is raised.',
             )
 
     argminmax = dict(
@@ -146,6 +154,8 @@ class DOC_TEMPLATE:
             {MAX_WORKERS}
             {CHUNKSIZE}
             {USE_THREADS}
+            {BATCH_COST}
+            {ORDERED}
             '''
             )
 
@@ -157,6 +167,8 @@ class DOC_TEMPLATE:
             {MAX_WORKERS}
             {CHUNKSIZE}
             {USE_THREADS}
+            {BATCH_COST}
+            {ORDERED}
             '''
             )
 
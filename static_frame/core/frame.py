@@ -16,6 +16,7 @@ from operator import itemgetter
 
 import numpy as np
 from arraykit import column_1d_filter
+from arraykit import immutable_filter
 from arraykit import name_filter
 from arraykit import resolve_dtype
 from arraykit import resolve_dtype_iter
@@ -24,12 +25,15 @@ from numpy.ma import MaskedArray  # type: ignore
 from static_frame.core.archive_npy import NPYFrameConverter
 from static_frame.core.archive_npy import NPZFrameConverter
 from static_frame.core.assign import Assign
+from static_frame.core.consolidate import ConsolidateConfig
+from static_frame.core.consolidate import Fragmentation
 from static_frame.core.container import ContainerOperand
 from static_frame.core.container import container_opperand_map
 from static_frame.core.container_util import MessagePackElement
 from static_frame.core.container_util import apex_to_name
 from static_frame.core.container_util import array_from_value_iter
 from static_frame.core.container_util import axis_window_items
+from static_frame.core.container_util import axis_window_reduce
 from static_frame.core.container_util import bloc_key_normalize
 from static_frame.core.container_util import constructor_from_optional_constructors
 from static_frame.core.container_util import df_slice_to_arrays
@@ -106,6 +110,7 @@ from static_frame.core.style_config import StyleConfig
 from static_frame.core.style_config import style_config_css_factory
 from static_frame.core.type_blocks import TypeBlocks
 from static_frame.core.type_blocks import group_match
+from static_frame.core.type_blocks import group_reduce
 from static_frame.core.type_blocks import group_sorted
 from static_frame.core.util import BOOL_TYPES
 from static_frame.core.util import CONTINUATION_TOKEN_INACTIVE
@@ -121,6 +126,7 @@ from static_frame.core.util import DTYPE_INT_DEFAULT
 from static_frame.core.util import DTYPE_NA_KINDS
 from static_frame.core.util import DTYPE_OBJECT
 from static_frame.core.util import DTYPE_OBJECT_KIND
+from static_frame.core.util import DTYPE_STR_KINDS
 from static_frame.core.util import DTYPE_TIMEDELTA_KIND
 from static_frame.core.util import EMPTY_ARRAY
 from static_frame.core.util import FILL_VALUE_DEFAULT
@@ -129,6 +135,7 @@ from static_frame.core.util import INT_TYPES
 from static_frame.core.util import KEY_MULTIPLE_TYPES
 from static_frame.core.util import NAME_DEFAULT
 from static_frame.core.util import NULL_SLICE
+from static_frame.core.util import UFUNC_SHAPE_STR_TO_OBJ
 from static_frame.core.util import STORE_LABEL_DEFAULT
 from static_frame.core.util import AnyCallable
 from static_frame.core.util import Bloc2DKeyType
@@ -140,6 +147,7 @@ from static_frame.core.util import DtypesSpecifier
 from static_frame.core.util import FrameInitializer
 from static_frame.core.util import GetItemKeyType
 from static_frame.core.util import GetItemKeyTypeCompound
+from static_frame.core.util import GroupReduceType
 from static_frame.core.util import IndexConstructor
 from static_frame.core.util import IndexConstructors
 from static_frame.core.util import IndexInitializer
@@ -157,6 +165,7 @@ from static_frame.core.util import _read_url
 from static_frame.core.util import argmax_2d
 from static_frame.core.util import argmin_2d
 from static_frame.core.util import array2d_to_tuples
+from static_frame.core.util import array_for_sort
 from static_frame.core.util import array_to_duplicated
 from static_frame.core.util import blocks_to_array_2d
 from static_frame.core.util import concat_resolved
@@ -1448,9 +1457,11 @@ class Frame(ContainerOperand):
             index_values = index_arrays[0]
             index_default_constructor = Index
         else: # > 1
-            # might use _from_type_blocks, but would not be able to use continuation token
-            index_values = zip(*index_arrays)
-            index_default_constructor = IndexHierarchy.from_labels # type: ignore
+            # PERF: factorize each depth array rather than creating a tuple per label
+            index_values = index_arrays
+            index_default_constructor = partial(IndexHierarchy._from_arrays, # type: ignore
+                    retain_order=True,
+                    )
 
         index, own_index = index_from_optional_constructors(
                 index_values,
@@ -2061,8 +2072,14 @@ class Frame(ContainerOperand):
         if index_depth == 1:
             index_values = index_arrays[0]
             index_default_constructor = partial(Index, name=index_name)
-        else: # > 1
-            # might use _from_type_blocks, but would not be able to use continuation token
+        elif index_continuation_token is CONTINUATION_TOKEN_INACTIVE: # > 1
+            # PERF: factorize each depth array rather than creating a tuple per label
+            index_values = index_arrays
+            index_default_constructor = partial(IndexHierarchy._from_arrays,
+                    name=index_name,
+                    retain_order=True,
+                    )
+        else: # > 1, with a continuation token
             index_values = zip(*index_arrays)
             index_default_constructor = partial(IndexHierarchy.from_labels,
                     name=index_name,
@@ -3318,6 +3335,7 @@ class Frame(ContainerOperand):
                 function_items=self._axis_group_loc_items,
                 yield_type=IterNodeType.VALUES,
                 apply_type=IterNodeApplyType.SERIES_ITEMS_GROUP_VALUES,
+                function_reduce=self._axis_group_loc_reduce,
                 )
 
     @property
@@ -3331,6 +3349,7 @@ class Frame(ContainerOperand):
                 function_items=self._axis_group_loc_items,
                 yield_type=IterNodeType.ITEMS,
                 apply_type=IterNodeApplyType.SERIES_ITEMS_GROUP_VALUES,
+                function_reduce=self._axis_group_loc_reduce,
                 )
 
     #---------------------------------------------------------------------------
@@ -3345,6 +3364,7 @@ class Frame(ContainerOperand):
                 function_items=partial(self._axis_group_loc_items, as_array=True),
                 yield_type=IterNodeType.VALUES,
                 apply_type=IterNodeApplyType.SERIES_ITEMS_GROUP_VALUES,
+                function_reduce=self._axis_group_loc_reduce,
                 )
 
     @property
@@ -3358,6 +3378,7 @@ class Frame(ContainerOperand):
                 function_items=partial(self._axis_group_loc_items, as_array=True),
                 yield_type=IterNodeType.ITEMS,
                 apply_type=IterNodeApplyType.SERIES_ITEMS_GROUP_VALUES,
+                function_reduce=self._axis_group_loc_reduce,
                 )
 
     #---------------------------------------------------------------------------
@@ -3431,6 +3452,7 @@ class Frame(ContainerOperand):
                 function_items=function_items,
                 yield_type=IterNodeType.VALUES,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
+                function_reduce=partial(self._axis_window_reduce, as_array=False),
                 )
 
     @property # type: ignore
@@ -3449,6 +3471,7 @@ class Frame(ContainerOperand):
                 function_items=function_items,
                 yield_type=IterNodeType.ITEMS,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
+                function_reduce=partial(self._axis_window_reduce, as_array=False),
                 )
 
     @property # type: ignore
@@ -3467,6 +3490,7 @@ class Frame(ContainerOperand):
                 function_items=function_items,
                 yield_type=IterNodeType.VALUES,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
+                function_reduce=partial(self._axis_window_reduce, as_array=True),
                 )
 
     @property # type: ignore
@@ -3485,6 +3509,7 @@ class Frame(ContainerOperand):
                 function_items=function_items,
                 yield_type=IterNodeType.ITEMS,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
+                function_reduce=partial(self._axis_window_reduce, as_array=True),
                 )
 
     #---------------------------------------------------------------------------
@@ -4479,6 +4504,35 @@ class Frame(ContainerOperand):
         '''
         return self._blocks.nbytes
 
+    @property
+    def fragmentation(self) -> Fragmentation:
+        '''
+        Return a report of the count of blocks before and after consolidating adjacent blocks of the same dtype.
+
+        Returns:
+            :obj:`Fragmentation`
+        '''
+        return self._blocks.fragmentation
+
+    def consolidate_policy(self,
+            config: tp.Optional[ConsolidateConfig],
+            ) -> 'Frame':
+        '''
+        Return a new :obj:`Frame` that, on row-wise access, lazily consolidates adjacent blocks of the same dtype as defined by ``config``. Underlying arrays are not copied.
+
+        Args:
+            config: a :obj:`ConsolidateConfig`; if None, the configuration of :obj:`ConsolidateActive` is used.
+        '''
+        blocks = self._blocks.copy()
+        blocks._consolidate_config = config
+        return self.__class__(blocks,
+                index=self._index,
+                columns=self._columns,
+                name=self._name,
+                own_data=True,
+                own_index=True,
+                )
+
 
     #---------------------------------------------------------------------------
     def _extract_array(self,
@@ -4973,15 +5027,27 @@ class Frame(ContainerOperand):
             ) -> 'Frame':
         # axis 0 processes ros, deliveres column index
         # axis 1 processes cols, delivers row index
-        dtype = None if not dtypes else dtypes[0] # only a tuple
-        if skipna:
-            post = ufunc_skipna(self.values, axis=axis, dtype=dtype)
+        ufunc_select = ufunc_skipna if skipna else ufunc
+        func = partial(ufunc_select, axis=axis)
+        if dtypes:
+            func = partial(func, dtype=dtypes[0]) # only a tuple
+
+        if axis == 0:
+            # PERF: columns are independent, so each block can be processed in a single pass, retaining block types
+            str_to_obj = ufunc_select in UFUNC_SHAPE_STR_TO_OBJ
+            blocks = TypeBlocks.from_blocks(immutable_filter(func(
+                    b.astype(DTYPE_OBJECT)
+                    if str_to_obj and b.dtype.kind in DTYPE_STR_KINDS else b))
+                    for b in self._blocks._blocks)
+        elif axis == 1:
+            post = func(self.values)
+            post.flags.writeable = False
+            blocks = TypeBlocks.from_blocks(post)
         else:
-            post = ufunc(self.values, axis=axis, dtype=dtype)
-        post.flags.writeable = False
+            raise AxisInvalid(f'invalid axis: {axis}')
 
         return self.__class__(
-                TypeBlocks.from_blocks(post),
+                blocks,
                 index=self._index,
                 columns=self._columns,
                 own_data=True,
@@ -5132,7 +5198,7 @@ class Frame(ContainerOperand):
             yield from ((group, array) for group, _, array in group_iter)
         else:
             for group, selection, tb in group_iter:
-                # NOTE: selection can be a Boolean array or a slice
+                # NOTE: selection is a slice from group_sorted, or an array of integer positions from group_match
                 if axis == 0:
                     # axis 0 is a row iter, so need to slice index, keep columns
                     index_group = (index._extract_iloc(selection) if ordering is None
@@ -5197,6 +5263,62 @@ class Frame(ContainerOperand):
                 as_array=as_array,
                 ))
 
+    def _axis_group_iloc_reduce(self,
+            key: GetItemKeyType,
+            *,
+            name_index: NameType,
+            drop: bool,
+            func: GroupReduceType,
+            ) -> 'Frame':
+        '''
+        Reduce row groups with ``func`` without creating a :obj:`Frame` per group; see :obj:`group_reduce`.
+        '''
+        groups, blocks = group_reduce(self._blocks, key=key, drop=drop, func=func)
+        if drop:
+            drop_mask = np.full(self._blocks._shape[1], True, dtype=DTYPE_BOOL)
+            drop_mask[key] = False
+            columns = self._columns[drop_mask]
+        else:
+            columns = self._columns
+        return self.__class__(blocks,
+                index=Index(groups, name=name_index),
+                columns=columns,
+                own_columns=self.STATIC,
+                own_index=True,
+                own_data=True,
+                )
+
+    def _axis_group_loc_reduce(self,
+            key: GetItemKeyType,
+            *,
+            axis: int = 0,
+            drop: bool = False,
+            func: GroupReduceType,
+            ) -> 'Frame':
+        '''
+        Args:
+            func: a function of an array and the positions at which each group begins and ends, returning an array with a row per group.
+        '''
+        try:
+            name_index = name_filter(key)
+        except TypeError:
+            name_index = None
+
+        if axis == 0:
+            return self._axis_group_iloc_reduce(self._columns._loc_to_iloc(key),
+                    name_index=name_index,
+                    drop=drop,
+                    func=func,
+                    )
+        elif axis == 1:
+            # NOTE: reduce columns as rows of the transpose
+            return self.T._axis_group_iloc_reduce(self._index._loc_to_iloc(key),
+                    name_index=name_index,
+                    drop=drop,
+                    func=func,
+                    ).T
+        raise AxisInvalid(f'invalid axis: {axis}')
+
     #-----------------------------------------------------------------------
     def _axis_group_labels_items(self,
             depth_level: DepthLevelSpecifier = 0,
@@ -5270,7 +5392,7 @@ class Frame(ContainerOperand):
             yield from ((group, array) for group, _, array in group_iter)
         else:
             for group, selection, tb in group_iter:
-                # NOTE: selection can be a Boolean array or a slice
+                # NOTE: selection is a slice from group_sorted, or an array of integer positions from group_match
                 if axis == 0:
                     # axis 0 is a row iter, so need to slice index, keep columns
                     index_group = (index._extract_iloc(selection) if ordering is None
@@ -5361,6 +5483,34 @@ class Frame(ContainerOperand):
                 as_array=as_array
                 ))
 
+    def _axis_window_reduce(self, *,
+            size: int,
+            axis: int = 0,
+            step: int = 1,
+            window_sized: bool = True,
+            window_func: tp.Optional[AnyCallable] = None,
+            window_valid: tp.Optional[AnyCallable] = None,
+            label_shift: int = 0,
+            start_shift: int = 0,
+            size_increment: int = 0,
+            as_array: bool = False,
+            func: GroupReduceType,
+            ) -> 'Frame':
+        return axis_window_reduce(
+                source=self,
+                axis=axis,
+                size=size,
+                step=step,
+                window_sized=window_sized,
+                window_func=window_func,
+                window_valid=window_valid,
+                label_shift=label_shift,
+                start_shift=start_shift,
+                size_increment=size_increment,
+                as_array=as_array,
+                func=func,
+                ) #type: ignore
+
 
     #---------------------------------------------------------------------------
 
@@ -5536,6 +5686,11 @@ class Frame(ContainerOperand):
         else:
             raise AxisInvalid(f'invalid axis: {axis}')
 
+        if values_for_lex is not None:
+            values_for_lex = [array_for_sort(a) for a in values_for_lex]
+        elif values_for_sort is not None:
+            values_for_sort = array_for_sort(values_for_sort)
+
         asc_is_element, values_for_lex = prepare_values_for_lex( # type: ignore
                 ascending=ascending,
                 values_for_lex=values_for_lex,
@@ -8063,9 +8218,13 @@ class Frame(ContainerOperand):
             include_index: bool = True,
             include_columns: bool = True,
             consolidate_blocks: bool = False,
+            dictionary_encode: bool = False,
             ) -> None:
         '''
         Write a :obj:`Frame` as an npz file.
+
+        Args:
+            dictionary_encode: if True, store string and object blocks of strings as integer codes into an array of unique strings where that is more compact (or, for object blocks, makes storage possible); such blocks are decoded when read.
         '''
         NPZFrameConverter.to_archive(
                 frame=self,
@@ -8073,6 +8232,7 @@ class Frame(ContainerOperand):
                 include_index=include_index,
                 include_columns=include_columns,
                 consolidate_blocks=consolidate_blocks,
+                dictionary_encode=dictionary_encode,
                 )
 
     def to_npy(self,
@@ -8081,9 +8241,13 @@ class Frame(ContainerOperand):
             include_index: bool = True,
             include_columns: bool = True,
             consolidate_blocks: bool = False,
+            dictionary_encode: bool = False,
             ) -> None:
         '''
         Write a :obj:`Frame` as a directory of npy file.
+
+        Args:
+            dictionary_encode: if True, store string and object blocks of strings as integer codes into an array of unique strings where that is more compact (or, for object blocks, makes storage possible); such blocks are decoded when read.
         '''
         NPYFrameConverter.to_archive(
                 frame=self,
@@ -8091,6 +8255,7 @@ class Frame(ContainerOperand):
                 include_index=include_index,
                 include_columns=include_columns,
                 consolidate_blocks=consolidate_blocks,
+                dictionary_encode=dictionary_encode,
                 )
 
     def to_pickle(self,
@@ -24,6 +24,8 @@ from static_frame.core.doc_str import doc_inject
 from static_frame.core.exception import ErrorInitIndex
 from static_frame.core.exception import ErrorInitIndexNonUnique
 from static_frame.core.index_base import IndexBase
+from static_frame.core.loc_map import SORTED_LOOKUP_KINDS
+from static_frame.core.loc_map import FrozenAutoMapDeferred
 from static_frame.core.loc_map import LocMap
 from static_frame.core.node_dt import InterfaceDatetime
 from static_frame.core.node_iter import IterNodeApplyType
@@ -88,6 +90,11 @@ if tp.TYPE_CHECKING:
 
 I = tp.TypeVar('I', bound=IndexBase)
 
+# key types for which a binary search into sorted labels might be used
+_SORTED_LOOKUP_KEY_TYPES = frozenset((np.ndarray, list, slice, np.datetime64))
+# kinds of labels for which uniqueness can be established by comparison
+_MAP_DEFERRED_KINDS = frozenset(('i', 'u', 'f', 'U', 'S', 'M', 'm'))
+
 
 class ILocMeta(type):
 
@@ -96,6 +103,7 @@ class ILocMeta(type):
             ) -> 'ILoc':
         return cls(key) #type: ignore
 
+
 class ILoc(metaclass=ILocMeta):
     '''A wrapper for embedding ``iloc`` specifications within a single axis argument of a ``loc`` selection.
     '''
@@ -144,7 +152,9 @@ class Index(IndexBase):
         '_labels',
         '_positions',
         '_recache',
-        '_name'
+        '_name',
+        '_labels_is_sorted',
+        '__weakref__',
         )
 
     # _IMMUTABLE_CONSTRUCTOR is None from IndexBase
@@ -256,6 +266,7 @@ class Index(IndexBase):
         '''
         self._recache: bool = False
         self._map: tp.Optional[FrozenAutoMap] = None
+        self._labels_is_sorted: tp.Optional[bool] = None # None until evaluated
 
         positions = None
         is_typed = self._DTYPE is not None # only True for datetime64 indices
@@ -284,6 +295,7 @@ class Index(IndexBase):
                     if not is_typed or (is_typed and self._DTYPE == labels.dtype):
                         # can take the map if static and if types in the dict are the same as those in the labels (or to become the labels after conversion)
                         self._map = labels._map
+                        self._labels_is_sorted = labels._labels_is_sorted
                 # get a reference to the immutable arrays, even if this is an IndexGO index, we can take the cached arrays, assuming they are up to date; for datetime64 indices, we might need to translate to a different type
                 positions = labels._positions
                 loc_is_iloc = labels._map is None
@@ -314,8 +326,18 @@ class Index(IndexBase):
 
         self._name = None if name is NAME_DEFAULT else name_filter(name)
 
+        map_deferred = False
         if self._map is None: # if _map not shared from another Index
-            if not loc_is_iloc:
+            if (not loc_is_iloc
+                    and self.STATIC
+                    and labels.__class__ is np.ndarray
+                    and labels.dtype.kind in _MAP_DEFERRED_KINDS # type: ignore
+                    and len(labels) # type: ignore
+                    and (labels[1:] > labels[:-1]).all()): # type: ignore
+                # PERF: strictly ascending labels are unique; creating the map can be deferred until a label-based lookup
+                map_deferred = True
+                size = len(labels) # type: ignore
+            elif not loc_is_iloc:
                 # PERF: calling tolist before initializing AutoMap is shown to be about 2x faster, but can only be done with NumPy dtypes that are equivalent after conversion to Python objects
                 if not is_typed:
                     if labels.__class__ is np.ndarray and labels.dtype.kind in DTYPE_OBJECTABLE_KINDS: #type: ignore
@@ -344,6 +366,10 @@ class Index(IndexBase):
         self._labels = self._extract_labels(self._map, labels, dtype_extract)
         self._positions = self._extract_positions(size, positions)
 
+        if map_deferred:
+            self._map = FrozenAutoMapDeferred(self._labels)
+            self._labels_is_sorted = self._labels.dtype.kind in SORTED_LOOKUP_KINDS
+
         if self._DTYPE and self._labels.dtype != self._DTYPE:
             raise ErrorInitIndex('Invalid label dtype for this Index', #pragma: no cover
                     self._labels.dtype, self._DTYPE)
@@ -358,6 +384,7 @@ class Index(IndexBase):
         '''
         Ensure that reanimated NP arrays are set not writeable.
         '''
+        self._labels_is_sorted = None
         for key, value in state[1].items():
             setattr(self, key, value)
         self._labels.flags.writeable = False
@@ -370,6 +397,7 @@ class Index(IndexBase):
         obj._positions = PositionsAllocator.get(len(self._labels)) #type: ignore
         obj._recache = False
         obj._name = self._name # should be hashable/immutable
+        obj._labels_is_sorted = self._labels_is_sorted
 
         memo[id(self)] = obj
         return obj
@@ -876,14 +904,33 @@ class Index(IndexBase):
         if self._recache:
             self._update_array_cache()
 
+        if self._map.__class__ is FrozenAutoMapDeferred:
+            self._map = self._map.realize() # type: ignore
+
         return LocMap.loc_to_iloc(
                 label_to_pos=self._map,
                 labels=self._labels,
                 positions=self._positions, # always an np.ndarray
                 key=key,
                 partial_selection=partial_selection,
+                # NOTE: sortedness is only used by array, list, slice, and datetime64 keys
+                labels_is_sorted=(key.__class__ in _SORTED_LOOKUP_KEY_TYPES
+                        and self._get_labels_is_sorted()),
                 )
 
+    def _get_labels_is_sorted(self) -> bool:
+        '''
+        Return True if labels are of a kind that supports binary search and are in ascending order; this is evaluated once and cached.
+        '''
+        if self._labels_is_sorted is None:
+            labels = self._labels
+            if len(labels) and labels.dtype.kind in SORTED_LOOKUP_KINDS:
+                # NOTE: as labels are unique, ascending labels are strictly increasing; NaN fails all comparisons and will not be identified as sorted
+                self._labels_is_sorted = bool((labels[1:] > labels[:-1]).all())
+            else:
+                self._labels_is_sorted = False
+        return self._labels_is_sorted
+
     def loc_to_iloc(self,
             key: GetItemKeyType,
             ) -> GetItemKeyType:
@@ -928,6 +975,9 @@ class Index(IndexBase):
         if self._recache:
             self._update_array_cache()
 
+        # a slice or Boolean selection of unique labels is unique; unless reversed, it is ascending if the labels are ascending
+        is_unique_selection = True
+        labels_is_sorted = self._labels_is_sorted
         if key is None:
             labels = self._labels
             loc_is_iloc = self._map is None
@@ -940,14 +990,33 @@ class Index(IndexBase):
                 labels = self._labels[key]
                 labels.flags.writeable = False
                 loc_is_iloc = False
+                if key.step is not None and key.step < 0: # type: ignore
+                    labels_is_sorted = None
         elif isinstance(key, KEY_ITERABLE_TYPES):
             # can select directly from _labels[key] if if key is a list, array, or Boolean array
             labels = self._labels[key]
             labels.flags.writeable = False
             loc_is_iloc = False
+            is_unique_selection = key.__class__ is np.ndarray and key.dtype == DTYPE_BOOL # type: ignore
         else: # select a single label value
             return self._labels[key] #type: ignore
 
+        if is_unique_selection and not loc_is_iloc and self.STATIC:
+            # PERF: uniqueness is known; defer creating the map until a label-based lookup
+            obj = self.__class__.__new__(self.__class__)
+            if labels is self._labels:
+                # NOTE: the map (realized or deferred) of the same immutable labels can be shared
+                obj._map = self._map
+                obj._labels_is_sorted = labels_is_sorted
+            else:
+                obj._map = FrozenAutoMapDeferred(labels)
+                obj._labels_is_sorted = True if labels_is_sorted else None
+            obj._labels = labels
+            obj._positions = PositionsAllocator.get(len(labels))
+            obj._recache = False
+            obj._name = self._name
+            return obj
+
         return self.__class__(labels=labels,
                 loc_is_iloc=loc_is_iloc,
                 name=self._name,
@@ -1400,6 +1469,7 @@ class _IndexGOMixin:
         obj._positions = PositionsAllocator.get(len(self._labels)) #type: ignore
         obj._recache = False # pylint: disable=E0237
         obj._name = self._name # pylint: disable=E0237
+        obj._labels_is_sorted = self._labels_is_sorted # pylint: disable=E0237
         obj._labels_mutable = deepcopy(self._labels_mutable, memo) #type: ignore
         obj._labels_mutable_dtype = deepcopy(self._labels_mutable_dtype, memo) #type: ignore
         obj._positions_mutable_count = self._positions_mutable_count #type: ignore
@@ -1446,6 +1516,7 @@ class _IndexGOMixin:
                 self._labels_mutable,
                 dtype=self._labels_mutable_dtype)
         self._positions = PositionsAllocator.get(self._positions_mutable_count)
+        self._labels_is_sorted = None # pylint: disable=E0237
         self._recache = False # pylint: disable=E0237
 
     #---------------------------------------------------------------------------
@@ -88,6 +88,7 @@ from static_frame.core.util import ufunc_is_statistical
 from static_frame.core.util import ufunc_unique
 from static_frame.core.util import ufunc_unique1d_counts
 from static_frame.core.util import ufunc_unique1d_indexer
+from static_frame.core.util import ufunc_unique1d_indexer_ordered
 from static_frame.core.util import ufunc_unique1d_positions
 from static_frame.core.util import union2d
 from static_frame.core.util import validate_depth_selection
@@ -180,19 +181,19 @@ def construct_indices_and_indexers_from_column_arrays(
         *,
         column_iter: tp.Iterable[np.ndarray],
         index_constructors_iter: tp.Iterable[IndexConstructor],
+        retain_order: bool = False,
         ) -> tp.Tuple[tp.List[Index], np.ndarray]:
+    '''
+    Args:
+        retain_order: if True, the labels of each depth are ordered by first appearance, as done by :obj:`IndexHierarchy.from_labels`; otherwise, they are sorted.
+    '''
     indices: tp.List[Index] = []
     indexers: tp.List[np.ndarray] = []
 
-    for column, constructor in zip(column_iter, index_constructors_iter):
-        # Alternative approach that retains order
-        # positions, indexer = ufunc_unique1d_positions(column)
-        # unsorted_unique = column[np.sort(positions)]
-        # indexer_remap = ufunc_unique1d_indexer(unsorted_unique)[1]
-        # indexer = indexer_remap[indexer]
-        # unique_values = unsorted_unique
+    func = ufunc_unique1d_indexer_ordered if retain_order else ufunc_unique1d_indexer
 
-        unique_values, indexer = ufunc_unique1d_indexer(column)
+    for column, constructor in zip(column_iter, index_constructors_iter):
+        unique_values, indexer = func(column)
 
         # we call the constructor on all lvl, even if it is already an Index
         indices.append(constructor(unique_values))
@@ -230,19 +231,23 @@ class IndexHierarchy(IndexBase):
     __slots__ = (
             '_indices',
             '_indexers',
+            '_indexers_buffer',
             '_name',
-            '_blocks',
+            '_blocks_cache',
             '_recache',
             '_values',
             '_map',
             '_index_types',
             '_pending_extensions',
+            '_indexers_is_sorted',
+            '__weakref__',
             )
 
     _indices: tp.List[Index] # Of index objects
     _indexers: np.ndarray # 2D - integer arrays
+    _indexers_buffer: tp.Optional[np.ndarray] # 2D - integer arrays, with capacity for extension
     _name: NameType
-    _blocks: TypeBlocks
+    _blocks_cache: tp.Optional[TypeBlocks] # None if blocks must be created from indexers
     _recache: bool
     _values: tp.Optional[np.ndarray] # Used to cache the property `values`
     _map: HierarchicalLocMap
@@ -446,12 +451,16 @@ class IndexHierarchy(IndexBase):
             name: NameType = None,
             depth_reference: tp.Optional[int] = None,
             index_constructors: IndexConstructors = None,
+            retain_order: bool = False,
             ) -> IH:
         '''
         Construct an :obj:`IndexHierarchy` from a 2D NumPy array, or a collection of 1D arrays per depth.
 
         Very similar implementation to :meth:`_from_type_blocks`, but avoids creating TypeBlocks instance.
 
+        Args:
+            retain_order: if True, order the labels of each depth by first appearance, producing the same result as :obj:`IndexHierarchy.from_labels` given the zipped arrays, without creating tuples.
+
         Returns:
             :obj:`IndexHierarchy`
         '''
@@ -478,6 +487,7 @@ class IndexHierarchy(IndexBase):
         indices, indexers = construct_indices_and_indexers_from_column_arrays(
                 column_iter=column_iter,
                 index_constructors_iter=index_constructors_iter,
+                retain_order=retain_order,
                 )
 
         if name is None:
@@ -903,6 +913,8 @@ class IndexHierarchy(IndexBase):
         self._recache = False
         self._index_types = None
         self._pending_extensions = None
+        self._indexers_buffer = None
+        self._indexers_is_sorted: tp.Optional[bool] = None
 
         if isinstance(indices, IndexHierarchy):
             if indexers is not EMPTY_ARRAY_INT:
@@ -922,10 +934,13 @@ class IndexHierarchy(IndexBase):
                 for index in indices._indices
                 ]
             self._indexers = indices._indexers
+            self._indexers_is_sorted = indices._indexers_is_sorted
             self._name = name if name is not NAME_DEFAULT else indices._name
-            self._blocks = indices._blocks
+            self._blocks_cache = indices._blocks_cache
             self._values = indices._values
             self._map = indices._map
+            # as indexers and map are now shared, the source can no longer extend them in-place
+            indices._indexers_buffer = None
             return
 
         if not (indexers.__class__ is np.ndarray and not indexers.flags.writeable):
@@ -945,11 +960,11 @@ class IndexHierarchy(IndexBase):
         self._name = None if name is NAME_DEFAULT else name_filter(name)
 
         if blocks is None:
-            self._blocks = self._to_type_blocks()
+            self._blocks_cache = self._to_type_blocks()
         elif own_blocks:
-            self._blocks = blocks
+            self._blocks_cache = blocks
         else:
-            self._blocks = blocks.copy()
+            self._blocks_cache = blocks.copy()
 
         self._values = None
         self._map = HierarchicalLocMap(indices=self._indices, indexers=self._indexers)
@@ -958,15 +973,18 @@ class IndexHierarchy(IndexBase):
         # This MUST be set before entering this context
         assert self._pending_extensions is not None
 
-        new_indexers = [np.empty(self.__len__(), DTYPE_INT_DEFAULT)
-                for _ in range(self.depth)]
+        current_size = self._indexers.shape[1]
+        size = self.__len__()
 
-        current_size = len(self._blocks)
+        # PERF: extensions are written into a buffer with spare capacity, owned by this instance, such that repeated extension has amortized linear cost; the map is extended in-place only if the buffer (and thus the map, created with it) is owned
+        buffer = self._indexers_buffer
+        extend_map = buffer is not None and buffer.shape[1] >= size
+        if not extend_map:
+            buffer = np.empty((self.depth, max(size, current_size * 2)), dtype=DTYPE_INT_DEFAULT)
+            buffer[:, :current_size] = self._indexers
+            self._indexers_buffer = buffer
 
-        for depth, indexer in enumerate(self._indexers):
-            new_indexers[depth][:current_size] = indexer
-
-        self._indexers = EMPTY_ARRAY_INT # Remove reference to old indexers
+        new_indexers = buffer[:, :size]
 
         offset = current_size
         # For all these extensions, we have already update self._indices - we now need to map indexers
@@ -974,7 +992,7 @@ class IndexHierarchy(IndexBase):
             if pending.__class__ is PendingRow: # type: ignore
                 for depth, label_at_depth in enumerate(pending):
                     label_index = self._indices[depth]._loc_to_iloc(label_at_depth)
-                    new_indexers[depth][offset] = label_index
+                    new_indexers[depth, offset] = label_index
 
                 offset += 1
             else:
@@ -988,24 +1006,40 @@ class IndexHierarchy(IndexBase):
                         pending._indexers[depth] # type: ignore
                     ]
 
-                    new_indexers[depth][offset:offset + group_size] = remapped_indexers_ordered
+                    new_indexers[depth, offset:offset + group_size] = remapped_indexers_ordered
 
                 offset += group_size
 
         self._pending_extensions.clear()
-        self._indexers = np.array(new_indexers)
-        self._indexers.flags.writeable = False
-        self._blocks = self._to_type_blocks()
+        new_indexers.flags.writeable = False
+        self._indexers = new_indexers
+        self._indexers_is_sorted = None
+        # blocks are only created when needed
+        self._blocks_cache = None
         self._values = None
-        self._map = HierarchicalLocMap(indices=self._indices, indexers=self._indexers)
+        if not (extend_map and self._map.extend(
+                indices=self._indices,
+                indexers=new_indexers[:, current_size:],
+                )):
+            self._map = HierarchicalLocMap(indices=self._indices, indexers=self._indexers)
         self._recache = False
 
+    @property
+    def _blocks(self: IH) -> TypeBlocks:
+        '''
+        The :obj:`TypeBlocks` of labels, created from indices and indexers if not available.
+        '''
+        if self._blocks_cache is None:
+            self._blocks_cache = self._to_type_blocks()
+        return self._blocks_cache
+
     # --------------------------------------------------------------------------
 
     def __setstate__(self, state: tp.Tuple[None, tp.Dict[str, tp.Any]]) -> None:
         '''
         Ensure that reanimated NP arrays are set not writeable.
         '''
+        self._indexers_is_sorted = None
         for key, value in state[1].items():
             setattr(self, key, value)
         if self._values is not None:
@@ -1023,7 +1057,9 @@ class IndexHierarchy(IndexBase):
         obj: IH = self.__class__.__new__(self.__class__)
         obj._indices = deepcopy(self._indices, memo)
         obj._indexers = array_deepcopy(self._indexers, memo)
-        obj._blocks = self._blocks.__deepcopy__(memo)
+        obj._indexers_is_sorted = self._indexers_is_sorted
+        obj._indexers_buffer = None
+        obj._blocks_cache = self._blocks.__deepcopy__(memo)
         obj._values = None
         obj._name = self._name # should be hashable/immutable
         obj._recache = False
@@ -1230,10 +1266,7 @@ class IndexHierarchy(IndexBase):
         Returns:
             :obj:`tp.Tuple[int]`
         '''
-        if self._recache:
-            return self.__len__(), self.depth
-
-        return self._blocks._shape
+        return self.__len__(), self.depth
 
     @property
     def ndim(self: IH) -> int:
@@ -1277,12 +1310,10 @@ class IndexHierarchy(IndexBase):
 
     # --------------------------------------------------------------------------
     def __len__(self: IH) -> int:
+        size: int = self._indexers.shape[1]
         if self._recache:
-            size = self._blocks.__len__()
             size += sum(map(len, self._pending_extensions))
-            return size
-
-        return self._blocks.__len__()
+        return size
 
     @doc_inject()
     def display(self: IH,
@@ -1788,9 +1819,13 @@ class IndexHierarchy(IndexBase):
             depth: int,
             key: tp.Union[np.ndarray, CompoundLabelType],
             single_depth: bool,
+            rows: slice = NULL_SLICE,
             ) -> np.ndarray:
         '''
         Determines the indexer mask for `key` at `depth`.
+
+        Args:
+            rows: if not ``single_depth``, a slice of rows to which the mask is limited.
         '''
         # This private internal method assumes recache has already been checked for!
 
@@ -1798,10 +1833,10 @@ class IndexHierarchy(IndexBase):
 
         # Key is already a mask!
         if key_at_depth.__class__ is np.ndarray and key_at_depth.dtype == DTYPE_BOOL: # type: ignore
-            return key_at_depth
+            return key_at_depth[rows] # type: ignore
 
         index_at_depth = self._indices[depth]
-        indexer_at_depth = self._indexers[depth]
+        indexer_at_depth = self._indexers[depth][rows]
 
         if isinstance(key_at_depth, slice):
             if key_at_depth.start is not None:
@@ -1826,7 +1861,7 @@ class IndexHierarchy(IndexBase):
                     [[*_, stop]] = np.nonzero(indexer_at_depth == index_at_depth.loc_to_iloc(key_at_depth.stop))
                     stop += 1
             else:
-                stop = len(indexer_at_depth)
+                stop = self._indexers.shape[1]
 
             if key_at_depth.step is None or key_at_depth.step == 1:
                 other = PositionsAllocator.get(stop)[start:]
@@ -1887,13 +1922,99 @@ class IndexHierarchy(IndexBase):
             # Display the first missing element
             raise KeyError(key.difference(self)[0]) from None
 
+    def _get_indexers_is_sorted(self: IH) -> bool:
+        '''
+        Return (and cache) whether rows of indexers are in ascending lexicographic order, such that, at each depth, rows with the same indexers at all outer depths are contiguous and ascending.
+        '''
+        # This private internal method assumes recache has already been checked for!
+        if self._indexers_is_sorted is None:
+            indexers = self._indexers
+            is_sorted = True
+            # compare each row to the next, only at depths where all outer depths are equal
+            tied = np.full(max(indexers.shape[1] - 1, 0), True, dtype=DTYPE_BOOL)
+            for indexer in indexers:
+                following = indexer[1:]
+                preceding = indexer[:-1]
+                if (following[tied] < preceding[tied]).any():
+                    is_sorted = False
+                    break
+                tied &= following == preceding
+            self._indexers_is_sorted = is_sorted
+        return self._indexers_is_sorted
+
+    def _loc_per_depth_to_iloc_sorted(self: IH,
+            key: tp.Union[np.ndarray, CompoundLabelType],
+            meaningful_depths: tp.List[int],
+            ) -> tp.Union[slice, np.ndarray, None]:
+        '''
+        For lexicographically sorted indexers, find the range of rows selected by outer-depth labels and slices with binary searches, and apply any remaining selections only within that range. Returns a slice if the selection is contiguous, or None if no range can be found.
+        '''
+        # This private internal method assumes recache has already been checked for!
+        start = 0
+        stop = self.__len__()
+        depth_mask_start = len(key)
+
+        for depth, key_at_depth in enumerate(key):
+            if key_at_depth.__class__ is slice:
+                if key_at_depth == NULL_SLICE or key_at_depth.step not in (None, 1):
+                    depth_mask_start = depth
+                    break
+                index_at_depth = self._indices[depth]
+                lower = upper = None
+                if key_at_depth.start is not None:
+                    lower = index_at_depth.loc_to_iloc(key_at_depth.start)
+                if key_at_depth.stop is not None:
+                    upper = index_at_depth.loc_to_iloc(key_at_depth.stop)
+                if not (lower is None or isinstance(lower, INT_TYPES)) or not (
+                        upper is None or isinstance(upper, INT_TYPES)):
+                    depth_mask_start = depth
+                    break
+                # within the range, indexers at this depth are ascending; as a slice can select more than one value, indexers at inner depths are not
+                indexer = self._indexers[depth, start:stop]
+                stop = start + (len(indexer) if upper is None
+                        else int(indexer.searchsorted(upper, 'right')))
+                start = start + (0 if lower is None
+                        else int(indexer.searchsorted(lower, 'left')))
+                depth_mask_start = depth + 1
+                break
+
+            if key_at_depth.__class__ is np.ndarray or isinstance(key_at_depth, KEY_MULTIPLE_TYPES):
+                depth_mask_start = depth
+                break
+            pos = self._indices[depth].loc_to_iloc(key_at_depth)
+            if not isinstance(pos, INT_TYPES):
+                depth_mask_start = depth
+                break
+            indexer = self._indexers[depth, start:stop]
+            stop = start + int(indexer.searchsorted(pos, 'right'))
+            start = start + int(indexer.searchsorted(pos, 'left'))
+
+        if depth_mask_start == 0:
+            return None
+
+        stop = max(start, stop)
+        rows = slice(start, stop)
+        mask_depths = [d for d in meaningful_depths if d >= depth_mask_start]
+        if not mask_depths:
+            return rows
+
+        mask = np.full(stop - start, True, dtype=DTYPE_BOOL)
+        for depth in mask_depths:
+            mask &= self._build_mask_for_key_at_depth(
+                    depth=depth,
+                    key=key,
+                    single_depth=False,
+                    rows=rows,
+                    )
+        return self.positions[rows][mask]
+
     def _loc_per_depth_to_iloc(self: IH,
             key: tp.Union[np.ndarray, CompoundLabelType],
-            ) -> tp.Union[int, np.ndarray]:
+            ) -> tp.Union[int, slice, np.ndarray]:
         '''
         Return the indexer for a given key. Key is assumed to not be compound (i.e. HLoc, list of keys, etc)
 
-        Will return a single integer for single, non-HLoc keys. Otherwise, returns a boolean mask.
+        Will return a single integer for single, non-HLoc keys. Otherwise, returns a slice for contiguous selections from sorted indexers, or an array of positions.
         '''
         # This private internal method assumes recache has already been checked for!
         # We consider the NULL_SLICE to not be 'meaningful', as it requires no filtering
@@ -1901,6 +2022,22 @@ class IndexHierarchy(IndexBase):
                 depth for depth, k in enumerate(key)
                 if not (k.__class__ is slice and k == NULL_SLICE)
                 ]
+        # NOTE: use a faster lookup; only call is_neither_slice_nor_mask if meaningful_depths == self.depth
+        if (len(meaningful_depths) == self.depth
+                and all(map(is_neither_slice_nor_mask, key))):
+            try:
+                return self._map.loc_to_iloc(key, self._indices)
+            except KeyError:
+                raise KeyError(key) from None
+
+        # PERF: if selecting from the outermost depth of sorted indexers, binary search for a contiguous range of rows
+        if (meaningful_depths
+                and meaningful_depths[0] == 0
+                and self._get_indexers_is_sorted()):
+            post = self._loc_per_depth_to_iloc_sorted(key, meaningful_depths)
+            if post is not None:
+                return post
+
         if len(meaningful_depths) == 1:
             # Prefer to avoid construction of a 2D mask
             mask = self._build_mask_for_key_at_depth(
@@ -1909,14 +2046,6 @@ class IndexHierarchy(IndexBase):
                     single_depth=True,
                     )
         else:
-            # NOTE: use a faster lookup; only call is_neither_slice_nor_mask if meaningful_depths == self.depth
-            if (len(meaningful_depths) == self.depth
-                    and all(map(is_neither_slice_nor_mask, key))):
-                try:
-                    return self._map.loc_to_iloc(key, self._indices)
-                except KeyError:
-                    raise KeyError(key) from None
-
             mask_2d = np.full(self.shape, True, dtype=DTYPE_BOOL)
 
             for depth in meaningful_depths:
@@ -1956,6 +2085,16 @@ class IndexHierarchy(IndexBase):
             return slice(*LocMap.map_slice_args(self._loc_to_iloc, key))
 
         if isinstance(key, list):
+            depth = self.depth
+            if key and all(k.__class__ is tuple and len(k) == depth for k in key):
+                try:
+                    return self._map.labels_to_iloc(
+                            list(map(list, zip(*key))),
+                            self._indices,
+                            )
+                except TypeError:
+                    # unhashable components (i.e. slices or lists) are handled per key
+                    pass
             return [self._loc_to_iloc(k) for k in key]
 
         if key.__class__ is np.ndarray and key.ndim == 2: # type: ignore
@@ -1966,6 +2105,14 @@ class IndexHierarchy(IndexBase):
                         assume_unique=False,
                         return_indices=True,
                         )[1]
+            if len(key) and key.shape[1] == self.depth: # type: ignore
+                try:
+                    return self._map.labels_to_iloc(
+                            key.T.tolist(), # type: ignore
+                            self._indices,
+                            )
+                except TypeError:
+                    pass
             return [self._loc_to_iloc(k) for k in key] # type: ignore
 
         if key.__class__ is HLoc:
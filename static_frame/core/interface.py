@@ -53,6 +53,16 @@ from static_frame.core.type_blocks import TypeBlocks
 from static_frame.core.util import DT64_S
 from static_frame.core.util import EMPTY_ARRAY
 from static_frame.core.util import AnyCallable
+from static_frame.core.util import ufunc_cumcount
+from static_frame.core.util import ufunc_cummax
+from static_frame.core.util import ufunc_cummean
+from static_frame.core.util import ufunc_cummin
+from static_frame.core.util import ufunc_cumstd
+from static_frame.core.util import ufunc_nancumcount
+from static_frame.core.util import ufunc_nancummax
+from static_frame.core.util import ufunc_nancummean
+from static_frame.core.util import ufunc_nancummin
+from static_frame.core.util import ufunc_nancumstd
 from static_frame.core.yarn import Yarn
 
 #-------------------------------------------------------------------------------
@@ -116,6 +126,11 @@ UFUNC_AXIS_SKIPNA: tp.Dict[str, UfuncSkipnaAttrs] = {
 UFUNC_SHAPE_SKIPNA: tp.Dict[str, UfuncSkipnaAttrs] = {
         'cumsum': UfuncSkipnaAttrs(np.cumsum, np.nancumsum),
         'cumprod': UfuncSkipnaAttrs(np.cumprod, np.nancumprod),
+        'cummax': UfuncSkipnaAttrs(ufunc_cummax, ufunc_nancummax),
+        'cummin': UfuncSkipnaAttrs(ufunc_cummin, ufunc_nancummin),
+        'cummean': UfuncSkipnaAttrs(ufunc_cummean, ufunc_nancummean),
+        'cumstd': UfuncSkipnaAttrs(ufunc_cumstd, ufunc_nancumstd),
+        'cumcount': UfuncSkipnaAttrs(ufunc_cumcount, ufunc_nancumcount),
         }
 
 
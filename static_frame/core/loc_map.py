@@ -5,6 +5,7 @@ from copy import deepcopy
 from functools import reduce
 
 import numpy as np
+from automap import AutoMap  # pylint: disable = E0611
 from automap import FrozenAutoMap  # pylint: disable = E0611
 
 from static_frame.core.exception import ErrorInitIndexNonUnique
@@ -12,12 +13,16 @@ from static_frame.core.exception import LocEmpty
 from static_frame.core.exception import LocInvalid
 from static_frame.core.util import DTYPE_BOOL
 from static_frame.core.util import DTYPE_DATETIME_KIND
+from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import DTYPE_INT_KINDS
 from static_frame.core.util import DTYPE_OBJECT
 from static_frame.core.util import DTYPE_OBJECTABLE_DT64_UNITS
+from static_frame.core.util import DTYPE_OBJECTABLE_KINDS
 from static_frame.core.util import DTYPE_UINT_DEFAULT
 from static_frame.core.util import EMPTY_ARRAY_INT
 from static_frame.core.util import EMPTY_FROZEN_AUTOMAP
 from static_frame.core.util import EMPTY_SLICE
+from static_frame.core.util import FLOAT_TYPES
 from static_frame.core.util import INT_TYPES
 from static_frame.core.util import NULL_SLICE
 from static_frame.core.util import OPERATORS
@@ -40,12 +45,158 @@ LocEmptyInstance = LocEmpty()
 _ZERO_PAD_ARRAY = np.array([0], dtype=DTYPE_UINT_DEFAULT)
 _ZERO_PAD_ARRAY.flags.writeable = False
 
+# kinds for which a binary search into sorted labels is faster than hashing each label; Booleans are excluded as Boolean arrays are selections, strings as their comparison is not faster than hashing
+SORTED_LOOKUP_KINDS = frozenset(('i', 'u', 'f', 'M', 'm'))
+# kinds for which a list key is converted to an array for a binary search; datetime64 and timedelta64 are excluded as elements of different units are converted to a common unit
+SORTED_LOOKUP_LIST_KINDS = frozenset(('i', 'u', 'f'))
+# PERF: for shorter lists, hashing each label is faster than converting the list to an array
+SORTED_LOOKUP_LIST_COUNT_MIN = 4096
+
 
 class FirstDuplicatePosition(KeyError):
     def __init__(self, first_dup: int) -> None:
         self.first_dup = first_dup
 
 
+class FrozenAutoMapDeferred:
+    '''
+    A stand-in for the FrozenAutoMap of labels known to be unique, creating the map only on first use. Holders of this object can replace it with the result of `realize()`.
+    '''
+    __slots__ = (
+            '_labels',
+            '_map',
+            )
+
+    def __init__(self, labels: np.ndarray) -> None:
+        self._labels = labels
+        self._map: tp.Optional[FrozenAutoMap] = None
+
+    def realize(self) -> tp.Union[FrozenAutoMap, 'RangeMap']:
+        if self._map is None:
+            labels = self._labels
+            if labels.dtype.kind in RANGE_MAP_KINDS:
+                self._map = RangeMap.from_labels(labels)
+                if self._map is not None:
+                    return self._map
+            # PERF: as in Index, calling tolist is faster where NumPy dtypes are equivalent after conversion to Python objects
+            self._map = FrozenAutoMap(labels.tolist()
+                    if labels.dtype.kind in DTYPE_OBJECTABLE_KINDS else labels)
+        return self._map
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def __contains__(self, key: tp.Hashable) -> bool:
+        return self.realize().__contains__(key)
+
+    def __getitem__(self, key: tp.Hashable) -> int:
+        return self.realize().__getitem__(key) # type: ignore
+
+    def __iter__(self) -> tp.Iterator[tp.Hashable]:
+        return self.realize().__iter__() # type: ignore
+
+    def get(self, key: tp.Hashable, default: tp.Any = None) -> tp.Any:
+        return self.realize().get(key, default)
+
+
+RANGE_MAP_KINDS = frozenset(('i', 'u', 'M'))
+
+
+class RangeMap:
+    '''
+    An immutable mapping of evenly spaced, ascending integer or datetime64 labels to their positions. Positions are found arithmetically from the first label and the step, so no hash table is built; key matching follows that of a FrozenAutoMap of the same labels.
+    '''
+    __slots__ = (
+            '_labels',
+            '_start',
+            '_step',
+            '_is_int',
+            )
+
+    def __init__(self,
+            labels: np.ndarray,
+            start: int,
+            step: int,
+            ) -> None:
+        self._labels = labels
+        self._start = start
+        self._step = step
+        self._is_int = labels.dtype.kind in DTYPE_INT_KINDS
+
+    @classmethod
+    def from_labels(cls, labels: np.ndarray) -> tp.Optional['RangeMap']:
+        '''
+        Return a RangeMap if ``labels`` are evenly spaced and ascending, else None.
+        '''
+        if labels.dtype.kind in DTYPE_INT_KINDS:
+            values = labels
+        else: # datetime64
+            values = labels.view(DTYPE_INT_DEFAULT)
+        count = len(values)
+        if count == 0:
+            return None
+        start = int(values[0])
+        if count == 1:
+            return cls(labels, start, 1)
+        step = values[1] - values[0]
+        if step <= 0:
+            return None
+        # NOTE: NaT is the minimum int64, and any wrapped unsigned difference is not equal to step
+        if not (np.diff(values) == step).all():
+            return None
+        return cls(labels, start, int(step))
+
+    def _to_position(self, key: tp.Hashable) -> int:
+        '''Return the position of ``key``, or -1 if not found.'''
+        if self._is_int:
+            if key.__class__ is np.timedelta64:
+                value = int(key.astype(DTYPE_INT_DEFAULT)) #type: ignore
+            elif isinstance(key, INT_TYPES) or key.__class__ is np.bool_:
+                value = int(key) #type: ignore
+            elif isinstance(key, FLOAT_TYPES) or key.__class__ is complex:
+                # NOTE: as with hashing, numerically equal values match
+                try:
+                    value = int(key.real) #type: ignore
+                except (ValueError, OverflowError): # NaN, inf
+                    return -1
+                if value != key:
+                    return -1
+            else:
+                return -1
+        else:
+            # NOTE: as with a typed FrozenAutoMap, only matching datetime64 units are found
+            labels_dtype = self._labels.dtype
+            if key.__class__ is not labels_dtype.type or key.dtype != labels_dtype: #type: ignore
+                return -1
+            value = int(key.astype(DTYPE_INT_DEFAULT)) #type: ignore
+
+        pos, remainder = divmod(value - self._start, self._step)
+        if remainder or pos < 0 or pos >= len(self._labels):
+            return -1
+        return pos
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def __contains__(self, key: tp.Hashable) -> bool:
+        return self._to_position(key) >= 0
+
+    def __getitem__(self, key: tp.Hashable) -> int:
+        pos = self._to_position(key)
+        if pos < 0:
+            raise KeyError(key)
+        return pos
+
+    def __iter__(self) -> tp.Iterator[tp.Hashable]:
+        if self._is_int:
+            return iter(self._labels.tolist())
+        return iter(self._labels)
+
+    def get(self, key: tp.Hashable, default: tp.Any = None) -> tp.Any:
+        pos = self._to_position(key)
+        return default if pos < 0 else pos
+
+
 class LocMap:
 
     @staticmethod
@@ -53,11 +204,13 @@ class LocMap:
             label_to_pos: tp.Callable[[tp.Iterable[tp.Hashable]], int],
             key: slice,
             labels: tp.Optional[np.ndarray] = None,
+            labels_is_sorted: bool = False,
             ) -> tp.Iterator[tp.Union[int, None]]:
         '''Given a slice ``key`` and a label-to-position mapping, yield each integer argument necessary to create a new iloc slice. If the ``key`` defines a region with no constituents, raise ``LocEmpty``
 
         Args:
             label_to_pos: callable into mapping (can be a get() method from a dictionary)
+            labels_is_sorted: if True, ``labels`` are in ascending order, permitting datetime64 attrs of a different unit to be matched with a binary search.
         '''
         # NOTE: it is expected that NULL_SLICE is already identified
         labels_astype: tp.Optional[np.ndarray] = None
@@ -84,22 +237,34 @@ class LocMap:
                     # NOTE: as an optimization only for the start attr, we can try to convert attr to labels unit and see if there is a match; this avoids astyping the entire labels array
                     pos: TypePos = label_to_pos(attr.astype(labels.dtype)) #type: ignore
                     if pos is None: # we did not find a start position
-                        labels_astype = labels.astype(attr.dtype) #type: ignore
-                        matches = np.flatnonzero(labels_astype == attr)
-                        if len(matches):
-                            pos = matches[0]
+                        bounds = LocMap.datetime64_bounds(labels, attr) if labels_is_sorted else None # type: ignore
+                        if bounds is not None:
+                            if bounds[0] == bounds[1]:
+                                raise LocEmptyInstance
+                            pos = bounds[0]
                         else:
-                            raise LocEmptyInstance
+                            labels_astype = labels.astype(attr.dtype) #type: ignore
+                            matches = np.flatnonzero(labels_astype == attr)
+                            if len(matches):
+                                pos = matches[0]
+                            else:
+                                raise LocEmptyInstance
                 elif field is SLICE_STOP_ATTR:
                     # NOTE: we do not want to convert attr to labels dtype and take the match as we want to get the last of all possible matches of labels at the attr unit
-                    # NOTE: try to re-use labels_astype if possible
-                    if labels_astype is None or labels_astype.dtype != attr.dtype:
-                        labels_astype = labels.astype(attr.dtype) #type: ignore
-                    matches = np.flatnonzero(labels_astype == attr)
-                    if len(matches):
-                        pos = matches[-1] + 1
+                    bounds = LocMap.datetime64_bounds(labels, attr) if labels_is_sorted else None # type: ignore
+                    if bounds is not None:
+                        if bounds[0] == bounds[1]:
+                            raise LocEmptyInstance
+                        pos = bounds[1]
                     else:
-                        raise LocEmptyInstance
+                        # NOTE: try to re-use labels_astype if possible
+                        if labels_astype is None or labels_astype.dtype != attr.dtype:
+                            labels_astype = labels.astype(attr.dtype) #type: ignore
+                        matches = np.flatnonzero(labels_astype == attr)
+                        if len(matches):
+                            pos = matches[-1] + 1
+                        else:
+                            raise LocEmptyInstance
 
                 yield pos
 
@@ -125,12 +290,14 @@ class LocMap:
             positions: np.ndarray,
             key: GetItemKeyType,
             partial_selection: bool = False,
+            labels_is_sorted: bool = False,
             ) -> GetItemKeyType:
         '''
         Note: all SF objects (Series, Index) need to be converted to basic types before being passed as `key` to this function.
 
         Args:
             partial_selection: if True and key is an iterable of labels that includes labels not in the mapping, available matches will be returned rather than raising.
+            labels_is_sorted: if True, `labels` are in ascending order, permitting array keys (and lists of numbers) that can be compared to `labels` without conversion (see `is_sorted_lookup`), and datetime64 keys of a less granular unit, to be resolved with a binary search rather than with the mapping or a conversion of `labels`.
         Returns:
             An integer mapped slice, or GetItemKey type that is based on integers, compatible with TypeBlocks
         '''
@@ -143,8 +310,9 @@ class LocMap:
                 return slice(*cls.map_slice_args(
                         label_to_pos.get, #type: ignore
                         key,
-                        labels)
-                        )
+                        labels,
+                        labels_is_sorted,
+                        ))
             except LocEmpty:
                 return EMPTY_SLICE
 
@@ -156,6 +324,9 @@ class LocMap:
                     and np.datetime_data(key.dtype)[0] in DTYPE_OBJECTABLE_DT64_UNITS): #type: ignore
                 key = key.astype(DTYPE_OBJECT) #type: ignore
             elif labels_is_dt64 and key.dtype < labels.dtype: #type: ignore
+                bounds = cls.datetime64_bounds(labels, key) if labels_is_sorted else None # type: ignore
+                if bounds is not None:
+                    return positions[bounds[0]: bounds[1]]
                 key = labels.astype(key.dtype) == key #type: ignore
             # if not different type, keep it the same so as to do a direct, single element selection
 
@@ -177,6 +348,11 @@ class LocMap:
                     is_array = False
                     is_list = True
                 elif labels_is_dt64 and key.dtype < labels.dtype: #type: ignore
+                    # NOTE: unique keys of one unit match disjoint regions of labels, ordered as the keys
+                    bounds = cls.datetime64_bounds(labels, np.unique(key)) if labels_is_sorted else None # type: ignore
+                    if bounds is not None:
+                        return np.concatenate([positions[start: stop]
+                                for start, stop in zip(*bounds)])
                     # NOTE: change the labels to the dt64 dtype, i.e., if the key is years, recast the labels as years, and do a Boolean selection of everything that matches each key
                     labels_ref = labels.astype(key.dtype) # type: ignore
                     # NOTE: this is only correct if both key and labels are dt64, and key is a less granular unit, as the order in the key and will not be used
@@ -186,6 +362,25 @@ class LocMap:
             if is_array and key.dtype == DTYPE_BOOL: #type: ignore
                 return positions[key]
 
+            if labels_is_sorted:
+                key_sorted: tp.Optional[np.ndarray] = key if is_array else None # type: ignore
+                if (is_list
+                        and len(key) >= SORTED_LOOKUP_LIST_COUNT_MIN
+                        and labels.dtype.kind in SORTED_LOOKUP_LIST_KINDS):
+                    # PERF: a long list of numbers is resolved as an array; lists that do not convert to a 1D array of the kind of the labels are mapped per label
+                    try:
+                        key_sorted = np.array(key)
+                    except ValueError: # ragged nested sequences
+                        pass
+                if (key_sorted is not None
+                        and key_sorted.ndim == 1
+                        and cls.is_sorted_lookup(labels, key_sorted)):
+                    return cls.sorted_loc_to_iloc(
+                            labels=labels,
+                            key=key_sorted,
+                            partial_selection=partial_selection,
+                            )
+
             # map labels to integer positions, return a list of integer positions
             # NOTE: we may miss the opportunity to identify contiguous keys and extract a slice
             # NOTE: we do more branching here to optimize performance
@@ -197,6 +392,63 @@ class LocMap:
         return label_to_pos[key] #type: ignore
 
 
+    @staticmethod
+    def datetime64_bounds(
+            labels: np.ndarray,
+            key: tp.Union[np.datetime64, np.ndarray],
+            ) -> tp.Optional[tp.Tuple[tp.Any, tp.Any]]:
+        '''
+        For ascending datetime64 `labels`, return the start and stop positions of the labels that match `key` (a scalar or an array) at the unit of `key`, i.e., where `labels.astype(key.dtype) == key`, without converting `labels`. Returns None if the units do not permit a binary search.
+        '''
+        if (np.datetime_data(labels.dtype)[0] == 'W'
+                and np.datetime_data(key.dtype)[0] in ('Y', 'M')):
+            # years and months do not start on weeks, and cannot be compared as weeks
+            return None
+        # NOTE: NumPy compares datetime64 of different units at the more granular unit; a key of a less granular unit spans from its start to the start of the next key
+        return (labels.searchsorted(key, 'left'), labels.searchsorted(key + 1, 'left'))
+
+    @staticmethod
+    def is_sorted_lookup(
+            labels: np.ndarray,
+            key: np.ndarray,
+            ) -> bool:
+        '''
+        Return True if the array `key` can be resolved with a binary search into `labels`; this requires both to be of the same, non-object kind, with identical units for datetime64 and timedelta64, and no NaN in a float key.
+        '''
+        kind = key.dtype.kind
+        if kind != labels.dtype.kind or kind not in SORTED_LOOKUP_KINDS:
+            return False
+        if kind == 'f':
+            # NaN cannot be found by comparison
+            return not np.isnan(key).any()
+        if kind == 'M' or kind == 'm':
+            return key.dtype == labels.dtype # type: ignore
+        return True
+
+    @staticmethod
+    def sorted_loc_to_iloc(*,
+            labels: np.ndarray,
+            key: np.ndarray,
+            partial_selection: bool = False,
+            ) -> np.ndarray:
+        '''
+        Resolve an array of labels to an array of integer positions with a binary search into ascending, non-empty `labels`. As when mapping labels one at a time, the first label not found is raised in a KeyError, unless `partial_selection` is True.
+        '''
+        # PERF: searching with ordered keys is many times faster than with unordered keys, as memory access into labels is sequential
+        order = np.argsort(key)
+        iloc = np.empty(len(key), dtype=DTYPE_INT_DEFAULT)
+        iloc[order] = np.searchsorted(labels, key[order])
+        # keys greater than all labels are placed at the end; clip to compare with the last label
+        np.minimum(iloc, len(labels) - 1, out=iloc)
+
+        found = labels[iloc] == key
+        if found.all():
+            return iloc
+        if partial_selection:
+            return iloc[found]
+        raise KeyError(key[found.argmin()])
+
+
 class HierarchicalLocMap:
     '''
     A utility utilized by IndexHierarchy in order to quickly map keys to ilocs.
@@ -210,7 +462,7 @@ class HierarchicalLocMap:
 
     bit_offset_encoders: np.ndarray
     encoding_can_overflow: bool
-    encoded_indexer_map: FrozenAutoMap
+    encoded_indexer_map: tp.Union[FrozenAutoMap, AutoMap]
 
     def __init__(self: _HLMap,
             *,
@@ -236,6 +488,49 @@ class HierarchicalLocMap:
                     )
             raise ErrorInitIndexNonUnique(duplicate_labels) from None
 
+    def extend(self: _HLMap,
+            *,
+            indices: tp.List['Index'],
+            indexers: np.ndarray,
+            ) -> bool:
+        '''
+        Add, in-place, the encodings of ``indexers``, the indexers of labels appended after those already mapped. Returns False, without mutation, if the indices have grown such that all encodings must be rebuilt. This must only be called on a map that is not shared.
+        '''
+        if not len(self.encoded_indexer_map):
+            return False # an empty map has no encoding
+        # PERF: compare, in Python, to the offsets build_offsets_and_overflow would derive; for a count greater than zero, its bit length is floor(log2(count)) + 1
+        bit_end = 0
+        for index, bit_start in zip(indices, self.bit_offset_encoders.tolist()):
+            if bit_start != bit_end:
+                return False
+            bit_end += len(index).bit_length()
+        if (bit_end > 64) != self.encoding_can_overflow:
+            return False
+
+        if self.encoded_indexer_map.__class__ is not AutoMap:
+            # NOTE: converted once, so that subsequent extensions are in-place
+            self.encoded_indexer_map = AutoMap(self.encoded_indexer_map)
+
+        # See `build_encoded_indexers_map` for detailed comments.
+        if self.encoding_can_overflow:
+            encoded_indexers = indexers.astype(object).T
+        else:
+            encoded_indexers = indexers.astype(DTYPE_UINT_DEFAULT).T
+        encoded_indexers = np.bitwise_or.reduce(
+                encoded_indexers << self.bit_offset_encoders,
+                axis=1,
+                )
+        try:
+            self.encoded_indexer_map.update(encoded_indexers.tolist())
+        except ValueError as e:
+            [[first_dup, *_]] = np.nonzero(encoded_indexers == e.args[0])
+            duplicate_labels = tuple(
+                    index[indexer[first_dup]]
+                    for (index, indexer) in zip(indices, indexers)
+                    )
+            raise ErrorInitIndexNonUnique(duplicate_labels) from None
+        return True
+
     def __deepcopy__(self: _HLMap,
             memo: tp.Dict[int, tp.Any],
             ) -> _HLMap:
@@ -409,6 +704,57 @@ class HierarchicalLocMap:
         key_indexers = np.bitwise_or.reduce(key_indexers)
         return self.encoded_indexer_map[key_indexers] # type: ignore
 
+    def labels_to_iloc(self: _HLMap,
+            labels_per_depth: tp.Sequence[tp.List[tp.Hashable]],
+            indices: tp.List['Index'],
+            ) -> tp.List[int]:
+        '''
+        Resolve many fully-specified labels at once, where `labels_per_depth` provides, for each depth, a list of labels of equal length. Each depth is resolved with one lookup, then all rows are encoded and mapped together. Raises a single KeyError listing all labels not found.
+        '''
+        count = len(labels_per_depth[0])
+        indexers = np.empty((count, len(indices)), dtype=DTYPE_UINT_DEFAULT)
+        found: tp.Optional[np.ndarray] = None # only created when a label is missing
+
+        # 1. Perform label resolution, one depth at a time
+        for depth, (labels, index) in enumerate(zip(labels_per_depth, indices)):
+            try:
+                if index._DTYPE is None:
+                    indexers[:, depth] = index._loc_to_iloc(labels)
+                else:
+                    # NOTE: datetime64 indices transform keys; a collection of keys can be converted to a less-granular unit and produce a Boolean selection
+                    indexers[:, depth] = [index._loc_to_iloc(k) for k in labels]
+            except KeyError:
+                if found is None:
+                    found = np.full(count, True, dtype=DTYPE_BOOL)
+                for i, label in enumerate(labels):
+                    try:
+                        indexers[i, depth] = index._loc_to_iloc(label)
+                    except KeyError:
+                        found[i] = False
+
+        if self.encoding_can_overflow:
+            indexers = indexers.astype(DTYPE_OBJECT)
+
+        # 2. Encode the indexers. See `build_encoded_indexers_map` for detailed comments.
+        indexers <<= self.bit_offset_encoders
+        # NOTE: the map is built from Python ints; lookups with NumPy scalars are much slower
+        encoded_indexers = np.bitwise_or.reduce(indexers, axis=1).tolist()
+
+        # 3. Resolve all rows in one pass
+        if found is None:
+            try:
+                return list(map(self.encoded_indexer_map.__getitem__, encoded_indexers))
+            except KeyError:
+                found = np.full(count, True, dtype=DTYPE_BOOL)
+
+        get = self.encoded_indexer_map.get
+        missing = [
+                tuple(labels[i] for labels in labels_per_depth)
+                for i, (encoded, is_found) in enumerate(zip(encoded_indexers, found))
+                if not is_found or get(encoded) is None
+                ]
+        raise KeyError(missing)
+
     def indexers_to_iloc(self: _HLMap,
             indexers: np.ndarray,
             ) -> tp.List[int]:
@@ -421,4 +767,4 @@ class HierarchicalLocMap:
         indexers <<= self.bit_offset_encoders
 
         indexers = np.bitwise_or.reduce(indexers, axis=1)
-        return list(map(self.encoded_indexer_map.__getitem__, indexers))
+        return list(map(self.encoded_indexer_map.__getitem__, indexers.tolist()))
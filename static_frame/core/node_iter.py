@@ -3,8 +3,6 @@ Tools for iterators in Series and Frame. These components are imported by both s
 '''
 
 import typing as tp
-from concurrent.futures import ProcessPoolExecutor
-from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from functools import partial
 
@@ -20,6 +18,10 @@ from static_frame.core.util import IndexConstructor
 from static_frame.core.util import Mapping
 from static_frame.core.util import NameType
 from static_frame.core.util import TupleConstructorType
+from static_frame.core.util import UFunc
+from static_frame.core.util import array_group_count
+from static_frame.core.util import array_group_reduce
+from static_frame.core.util import array_group_select
 from static_frame.core.util import iterable_to_array_1d
 
 # import multiprocessing as mp
@@ -38,7 +40,6 @@ if tp.TYPE_CHECKING:
 
 
 FrameOrSeries = tp.TypeVar('FrameOrSeries', 'Frame', 'Series', 'Bus', 'Quilt', 'Yarn')
-PoolArgGen = tp.Callable[[], tp.Union[tp.Iterator[tp.Any], tp.Iterator[tp.Tuple[tp.Any, tp.Any]]]]
 # FrameSeriesIndex = tp.TypeVar('FrameSeriesIndex', 'Frame', 'Series', 'Index')
 
 
@@ -111,50 +112,55 @@ class IterNodeDelegate(tp.Generic[FrameOrSeries]):
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            cost: tp.Optional[tp.Callable[[tp.Any], float]] = None,
+            ordered: bool = True,
             ) -> tp.Iterator[tp.Tuple[tp.Any, tp.Any]]:
-
-        pool_executor = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+        from static_frame.core.pool import pool_items
 
         if not callable(func): # support array, Series mapping
             func = getattr(func, '__getitem__')
 
-        # use side effect list population to create keys when iterating over values
-        func_keys = []
-        arg_gen: PoolArgGen
-
+        items: tp.Iterable[tp.Tuple[tp.Any, tp.Any]]
         if self._yield_type is IterNodeType.VALUES:
-            def arg_gen() -> tp.Iterator[tp.Any]: #pylint: disable=E0102
-                for k, v in self._func_items():
-                    func_keys.append(k)
-                    yield v
+            items = self._func_items()
         else:
-            def arg_gen() -> tp.Iterator[tp.Tuple[tp.Any, tp.Any]]: #pylint: disable=E0102
-                for k, v in self._func_items():
-                    func_keys.append(k)
-                    yield k, v
-
-        with pool_executor(max_workers=max_workers) as executor:
-            yield from zip(func_keys,
-                    executor.map(func, arg_gen(), chunksize=chunksize)
-                    )
+            items = ((k, (k, v)) for k, v in self._func_items())
+
+        yield from pool_items(func,
+                items,
+                max_workers=max_workers,
+                chunksize=chunksize,
+                use_threads=use_threads,
+                cost=cost,
+                ordered=ordered,
+                )
 
     def _apply_iter_parallel(self,
             func: AnyCallable,
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
             use_threads: bool = False,
+            cost: tp.Optional[tp.Callable[[tp.Any], float]] = None,
             ) -> tp.Iterator[tp.Any]:
+        from static_frame.core.pool import pool_items
 
-        pool_executor = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
         if not callable(func): # support array, Series mapping
             func = getattr(func, '__getitem__')
 
-        # use side effect list population to create keys when iterating over values
-        arg_gen = (self._func_values if self._yield_type is IterNodeType.VALUES
-                else self._func_items)
+        items: tp.Iterable[tp.Tuple[tp.Any, tp.Any]]
+        if self._yield_type is IterNodeType.VALUES:
+            items = ((None, v) for v in self._func_values())
+        else:
+            items = ((None, pair) for pair in self._func_items())
 
-        with pool_executor(max_workers=max_workers) as executor:
-            yield from executor.map(func, arg_gen(), chunksize=chunksize)
+        for _, post in pool_items(func,
+                items,
+                max_workers=max_workers,
+                chunksize=chunksize,
+                use_threads=use_threads,
+                cost=cost,
+                ):
+            yield post
 
     #---------------------------------------------------------------------------
     @doc_inject(selector='apply')
@@ -233,7 +239,9 @@ class IterNodeDelegate(tp.Generic[FrameOrSeries]):
             index_constructor: tp.Optional[IndexConstructor]= None,
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
-            use_threads: bool = False
+            use_threads: bool = False,
+            cost: tp.Optional[tp.Callable[[tp.Any], float]] = None,
+            ordered: bool = True,
             ) -> FrameOrSeries:
         '''
         {doc} Employ parallel processing with either the ProcessPoolExecutor or ThreadPoolExecutor.
@@ -246,10 +254,15 @@ class IterNodeDelegate(tp.Generic[FrameOrSeries]):
             {max_workers}
             {chunksize}
             {use_threads}
+            {cost}
+            {ordered}
         '''
         # only use when we need pairs of values to dynamically create an Index
         if IterNodeApplyType.is_items(self._apply_type):
-            apply_func = self._apply_iter_items_parallel
+            apply_func = partial(self._apply_iter_items_parallel, ordered=ordered)
+        elif not ordered:
+            # NOTE: raise before creating the generator, as results not paired with labels must be yielded in order
+            raise RuntimeError('ordered cannot be False when results are not paired with labels')
         else:
             apply_func = self._apply_iter_parallel
         return self._apply_constructor(
@@ -257,6 +270,7 @@ class IterNodeDelegate(tp.Generic[FrameOrSeries]):
                         max_workers=max_workers,
                         chunksize=chunksize,
                         use_threads=use_threads,
+                        cost=cost,
                         ),
                 dtype=dtype,
                 name=name,
@@ -490,6 +504,140 @@ class IterNodeDelegateMapable(IterNodeDelegate[FrameOrSeries]):
                 index_constructor=index_constructor,
                 )
 
+
+class IterNodeDelegateReducible(IterNodeDelegate[FrameOrSeries]):
+    '''
+    Delegate returned from :obj:`static_frame.IterNode`, providing iteration, a family of apply methods, and reductions of each group or window to a row (or column) of a new container.
+    '''
+
+    __slots__ = (
+            '_func_reduce',
+            )
+
+    INTERFACE = IterNodeDelegate.INTERFACE + (
+            'count',
+            'first',
+            'last',
+            'max',
+            'mean',
+            'min',
+            'std',
+            'sum',
+            'var',
+            )
+
+    def __init__(self,
+            func_values: tp.Callable[..., tp.Iterable[tp.Any]],
+            func_items: tp.Callable[..., tp.Iterable[tp.Tuple[tp.Any, tp.Any]]],
+            yield_type: IterNodeType,
+            apply_constructor: tp.Callable[..., FrameOrSeries],
+            apply_type: IterNodeApplyType,
+            func_reduce: tp.Callable[..., FrameOrSeries],
+        ) -> None:
+        '''
+        Args:
+            func_reduce: Callable given a function of an array and the positions at which each group (or window) begins and ends, returning a container with a row (or column) per group.
+        '''
+        IterNodeDelegate.__init__(self,
+                func_values=func_values,
+                func_items=func_items,
+                yield_type=yield_type,
+                apply_constructor=apply_constructor,
+                apply_type=apply_type,
+                )
+        self._func_reduce = func_reduce
+
+    #---------------------------------------------------------------------------
+    # PERF: reductions are applied to the arrays of all groups (or windows) at once, rather than to a container created per group
+
+    def _reduce(self,
+            ufunc: UFunc,
+            ufunc_skipna: UFunc,
+            skipna: bool,
+            ) -> FrameOrSeries:
+        return self._func_reduce(func=partial(array_group_reduce,
+                skipna=skipna,
+                ufunc=ufunc,
+                ufunc_skipna=ufunc_skipna,
+                ))
+
+    def sum(self, *, skipna: bool = True) -> FrameOrSeries:
+        '''
+        Return a new container of the sum of each group.
+
+        Args:
+            skipna: skip NA (NaN, None) values.
+        '''
+        return self._reduce(np.sum, np.nansum, skipna)
+
+    def mean(self, *, skipna: bool = True) -> FrameOrSeries:
+        '''
+        Return a new container of the mean of each group.
+
+        Args:
+            skipna: skip NA (NaN, None) values.
+        '''
+        return self._reduce(np.mean, np.nanmean, skipna)
+
+    def min(self, *, skipna: bool = True) -> FrameOrSeries:
+        '''
+        Return a new container of the minimum of each group.
+
+        Args:
+            skipna: skip NA (NaN, None) values.
+        '''
+        return self._reduce(np.min, np.nanmin, skipna)
+
+    def max(self, *, skipna: bool = True) -> FrameOrSeries:
+        '''
+        Return a new container of the maximum of each group.
+
+        Args:
+            skipna: skip NA (NaN, None) values.
+        '''
+        return self._reduce(np.max, np.nanmax, skipna)
+
+    def std(self, *, skipna: bool = True, ddof: int = 0) -> FrameOrSeries:
+        '''
+        Return a new container of the standard deviation of each group.
+
+        Args:
+            skipna: skip NA (NaN, None) values.
+            ddof: delta degrees of freedom.
+        '''
+        return self._reduce(partial(np.std, ddof=ddof), partial(np.nanstd, ddof=ddof), skipna)
+
+    def var(self, *, skipna: bool = True, ddof: int = 0) -> FrameOrSeries:
+        '''
+        Return a new container of the variance of each group.
+
+        Args:
+            skipna: skip NA (NaN, None) values.
+            ddof: delta degrees of freedom.
+        '''
+        return self._reduce(partial(np.var, ddof=ddof), partial(np.nanvar, ddof=ddof), skipna)
+
+    def count(self, *, skipna: bool = True) -> FrameOrSeries:
+        '''
+        Return a new container of the count of values in each group.
+
+        Args:
+            skipna: do not count NA (NaN, None) values.
+        '''
+        return self._func_reduce(func=partial(array_group_count, skipna=skipna))
+
+    def first(self) -> FrameOrSeries:
+        '''
+        Return a new container of the first value of each group.
+        '''
+        return self._func_reduce(func=partial(array_group_select, last=False))
+
+    def last(self) -> FrameOrSeries:
+        '''
+        Return a new container of the last value of each group.
+        '''
+        return self._func_reduce(func=partial(array_group_select, last=True))
+
 #-------------------------------------------------------------------------------
 
 class IterNode(tp.Generic[FrameOrSeries]):
@@ -501,6 +649,7 @@ class IterNode(tp.Generic[FrameOrSeries]):
         '_container',
         '_func_values',
         '_func_items',
+        '_func_reduce',
         '_yield_type',
         '_apply_type',
         )
@@ -512,15 +661,18 @@ class IterNode(tp.Generic[FrameOrSeries]):
             function_items: tp.Callable[..., tp.Iterable[tp.Tuple[tp.Any, tp.Any]]],
             yield_type: IterNodeType,
             apply_type: IterNodeApplyType,
+            function_reduce: tp.Optional[tp.Callable[..., FrameOrSeries]] = None,
             ) -> None:
         '''
         Args:
             function_values: will be partialed with arguments given with __call__.
             function_items: will be partialed with arguments given with __call__.
+            function_reduce: will be partialed with arguments given with __call__; required for delegates that provide reductions.
         '''
         self._container: FrameOrSeries = container
         self._func_values = function_values
         self._func_items = function_items
+        self._func_reduce = function_reduce
         self._yield_type = yield_type
         self._apply_type = apply_type
 
@@ -730,6 +882,15 @@ class IterNode(tp.Generic[FrameOrSeries]):
             ) -> IterNodeDelegateMapable[FrameOrSeries]:
         return IterNodeDelegateMapable(**self._get_delegate_kwargs(**kwargs))
 
+    def get_delegate_reducible(self,
+            **kwargs: object,
+            ) -> IterNodeDelegateReducible[FrameOrSeries]:
+        assert self._func_reduce is not None
+        return IterNodeDelegateReducible(
+                func_reduce=partial(self._func_reduce, **kwargs),
+                **self._get_delegate_kwargs(**kwargs),
+                )
+
 #-------------------------------------------------------------------------------
 # specialize IterNode based on arguments given to __call__
 
@@ -807,14 +968,15 @@ class IterNodeGroupAxis(IterNode[FrameOrSeries]):
     '''
 
     __slots__ = ()
+    CLS_DELEGATE = IterNodeDelegateReducible
 
     def __call__(self,
             key: KEY_ITERABLE_TYPES, # type: ignore
             *,
             axis: int = 0,
             drop: bool = False,
-            ) -> IterNodeDelegate[FrameOrSeries]:
-        return IterNode.get_delegate(self, key=key, axis=axis, drop=drop)
+            ) -> IterNodeDelegateReducible[FrameOrSeries]:
+        return IterNode.get_delegate_reducible(self, key=key, axis=axis, drop=drop)
 
 
 class IterNodeDepthLevel(IterNode[FrameOrSeries]):
@@ -842,6 +1004,7 @@ class IterNodeDepthLevelAxis(IterNode[FrameOrSeries]):
 class IterNodeWindow(IterNode[FrameOrSeries]):
 
     __slots__ = ()
+    CLS_DELEGATE = IterNodeDelegateReducible
 
     def __call__(self, *,
             size: int,
@@ -853,8 +1016,8 @@ class IterNodeWindow(IterNode[FrameOrSeries]):
             label_shift: int = 0,
             start_shift: int = 0,
             size_increment: int = 0,
-            ) -> IterNodeDelegate[FrameOrSeries]:
-        return IterNode.get_delegate(self,
+            ) -> IterNodeDelegateReducible[FrameOrSeries]:
+        return IterNode.get_delegate_reducible(self,
                 axis=axis,
                 size=size,
                 step=step,
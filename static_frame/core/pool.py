@@ -0,0 +1,377 @@
+'''
+Tools for parallel execution with the ThreadPoolExecutor or ProcessPoolExecutor. When using processes, :obj:`Frame`, :obj:`Series`, and arrays are transported to and from workers via ``multiprocessing.shared_memory``, such that only small descriptors (with index, columns, dtypes, and segment names) are pickled.
+'''
+
+import os
+import typing as tp
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from static_frame.core.frame import Frame
+from static_frame.core.index_base import IndexBase
+from static_frame.core.series import Series
+from static_frame.core.type_blocks import TypeBlocks
+from static_frame.core.util import DTYPE_OBJECT
+from static_frame.core.util import AnyCallable
+
+# arrays with fewer bytes than this are pickled with the descriptor
+SHARED_MEMORY_NBYTES_MIN = 1 << 18
+
+ItemsLabelValue = tp.Iterator[tp.Tuple[tp.Hashable, tp.Any]]
+Segments = tp.List[SharedMemory]
+
+#-------------------------------------------------------------------------------
+class ArrayDescriptor(tp.NamedTuple):
+    '''
+    Defines the shared memory segment that holds an array.
+    '''
+    name: str
+    dtype: np.dtype
+    shape: tp.Tuple[int, ...]
+
+ArrayPayload = tp.Union[ArrayDescriptor, np.ndarray]
+
+class FrameDescriptor(tp.NamedTuple):
+    '''
+    Defines the necessary objects to construct a Frame from shared memory segments.
+    '''
+    cls: tp.Type[Frame]
+    blocks: tp.Tuple[ArrayPayload, ...]
+    shape: tp.Tuple[int, int]
+    index: IndexBase
+    columns: IndexBase
+    name: tp.Hashable
+
+class SeriesDescriptor(tp.NamedTuple):
+    '''
+    Defines the necessary objects to construct a Series from a shared memory segment.
+    '''
+    cls: tp.Type[Series]
+    values: ArrayPayload
+    index: IndexBase
+    name: tp.Hashable
+
+#-------------------------------------------------------------------------------
+def array_encode(
+        array: np.ndarray,
+        segments: Segments,
+        nbytes_min: int = SHARED_MEMORY_NBYTES_MIN,
+        ) -> ArrayPayload:
+    '''
+    Copy ``array`` into a new shared memory segment, appending the segment to ``segments``, and return an :obj:`ArrayDescriptor`. Object arrays, and arrays smaller than ``nbytes_min``, are returned unchanged.
+    '''
+    if array.dtype == DTYPE_OBJECT or array.nbytes == 0 or array.nbytes < nbytes_min:
+        return array
+    shm = SharedMemory(create=True, size=array.nbytes)
+    segments.append(shm)
+    dst: np.ndarray = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+    np.copyto(dst, array, casting='no')
+    del dst # release the exported buffer
+    return ArrayDescriptor(shm.name, array.dtype, array.shape) # pylint: disable=E1121
+
+def array_decode(
+        payload: ArrayPayload,
+        *,
+        unlink: bool,
+        ) -> np.ndarray:
+    '''
+    Return an immutable array copied out of the shared memory segment defined by ``payload``; if ``unlink``, the segment is removed after copying.
+    '''
+    if payload.__class__ is not ArrayDescriptor:
+        return payload # type: ignore
+    shm = SharedMemory(name=payload.name) # type: ignore
+    try:
+        src: np.ndarray = np.ndarray(payload.shape, # type: ignore
+                dtype=payload.dtype, # type: ignore
+                buffer=shm.buf,
+                )
+        array = src.copy()
+        del src
+    finally:
+        shm.close()
+        if unlink:
+            shm.unlink()
+    array.flags.writeable = False
+    return array
+
+def transport_encode(
+        value: tp.Any,
+        segments: Segments,
+        nbytes_min: int = SHARED_MEMORY_NBYTES_MIN,
+        ) -> tp.Any:
+    '''
+    Replace :obj:`Frame`, :obj:`Series`, and arrays (or such values found in a tuple) with descriptors of shared memory segments. Created segments are appended to ``segments``; all other values are returned unchanged.
+    '''
+    if value.__class__ is tuple:
+        return tuple(transport_encode(v, segments, nbytes_min) for v in value)
+    if value.__class__ is np.ndarray:
+        return array_encode(value, segments, nbytes_min)
+    if isinstance(value, Frame):
+        blocks = value._blocks
+        return FrameDescriptor( # pylint: disable=E1121
+                value.__class__,
+                tuple(array_encode(b, segments, nbytes_min) for b in blocks._blocks),
+                blocks.shape,
+                value._index,
+                value._columns,
+                value._name,
+                )
+    if isinstance(value, Series):
+        return SeriesDescriptor( # pylint: disable=E1121
+                value.__class__,
+                array_encode(value.values, segments, nbytes_min),
+                value._index,
+                value._name,
+                )
+    return value
+
+def transport_decode(
+        payload: tp.Any,
+        *,
+        unlink: bool,
+        ) -> tp.Any:
+    '''
+    Inverse of :obj:`transport_encode`. If ``unlink``, shared memory segments are removed after reading; this must only be done by the process that consumes the payload last.
+    '''
+    cls = payload.__class__
+    if cls is tuple:
+        return tuple(transport_decode(v, unlink=unlink) for v in payload)
+    if cls is ArrayDescriptor:
+        return array_decode(payload, unlink=unlink)
+    if cls is FrameDescriptor:
+        blocks = TypeBlocks.from_blocks(
+                (array_decode(b, unlink=unlink) for b in payload.blocks),
+                shape_reference=payload.shape,
+                )
+        return payload.cls(blocks,
+                index=payload.index,
+                columns=payload.columns,
+                name=payload.name,
+                own_data=True,
+                own_index=True,
+                own_columns=True,
+                )
+    if cls is SeriesDescriptor:
+        return payload.cls(array_decode(payload.values, unlink=unlink),
+                index=payload.index,
+                name=payload.name,
+                own_index=True,
+                )
+    return payload
+
+def transport_unlink(payload: tp.Any) -> None:
+    '''
+    Remove all shared memory segments referenced by ``payload`` without reading them.
+    '''
+    cls = payload.__class__
+    if cls is tuple:
+        for v in payload:
+            transport_unlink(v)
+    elif cls is ArrayDescriptor:
+        try:
+            shm = SharedMemory(name=payload.name)
+        except FileNotFoundError:
+            return
+        shm.close()
+        shm.unlink()
+    elif cls is FrameDescriptor:
+        for b in payload.blocks:
+            transport_unlink(b)
+    elif cls is SeriesDescriptor:
+        transport_unlink(payload.values)
+
+def segments_release(
+        segments: Segments,
+        *,
+        unlink: bool = True,
+        ) -> None:
+    '''
+    Close, and optionally unlink, all ``segments``.
+    '''
+    for shm in segments:
+        shm.close()
+        if unlink:
+            try:
+                shm.unlink()
+            except FileNotFoundError: # already removed by a consumer
+                pass
+    segments.clear()
+
+#-------------------------------------------------------------------------------
+class PoolCall:
+    '''
+    Picklable callable that applies ``func`` to each payload in a chunk within a pool worker, decoding arguments from, and encoding results to, shared memory if ``transport`` is True.
+    '''
+    __slots__ = (
+            'func',
+            'transport',
+            'nbytes_min',
+            )
+
+    def __init__(self,
+            func: AnyCallable,
+            *,
+            transport: bool,
+            nbytes_min: int = SHARED_MEMORY_NBYTES_MIN,
+            ) -> None:
+        self.func = func
+        self.transport = transport
+        self.nbytes_min = nbytes_min
+
+    def __call__(self, payloads: tp.Sequence[tp.Any]) -> tp.List[tp.Any]:
+        if not self.transport:
+            return [self.func(p) for p in payloads]
+
+        post = []
+        segments: Segments = []
+        try:
+            for payload in payloads:
+                # the parent owns, and will unlink, segments of arguments
+                arg = transport_decode(payload, unlink=False)
+                post.append(transport_encode(self.func(arg), segments, self.nbytes_min))
+        except:
+            segments_release(segments, unlink=True)
+            raise
+        # the parent will unlink these segments after reading them
+        segments_release(segments, unlink=False)
+        return post
+
+
+def cost_nbytes(value: tp.Any) -> int:
+    '''
+    Estimate the cost of processing ``value`` by the bytes of :obj:`Frame`, :obj:`Series`, and arrays (or such values found in a tuple).
+    '''
+    if value.__class__ is tuple:
+        return sum(cost_nbytes(v) for v in value)
+    if value.__class__ is np.ndarray or isinstance(value, (Frame, Series)):
+        return value.nbytes # type: ignore
+    return 0
+
+
+def pool_items(
+        func: AnyCallable,
+        items: tp.Iterable[tp.Tuple[tp.Hashable, tp.Any]],
+        *,
+        max_workers: tp.Optional[int] = None,
+        chunksize: int = 1,
+        use_threads: bool = False,
+        exception: tp.Union[tp.Type[Exception], tp.Tuple[()]] = (),
+        cost: tp.Optional[tp.Callable[[tp.Any], float]] = None,
+        ordered: bool = True,
+        ) -> ItemsLabelValue:
+    '''
+    Apply ``func`` to the value of each pair in ``items`` with a pool executor, yielding pairs of label and result. Work is submitted in chunks of ``chunksize``; as chunks complete, new chunks are submitted, with a bounded number in flight, such that idle workers always take the next available chunk and ``items`` is consumed incrementally. When using processes, values and results are transported via shared memory.
+
+    Args:
+        exception: if provided, a chunk that raises this exception will be omitted; usage requires a ``chunksize`` of 1.
+        cost: if provided, a function that, given a value, returns its estimated cost; ``items`` will be fully realized and submitted in descending cost order such that the most expensive work does not start last.
+        ordered: if True, results are yielded in the order of ``items``; if False, results are yielded in order of completion.
+    '''
+    if chunksize < 1:
+        raise ValueError('chunksize must be >= 1')
+
+    transport = not use_threads
+    pool_executor = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+    caller = PoolCall(func, transport=transport)
+    window = (max_workers or os.cpu_count() or 1) * 2
+
+    work: tp.Iterator[tp.Tuple[int, tp.Tuple[tp.Hashable, tp.Any]]]
+    if cost is None:
+        work = enumerate(items)
+        # when submission follows the order of items, limit results held for ordering
+        count_max = window * chunksize if ordered else None
+    else:
+        items = list(items)
+        costs = [cost(value) for _, value in items]
+        order = sorted(range(len(items)), key=costs.__getitem__, reverse=True)
+        work = ((i, items[i]) for i in order)
+        # the first item might be submitted last; cannot limit results held for ordering
+        count_max = None
+
+    # map of future to positions, labels, and segments of arguments
+    in_flight: tp.Dict[Future, tp.Tuple[tp.List[int], tp.List[tp.Hashable], Segments]] = {}
+    count_in_flight = 0
+    # map of position to pair of label and result, or None if omitted
+    results: tp.Dict[int, tp.Optional[tp.Tuple[tp.Hashable, tp.Any]]] = {}
+    position_next = 0
+
+    def submit(executor: tp.Any) -> bool:
+        '''Submit the next chunk of work; return False if work is exhausted.
+        '''
+        nonlocal count_in_flight
+        positions: tp.List[int] = []
+        labels: tp.List[tp.Hashable] = []
+        payloads: tp.List[tp.Any] = []
+        segments: Segments = []
+        try:
+            for position, (label, value) in work:
+                positions.append(position)
+                labels.append(label)
+                payloads.append(transport_encode(value, segments) if transport else value)
+                if len(positions) == chunksize:
+                    break
+        except:
+            segments_release(segments)
+            raise
+        if not positions:
+            return False
+        in_flight[executor.submit(caller, payloads)] = (positions, labels, segments)
+        count_in_flight += len(positions)
+        return True
+
+    def complete(future: Future) -> tp.Iterator[tp.Tuple[int, tp.Optional[tp.Tuple[tp.Hashable, tp.Any]]]]:
+        nonlocal count_in_flight
+        positions, labels, segments = in_flight.pop(future)
+        count_in_flight -= len(positions)
+        try:
+            post = future.result()
+        except exception:
+            for position in positions:
+                yield position, None
+            return
+        finally:
+            segments_release(segments)
+        if transport:
+            post = [transport_decode(payload, unlink=True) for payload in post]
+        yield from zip(positions, zip(labels, post))
+
+    with pool_executor(max_workers=max_workers) as executor:
+        try:
+            exhausted = False
+            while True:
+                while (not exhausted
+                        and len(in_flight) < window
+                        and (count_max is None or count_in_flight + len(results) < count_max)
+                        ):
+                    exhausted = not submit(executor)
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for position, pair in complete(future):
+                        if not ordered:
+                            if pair is not None:
+                                yield pair
+                        else:
+                            results[position] = pair
+                while position_next in results:
+                    pair = results.pop(position_next)
+                    position_next += 1
+                    if pair is not None:
+                        yield pair
+        finally:
+            # if not exhausted, release segments of both arguments and any results
+            for future, (_, _, segments) in in_flight.items():
+                if not future.cancel() and transport:
+                    try:
+                        transport_unlink(tuple(future.result()))
+                    except Exception: # pylint: disable=W0703
+                        pass
+                segments_release(segments)
+            in_flight.clear()
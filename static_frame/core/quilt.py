@@ -10,6 +10,7 @@ from static_frame.core.axis_map import get_extractor
 from static_frame.core.bus import Bus
 from static_frame.core.container import ContainerBase
 from static_frame.core.container_util import axis_window_items
+from static_frame.core.container_util import axis_window_reduce
 from static_frame.core.display import Display
 from static_frame.core.display import DisplayHeader
 from static_frame.core.display_config import DisplayConfig
@@ -48,6 +49,7 @@ from static_frame.core.util import NULL_SLICE
 from static_frame.core.util import AnyCallable
 from static_frame.core.util import GetItemKeyType
 from static_frame.core.util import GetItemKeyTypeCompound
+from static_frame.core.util import GroupReduceType
 from static_frame.core.util import NameType
 from static_frame.core.util import PathSpecifier
 from static_frame.core.util import concat_resolved
@@ -875,6 +877,34 @@ class Quilt(ContainerBase, StoreClientMixin):
                 as_array=as_array
                 ))
 
+    def _axis_window_reduce(self, *,
+            size: int,
+            axis: int = 0,
+            step: int = 1,
+            window_sized: bool = True,
+            window_func: tp.Optional[AnyCallable] = None,
+            window_valid: tp.Optional[AnyCallable] = None,
+            label_shift: int = 0,
+            start_shift: int = 0,
+            size_increment: int = 0,
+            as_array: bool = False,
+            func: GroupReduceType,
+            ) -> 'Frame':
+        return axis_window_reduce(
+                source=self.to_frame(),
+                axis=axis,
+                size=size,
+                step=step,
+                window_sized=window_sized,
+                window_func=window_func,
+                window_valid=window_valid,
+                label_shift=label_shift,
+                start_shift=start_shift,
+                size_increment=size_increment,
+                as_array=as_array,
+                func=func,
+                ) #type: ignore
+
     #---------------------------------------------------------------------------
     def _extract_array(self,
             row_key: GetItemKeyType = None,
@@ -1257,6 +1287,7 @@ class Quilt(ContainerBase, StoreClientMixin):
                 function_items=function_items,
                 yield_type=IterNodeType.VALUES,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
+                function_reduce=partial(self._axis_window_reduce, as_array=False),
                 )
 
     @property #type: ignore
@@ -1277,6 +1308,7 @@ class Quilt(ContainerBase, StoreClientMixin):
                 function_items=function_items,
                 yield_type=IterNodeType.ITEMS,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
+                function_reduce=partial(self._axis_window_reduce, as_array=False),
                 )
 
     @property #type: ignore
@@ -1297,6 +1329,7 @@ class Quilt(ContainerBase, StoreClientMixin):
                 function_items=function_items,
                 yield_type=IterNodeType.VALUES,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
+                function_reduce=partial(self._axis_window_reduce, as_array=True),
                 )
 
     @property #type: ignore
@@ -1317,6 +1350,7 @@ class Quilt(ContainerBase, StoreClientMixin):
                 function_items=function_items,
                 yield_type=IterNodeType.ITEMS,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
+                function_reduce=partial(self._axis_window_reduce, as_array=True),
                 )
 
     #---------------------------------------------------------------------------
@@ -16,6 +16,7 @@ from static_frame.core.assign import Assign
 from static_frame.core.container import ContainerOperand
 from static_frame.core.container_util import apply_binary_operator
 from static_frame.core.container_util import axis_window_items
+from static_frame.core.container_util import axis_window_reduce
 from static_frame.core.container_util import get_col_fill_value_factory
 from static_frame.core.container_util import index_from_optional_constructor
 from static_frame.core.container_util import index_many_concat
@@ -76,6 +77,7 @@ from static_frame.core.util import BoolOrBools
 from static_frame.core.util import DepthLevelSpecifier
 from static_frame.core.util import DtypeSpecifier
 from static_frame.core.util import GetItemKeyType
+from static_frame.core.util import GroupReduceType
 from static_frame.core.util import IndexConstructor
 from static_frame.core.util import IndexInitializer
 from static_frame.core.util import NameType
@@ -85,6 +87,7 @@ from static_frame.core.util import UFunc
 from static_frame.core.util import argmax_1d
 from static_frame.core.util import argmin_1d
 from static_frame.core.util import array_deepcopy
+from static_frame.core.util import array_for_sort
 from static_frame.core.util import array_shift
 from static_frame.core.util import array_to_duplicated
 from static_frame.core.util import array_to_groups_and_locations
@@ -103,6 +106,7 @@ from static_frame.core.util import isfalsy_array
 from static_frame.core.util import isin
 from static_frame.core.util import isna_array
 from static_frame.core.util import iterable_to_array_1d
+from static_frame.core.util import locations_to_positions
 from static_frame.core.util import slices_from_targets
 from static_frame.core.util import ufunc_unique1d
 from static_frame.core.util import write_optional_file
@@ -895,6 +899,7 @@ class Series(ContainerOperand):
                 function_items=function_items,
                 yield_type=IterNodeType.VALUES,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
+                function_reduce=partial(self._axis_window_reduce, as_array=False),
                 )
 
     @property
@@ -907,6 +912,7 @@ class Series(ContainerOperand):
                 function_items=function_items,
                 yield_type=IterNodeType.ITEMS,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
+                function_reduce=partial(self._axis_window_reduce, as_array=False),
                 )
 
 
@@ -920,6 +926,7 @@ class Series(ContainerOperand):
                 function_items=function_items,
                 yield_type=IterNodeType.VALUES,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
+                function_reduce=partial(self._axis_window_reduce, as_array=True),
                 )
 
     @property
@@ -932,6 +939,7 @@ class Series(ContainerOperand):
                 function_items=function_items,
                 yield_type=IterNodeType.ITEMS,
                 apply_type=IterNodeApplyType.SERIES_ITEMS,
+                function_reduce=partial(self._axis_window_reduce, as_array=True),
                 )
     #---------------------------------------------------------------------------
     # index manipulation
@@ -1597,13 +1605,8 @@ class Series(ContainerOperand):
         Args:
             dtypes: not used, part of signature for a common interface
         '''
-        values = array_ufunc_axis_skipna(
-                array=self.values,
-                skipna=skipna,
-                axis=0,
-                ufunc=ufunc,
-                ufunc_skipna=ufunc_skipna
-                )
+        # NOTE: array_ufunc_axis_skipna is not used, as its handling of NA in object arrays does not retain shape
+        values = (ufunc_skipna if skipna else ufunc)(self.values, axis=0)
         values.flags.writeable = False
         return self.__class__(values, index=self._index)
 
@@ -1861,8 +1864,7 @@ class Series(ContainerOperand):
 
         func = self.values.__getitem__ if as_array else self._extract_iloc
 
-        for idx, g in enumerate(groups):
-            selection = locations == idx
+        for g, selection in zip(groups, locations_to_positions(locations, len(groups))):
             yield g, func(selection)
 
     def _axis_group(self, *,
@@ -1900,8 +1902,7 @@ class Series(ContainerOperand):
 
         func = self.values.__getitem__ if as_array else self._extract_iloc
 
-        for idx, g in enumerate(groups):
-            selection = locations == idx
+        for g, selection in zip(groups, locations_to_positions(locations, len(groups))):
             if group_to_tuple:
                 g = tuple(g)
             yield g, func(selection)
@@ -1971,6 +1972,34 @@ class Series(ContainerOperand):
                 as_array=as_array
                 ))
 
+    def _axis_window_reduce(self, *,
+            size: int,
+            axis: int = 0,
+            step: int = 1,
+            window_sized: bool = True,
+            window_func: tp.Optional[AnyCallable] = None,
+            window_valid: tp.Optional[AnyCallable] = None,
+            label_shift: int = 0,
+            start_shift: int = 0,
+            size_increment: int = 0,
+            as_array: bool = False,
+            func: GroupReduceType,
+            ) -> 'Series':
+        return axis_window_reduce(
+                source=self,
+                axis=axis,
+                size=size,
+                step=step,
+                window_sized=window_sized,
+                window_func=window_func,
+                window_valid=window_valid,
+                label_shift=label_shift,
+                start_shift=start_shift,
+                size_increment=size_increment,
+                as_array=as_array,
+                func=func,
+                ) #type: ignore
+
     #---------------------------------------------------------------------------
 
     @property
@@ -2099,7 +2128,7 @@ class Series(ContainerOperand):
             raise RuntimeError('Multiple ascending values not permitted.')
 
         # argsort lets us do the sort once and reuse the results
-        order = np.argsort(cfs_values, kind=kind)
+        order = np.argsort(array_for_sort(cfs_values), kind=kind)
         if not ascending:
             order = order[::-1]
 
@@ -1,5 +1,6 @@
 import os
 import pickle
+import threading
 import typing as tp
 import zipfile
 from concurrent.futures import ProcessPoolExecutor
@@ -11,6 +12,7 @@ from static_frame.core.archive_npy import ArchiveZipWrapper
 from static_frame.core.container_util import container_to_exporter_attr
 from static_frame.core.exception import ErrorNPYEncode
 from static_frame.core.frame import Frame
+from static_frame.core.pool import pool_items
 from static_frame.core.store import Store
 from static_frame.core.store import store_coherent_non_write
 from static_frame.core.store import store_coherent_write
@@ -29,14 +31,47 @@ FrameConstructor = tp.Callable[[tp.Any], Frame]
 LabelAndBytes = tp.Tuple[tp.Hashable, tp.Union[str, bytes]]
 IteratorItemsLabelOptionalFrame = tp.Iterator[tp.Tuple[tp.Hashable, tp.Optional[Frame]]]
 
-class PayloadBytesToFrame(tp.NamedTuple):
+#-------------------------------------------------------------------------------
+# the ZipFile most recently opened to read payloads in this process, keyed by path, modification time, and size
+
+_ZIP_FILE_CACHE: tp.Dict[tp.Tuple[str, int, int], zipfile.ZipFile] = {}
+_ZIP_FILE_CACHE_LOCK = threading.Lock()
+
+def zip_file_cached(fp: str) -> zipfile.ZipFile:
+    '''
+    Return an open ZipFile for ``fp``, reusing the ZipFile most recently opened in this process if ``fp`` has not since been modified. Opening a ZipFile parses the central directory of the archive; reusing it permits a pool worker to read many members with a single parse.
+    '''
+    stat = os.stat(fp)
+    key = (fp, stat.st_mtime_ns, stat.st_size)
+    with _ZIP_FILE_CACHE_LOCK:
+        zf = _ZIP_FILE_CACHE.get(key)
+        if zf is None:
+            # a released ZipFile is closed when no longer referenced
+            _ZIP_FILE_CACHE.clear()
+            zf = zipfile.ZipFile(fp)
+            _ZIP_FILE_CACHE[key] = zf
+    return zf
+
+def zip_file_cache_release() -> None:
+    '''
+    Release the ZipFile retained by :obj:`zip_file_cached`. Pool worker processes release it on exit; the calling process must release it when reading is complete.
+    '''
+    with _ZIP_FILE_CACHE_LOCK:
+        _ZIP_FILE_CACHE.clear()
+
+#-------------------------------------------------------------------------------
+
+class PayloadLabelToFrame(tp.NamedTuple):
     '''
-    Defines the necessary objects to construct a Frame. Used for multiprocessing.
+    Defines the necessary objects to read and construct a Frame, such that reading is done by the recipient. Used for multiprocessing.
     '''
-    src: bytes
+    fp: str
+    label_encoded: str
     name: tp.Hashable
     config: StoreConfigHE
     constructor: FrameConstructor
+    container_type: tp.Type[Frame]
+    nbytes: int = 0 # uncompressed size of the stored file, if known
 
 class PayloadFrameToBytes(tp.NamedTuple):
     '''
@@ -68,16 +103,19 @@ class _StoreZip(Store):
         raise NotImplementedError
 
     @classmethod
-    def _payload_to_frame(cls, payload: PayloadBytesToFrame) -> Frame:
+    def _payload_to_frame(cls, payload: PayloadLabelToFrame) -> Frame:
         '''
-        Single argument wrapper for _build_frame().
+        Single argument wrapper for _build_frame(), reading from the zip file in the calling process. The open zip file is retained for reading subsequent payloads in the same process.
         '''
-        return cls._build_frame(
-                src=payload.src,
+        zf = zip_file_cached(payload.fp)
+        src: bytes = zf.read(payload.label_encoded + cls._EXT_CONTAINED)
+        frame = cls._build_frame(
+                src=src,
                 name=payload.name,
                 config=payload.config,
                 constructor=payload.constructor,
                 )
+        return cls._set_container_type(frame, payload.container_type)
 
     @staticmethod
     def _set_container_type(frame: Frame, container_type: tp.Type[Frame]) -> Frame:
@@ -104,6 +142,44 @@ class _StoreZip(Store):
                 # always use default decoder
                 yield config_map.default.label_decode(name)
 
+    def _label_to_payload(self,
+            label: tp.Hashable,
+            *,
+            config_map: StoreConfigMap,
+            constructor: FrameConstructor,
+            container_type: tp.Type[Frame],
+            ) -> PayloadLabelToFrame:
+        return PayloadLabelToFrame( # pylint: disable=no-value-for-parameter
+                fp=self._fp,
+                label_encoded=config_map.default.label_encode(label),
+                name=label,
+                config=config_map[label].to_store_config_he(),
+                constructor=constructor,
+                container_type=container_type,
+                )
+
+    @store_coherent_non_write
+    def _read_many_payloads(self,
+            labels: tp.Iterable[tp.Hashable],
+            *,
+            config: StoreConfigMapInitializer = None,
+            container_type: tp.Type[Frame] = Frame,
+            ) -> tp.Iterator[PayloadLabelToFrame]:
+        '''
+        Return an iterator of payloads, one per label, that can be passed to ``_payload_to_frame()`` in another process (or thread) to read and construct a Frame. Payloads include the uncompressed size of each stored file to support estimating the cost of reading.
+        '''
+        config_map = StoreConfigMap.from_initializer(config)
+        constructor = self._container_type_to_constructor(container_type)
+        with zipfile.ZipFile(self._fp) as zf:
+            for label in labels:
+                payload = self._label_to_payload(label,
+                        config_map=config_map,
+                        constructor=constructor,
+                        container_type=container_type,
+                        )
+                info = zf.getinfo(payload.label_encoded + self._EXT_CONTAINED)
+                yield payload._replace(nbytes=info.file_size)
+
     @store_coherent_non_write
     def _read_many_single_thread(self,
             labels: tp.Iterable[tp.Hashable],
@@ -191,39 +267,37 @@ class _StoreZip(Store):
                 yield frame
             return
 
-        def gen() -> tp.Iterator[PayloadBytesToFrame]:
+        def items() -> tp.Iterator[tp.Tuple[tp.Hashable, PayloadLabelToFrame]]:
             '''
             This method is synchronized with the following `for label in results_items` loop, as they both share the same necessary & initial condition: `if cached_frame is not None`.
             '''
-            with zipfile.ZipFile(self._fp) as zf:
-                for label, cached_frame in results_items():
-                    if cached_frame is not None:
-                        continue
-
-                    c: StoreConfig = config_map[label]
-                    label_encoded: str = config_map.default.label_encode(label)
-                    src: bytes = zf.read(label_encoded + self._EXT_CONTAINED)
-
-                    yield PayloadBytesToFrame( # pylint: disable=no-value-for-parameter
-                            src=src,
-                            name=label,
-                            config=c.to_store_config_he(),
+            for label, cached_frame in results_items():
+                if cached_frame is None:
+                    yield label, self._label_to_payload(label,
+                            config_map=config_map,
                             constructor=constructor,
+                            container_type=container_type,
                             )
 
-        chunksize = config_map.default.read_chunksize
-
-        with ProcessPoolExecutor(max_workers=config_map.default.read_max_workers) as executor:
-            frame_gen = executor.map(self._payload_to_frame, gen(), chunksize=chunksize)
-
+        # NOTE: workers read from the zip file; Frames are returned via shared memory
+        frame_items = pool_items(self._payload_to_frame,
+                items(),
+                max_workers=config_map.default.read_max_workers,
+                chunksize=config_map.default.read_chunksize,
+                )
+        try:
             for label, cached_frame in results_items():
                 if cached_frame is not None:
                     yield cached_frame
                 else:
-                    frame = next(frame_gen)
+                    _, frame = next(frame_items)
                     # Newly read frame, add it to our weak_cache
                     self._weak_cache[label] = frame
                     yield frame
+        finally:
+            frame_items.close()
+            # if using threads, the zip file was opened in this process
+            zip_file_cache_release()
 
     # --------------------------------------------------------------------------
 
@@ -14,8 +14,21 @@ from arraykit import resolve_dtype_iter
 from arraykit import row_1d_filter
 from arraykit import shape_filter
 
+from static_frame.core.block_index import BlockIndex
+from static_frame.core.block_parallel import TILE_NBYTES
+from static_frame.core.block_parallel import apply_calls
+from static_frame.core.block_parallel import apply_chunked
+from static_frame.core.block_parallel import chunk_reduce_blocks
+from static_frame.core.block_parallel import chunk_reduce_rows
+from static_frame.core.block_parallel import chunk_rows
+from static_frame.core.block_parallel import chunk_slices
+from static_frame.core.block_parallel import parallel_config
+from static_frame.core.consolidate import ConsolidateActive
+from static_frame.core.consolidate import ConsolidateConfig
+from static_frame.core.consolidate import Fragmentation
 from static_frame.core.container import ContainerOperand
 from static_frame.core.container_util import apply_binary_operator_blocks
+from static_frame.core.container_util import apply_binary_operator_chunk
 from static_frame.core.container_util import apply_binary_operator_blocks_columnar
 from static_frame.core.container_util import get_block_match
 from static_frame.core.display import Display
@@ -29,6 +42,7 @@ from static_frame.core.node_selector import InterfaceGetItem
 from static_frame.core.style_config import StyleConfig
 from static_frame.core.util import DEFAULT_FAST_SORT_KIND
 from static_frame.core.util import DEFAULT_SORT_KIND
+from static_frame.core.util import DEFAULT_STABLE_SORT_KIND
 from static_frame.core.util import DTYPE_BOOL
 from static_frame.core.util import DTYPE_FLOAT_DEFAULT
 from static_frame.core.util import DTYPE_OBJECT
@@ -42,12 +56,14 @@ from static_frame.core.util import NULL_SLICE
 from static_frame.core.util import DtypeSpecifier
 from static_frame.core.util import GetItemKeyType
 from static_frame.core.util import GetItemKeyTypeCompound
+from static_frame.core.util import GroupReduceType
 from static_frame.core.util import OptionalArrayList
 from static_frame.core.util import PositionsAllocator
 from static_frame.core.util import ShapeType
 from static_frame.core.util import UFunc
 from static_frame.core.util import array2d_to_tuples
 from static_frame.core.util import array_deepcopy
+from static_frame.core.util import array_for_sort
 from static_frame.core.util import array_shift
 from static_frame.core.util import array_to_groups_and_locations
 from static_frame.core.util import array_ufunc_axis_skipna
@@ -63,11 +79,12 @@ from static_frame.core.util import isin_array
 from static_frame.core.util import isna_array
 from static_frame.core.util import iterable_to_array_1d
 from static_frame.core.util import iterable_to_array_nd
+from static_frame.core.util import locations_to_positions
 from static_frame.core.util import roll_1d
-from static_frame.core.util import slice_to_ascending_slice
 from static_frame.core.util import slices_from_targets
 from static_frame.core.util import ufunc_dtype_to_dtype
 from static_frame.core.util import view_2d_as_1d
+from static_frame.core.values_cache import VALUES_CACHE
 
 
 #---------------------------------------------------------------------------
@@ -82,13 +99,15 @@ def group_match(
         group_source: tp.Optional[np.ndarray] = None,
         ) -> tp.Iterator[tp.Tuple[np.ndarray, np.ndarray, 'TypeBlocks']]:
     '''
+    Group by hashing the values selected by ``key``, for values that cannot be sorted.
+
     Args:
         key: iloc selector on opposite axis
         drop: Optionally drop the target of the grouping as specified by ``key``.
         extract: if provided, will be used to select from the group on the opposite axis
 
     Returns:
-        Generator of group, selection pairs, where selection is an np.ndarray. Returned is as an np.ndarray if key is more than one column.
+        Generator of group, selection pairs, where selection is an np.ndarray of integer positions. Returned is as an np.ndarray if key is more than one column.
     '''
     # NOTE: in axis_values we determine zero size by looking for empty _blocks; not sure if that is appropriate here.
     if blocks._shape[0] == 0 or blocks._shape[1] == 0: # zero sized
@@ -111,6 +130,7 @@ def group_match(
             group_source,
             axis,
             )
+    count = len(groups)
 
     if group_source.ndim > 1:
         # NOTE: this is expensive!
@@ -143,13 +163,8 @@ def group_match(
         else:
             row_key = None if not drop else drop_mask
 
-    # NOTE: we create one mutable Boolean array to serve as the selection for each group; as this array is yielded out, the caller must use it before the next iteration, which is assumed to alway be the case.
-    selection = np.empty(len(locations), dtype=DTYPE_BOOL)
-
-    for idx, g in enumerate(groups):
-        # derive a Boolean array of fixed size showing where value in this group are found from the original TypeBlocks
-        np.equal(locations, idx, out=selection)
-
+    # PERF: positions of all groups are found in one pass, rather than comparing all locations to each group
+    for g, selection in zip(groups, locations_to_positions(locations, count)):
         if axis == 0: # return row
             yield g, selection, func(
                     row_key=selection,
@@ -266,9 +281,77 @@ def group_sorted(
         else:
             yield group_source[start], slc, chunk
 
+def group_reduce(
+        blocks: 'TypeBlocks',
+        *,
+        key: GetItemKeyType,
+        drop: bool = False,
+        func: GroupReduceType,
+        ) -> tp.Tuple[tp.Sequence[tp.Hashable], 'TypeBlocks']:
+    '''
+    Reduce groups of rows, as found by unique values in the columns selected by ``key``, without creating a container per group. Groups are ordered as they are by :obj:`group_sorted` or, if values cannot be sorted, :obj:`group_match`.
+
+    Args:
+        key: iloc selector of columns
+        drop: Optionally drop the target of the grouping as specified by ``key``.
+        func: a function of a block and the positions at which each group of rows begins and ends, returning an array with a row per group.
+
+    Returns:
+        Pair of the group labels, and :obj:`TypeBlocks` with a row per group. Labels are tuples if key is more than one column.
+    '''
+    if drop:
+        column_key = np.full(blocks._shape[1], True, dtype=DTYPE_BOOL)
+        column_key[key] = False
+    else:
+        column_key = None
+
+    if blocks._shape[0] == 0:
+        return (), blocks._extract(column_key=column_key)
+
+    try:
+        blocks, _ = blocks.sort(key=key, axis=1, kind=DEFAULT_STABLE_SORT_KIND)
+        group_source = blocks._extract_array(column_key=key)
+        if group_source.ndim == 2:
+            if group_source.dtype == DTYPE_OBJECT:
+                # NOTE: cannot get view of object; use string
+                consolidated = view_2d_as_1d(group_source.astype(str))
+            else:
+                consolidated = view_2d_as_1d(group_source)
+        else:
+            consolidated = group_source
+        # as with group_sorted, a group starts where a value is not equal to the previous
+        is_start = np.empty(len(consolidated), dtype=DTYPE_BOOL)
+        is_start[0] = True
+        np.not_equal(consolidated[1:], consolidated[:-1], out=is_start[1:])
+        starts = np.flatnonzero(is_start)
+        groups = group_source[starts]
+    except TypeError:
+        group_source = blocks._extract_array(column_key=key)
+        groups, locations = array_to_groups_and_locations(group_source)
+        order = np.argsort(locations, kind=DEFAULT_STABLE_SORT_KIND)
+        blocks = blocks._extract(row_key=order)
+        starts = np.bincount(locations, minlength=len(groups)).cumsum()
+        starts[1:] = starts[:-1]
+        starts[0] = 0
+
+    if groups.ndim == 2:
+        groups = list(array2d_to_tuples(groups))
+    else:
+        groups.flags.writeable = False
+
+    ends = np.empty(len(starts), dtype=starts.dtype)
+    ends[:-1] = starts[1:]
+    ends[-1:] = blocks._shape[0]
+
+    reduced = (func(block, starts, ends) for block in blocks._extract(column_key=column_key)._blocks)
+    return groups, TypeBlocks.from_blocks(reduced)
+
 
 TypeShape = tp.Union[int, tp.Tuple[int, int]]
 
+# slots not retained in pickles
+_TYPE_BLOCKS_STATE_EXCLUDE = frozenset(('_blocks_consolidated', '_values_cache', '__weakref__'))
+
 #-------------------------------------------------------------------------------
 class TypeBlocks(ContainerOperand):
     '''An ordered collection of type-heterogenous, immutable NumPy arrays, providing an external array-like interface of a single, 2D array. Used by :obj:`Frame` for core, unindexed array management.
@@ -278,10 +361,13 @@ class TypeBlocks(ContainerOperand):
 
     __slots__ = (
             '_blocks',
-            '_dtypes',
             '_index',
             '_shape',
             '_row_dtype',
+            '_consolidate_config',
+            '_blocks_consolidated',
+            '_values_cache',
+            '__weakref__',
             )
 
     STATIC = False
@@ -305,9 +391,8 @@ class TypeBlocks(ContainerOperand):
 
         '''
         blocks: tp.List[np.ndarray] = [] # ordered blocks
-        dtypes: tp.List[np.dtype] = [] # column position to dtype
-        index: tp.List[tp.Tuple[int, int]] = [] # columns position to blocks key
-        block_count = 0
+        dtypes: tp.List[np.dtype] = [] # block position to dtype
+        widths: tp.List[int] = [] # block position to column count
 
         row_count: tp.Optional[int]
 
@@ -320,14 +405,16 @@ class TypeBlocks(ContainerOperand):
             if column_count == 0:
                 # set shape but do not store array
                 return cls(blocks=blocks,
-                        dtypes=dtypes,
-                        index=index,
+                        index=BlockIndex(),
                         shape=(row_count, column_count) #type: ignore
                         )
-            blocks.append(immutable_filter(raw_blocks))
-            for i in range(column_count):
-                index.append((block_count, i))
-                dtypes.append(raw_blocks.dtype) #type: ignore
+            return cls(blocks=[immutable_filter(raw_blocks)],
+                    index=BlockIndex.from_pairs(
+                            [(0, i) for i in range(column_count)],
+                            [raw_blocks.dtype], #type: ignore
+                            ),
+                    shape=(row_count, column_count), #type: ignore
+                    )
 
         else: # an iterable of blocks
             row_count = None
@@ -353,14 +440,9 @@ class TypeBlocks(ContainerOperand):
                     continue
 
                 blocks.append(immutable_filter(block))
-
-                # store position to key of block, block columns
-                for i in range(c):
-                    index.append((block_count, i))
-                    dtypes.append(block.dtype)
-
+                widths.append(c)
+                dtypes.append(block.dtype)
                 column_count += c
-                block_count += 1
 
         # blocks can be empty
         if row_count is None:
@@ -372,8 +454,7 @@ class TypeBlocks(ContainerOperand):
 
         return cls(
                 blocks=blocks,
-                dtypes=dtypes,
-                index=index,
+                index=BlockIndex.from_widths(widths, dtypes),
                 shape=(row_count, column_count),
                 )
 
@@ -418,7 +499,7 @@ class TypeBlocks(ContainerOperand):
             return cls.from_blocks(blocks)
 
         # for arrays with no width, favor storing shape alone and not creating an array object; the shape will be binding for future appending
-        return cls(blocks=list(), dtypes=list(), index=list(), shape=shape)
+        return cls(blocks=list(), index=BlockIndex(), shape=shape)
 
     @staticmethod
     def vstack_blocks_to_blocks(
@@ -467,23 +548,25 @@ class TypeBlocks(ContainerOperand):
 
     def __init__(self, *,
             blocks: tp.List[np.ndarray],
-            dtypes: tp.List[np.dtype],
-            index: tp.List[tp.Tuple[int, int]],
-            shape: tp.Tuple[int, int]
+            index: BlockIndex,
+            shape: tp.Tuple[int, int],
+            consolidate_config: tp.Optional[ConsolidateConfig] = None,
             ) -> None:
         '''
         Default constructor. We own all lists passed in to this constructor. This instance takes ownership of all lists passed to it.
 
         Args:
             blocks: A list of one or two-dimensional NumPy arrays. The list is owned by this instance.
-            dtypes: list of dtypes per external column. The list is owned by this instance.
-            index: list of pairs, where the first element is the block index, the second elemetns is the intra-block column
+            index: a :obj:`BlockIndex` mapping each external column to its block index and intra-block column, and storing dtypes per block. The :obj:`BlockIndex` is owned by this instance.
             shape: two-element tuple defining row and column count. A (0, 0) shape is permitted for empty TypeBlocks.
+            consolidate_config: optional :obj:`ConsolidateConfig` to govern lazy consolidation of blocks on row-wise access; if None, the configuration of :obj:`ConsolidateActive` is used.
         '''
         self._blocks = blocks
-        self._dtypes = dtypes
-        self._index = index # list where index, as column, gets block, offset
+        self._index = index # column position to block, offset
         self._shape = shape
+        self._consolidate_config = consolidate_config
+        self._blocks_consolidated: tp.Optional[tp.List[np.ndarray]] = None # managed by _consolidate_lazy
+        self._values_cache: tp.Optional[np.ndarray] = None # managed by VALUES_CACHE
 
         if self._blocks:
             self._row_dtype = resolve_dtype_iter(b.dtype for b in self._blocks)
@@ -492,12 +575,24 @@ class TypeBlocks(ContainerOperand):
             self._row_dtype = None
 
     #---------------------------------------------------------------------------
+    def __getstate__(self) -> tp.Tuple[None, tp.Dict[str, tp.Any]]:
+        '''
+        Exclude the cached consolidated blocks and values array from the pickled state.
+        '''
+        return (None, {
+                key: getattr(self, key) for key in self.__slots__
+                if key not in _TYPE_BLOCKS_STATE_EXCLUDE
+                })
+
     def __setstate__(self,
             state: tp.Tuple[object, tp.Mapping[str, tp.Any]],
             ) -> None:
         '''
         Ensure that reanimated NP arrays are set not writeable.
         '''
+        self._consolidate_config = None
+        self._blocks_consolidated = None
+        self._values_cache = None
         for key, value in state[1].items():
             setattr(self, key, value)
 
@@ -507,10 +602,12 @@ class TypeBlocks(ContainerOperand):
     def __deepcopy__(self, memo: tp.Dict[int, tp.Any]) -> 'TypeBlocks':
         obj = self.__class__.__new__(self.__class__)
         obj._blocks = [array_deepcopy(b, memo) for b in self._blocks]
-        obj._dtypes = deepcopy(self._dtypes, memo)
-        obj._index = self._index.copy() # list of tuples of ints
+        obj._index = self._index.copy()
         obj._shape = self._shape # immutable, no copy necessary
         obj._row_dtype = deepcopy(self._row_dtype, memo)
+        obj._consolidate_config = self._consolidate_config # immutable, no copy necessary
+        obj._blocks_consolidated = None
+        obj._values_cache = None
         memo[id(self)] = obj
         return obj
 
@@ -520,9 +617,9 @@ class TypeBlocks(ContainerOperand):
         '''
         return self.__class__(
                 blocks=[b for b in self._blocks],
-                dtypes=self._dtypes.copy(), # list
-                index=self._index.copy(), # list
+                index=self._index.copy(),
                 shape=self._shape,
+                consolidate_config=self._consolidate_config,
                 )
 
     def copy(self) -> 'TypeBlocks':
@@ -540,7 +637,7 @@ class TypeBlocks(ContainerOperand):
         Return an immutable array that, for each realizable column (not each block), the dtype is given.
         '''
         # this creates a new array every time it is called; could cache
-        a = np.array(self._dtypes, dtype=DTYPE_OBJECT)
+        a = self._index.dtypes
         a.flags.writeable = False
         return a
 
@@ -584,6 +681,42 @@ class TypeBlocks(ContainerOperand):
                 return False
         return True
 
+    @property
+    def fragmentation(self) -> Fragmentation:
+        '''Return a :obj:`Fragmentation` report of the count of blocks before and after consolidating adjacent blocks of the same dtype.
+        '''
+        count = len(self._blocks)
+        count_consolidated = 0
+        dtype_previous = None
+        for b in self._blocks:
+            if b.dtype != dtype_previous:
+                count_consolidated += 1
+                dtype_previous = b.dtype
+        return Fragmentation(count, count_consolidated, self._shape[1])
+
+    def _consolidate_lazy(self) -> tp.List[np.ndarray]:
+        '''Return the blocks to use for row-wise access. If the fragmentation of blocks exceeds the active :obj:`ConsolidateConfig`, and the data does not exceed its ``nbytes_max``, this is a new list in which adjacent blocks of the same dtype are consolidated; otherwise, it is the list of blocks of this TypeBlocks. The result is retained until the next append.
+
+        This TypeBlocks is not mutated: the blocks and index are always consistent, even when read from other threads.
+        '''
+        blocks = self._blocks_consolidated
+        if blocks is not None:
+            return blocks
+
+        blocks = self._blocks
+        config = self._consolidate_config
+        if config is None:
+            config = ConsolidateActive.get()
+        if (config.active
+                and len(blocks) >= config.block_count_min
+                and (config.nbytes_max is None or self.nbytes <= config.nbytes_max)
+                and self.fragmentation.exceeds(config)
+                ):
+            blocks = [immutable_filter(b) for b in self.consolidate_blocks(blocks)]
+        # a single assignment publishes the result
+        self._blocks_consolidated = blocks
+        return blocks
+
     #---------------------------------------------------------------------------
     # interfaces
 
@@ -662,16 +795,24 @@ class TypeBlocks(ContainerOperand):
 
     @property
     def values(self) -> np.ndarray:
-        '''Returns a consolidated NP array of the all blocks.
+        '''Returns a consolidated NP array of the all blocks. When more than one block is consolidated, the resulting immutable array is retained (subject to the limits of ``VALUES_CACHE``) until this TypeBlocks is mutated.
         '''
+        array = VALUES_CACHE.get(self)
+        if array is not None:
+            return array
+
+        blocks = self._consolidate_lazy()
         # provide a default dtype if one has not yet been set (an empty TypeBlocks, for example)
         row_dtype = self._row_dtype if self._row_dtype is not None else DTYPE_FLOAT_DEFAULT
         # always return a 2D array
-        return blocks_to_array_2d(
-                blocks=self._blocks,
+        array = blocks_to_array_2d(
+                blocks=blocks,
                 shape=self._shape,
                 dtype=row_dtype,
                 )
+        if len(blocks) > 1: # a new array has been allocated
+            VALUES_CACHE.set(self, array)
+        return array
 
     def axis_values(self,
             axis: int = 0,
@@ -684,8 +825,9 @@ class TypeBlocks(ContainerOperand):
         '''
 
         if axis == 1: # iterate over rows
-            zero_size = not bool(self._blocks)
-            unified = self.unified
+            blocks = self._consolidate_lazy()
+            zero_size = not bool(blocks)
+            unified = len(blocks) <= 1
             # key: tp.Union[int, slice]
             row_dtype= self._row_dtype if self._row_dtype is not None else DTYPE_FLOAT_DEFAULT
             row_length = self._shape[0]
@@ -699,7 +841,7 @@ class TypeBlocks(ContainerOperand):
                 for i in row_idx_iter:
                     yield EMPTY_ARRAY
             elif unified:
-                b = self._blocks[0]
+                b = blocks[0]
                 for i in row_idx_iter:
                     if b.ndim == 1: # slice to force array creation (not an element)
                         yield b[i: i + 1]
@@ -708,11 +850,7 @@ class TypeBlocks(ContainerOperand):
             else:
                 # PERF: only creating and yielding one array at a time is shown to be slower; performance optimized: consolidate into a single array and then take slices
                 # NOTE: this might force unnecessary type coercion if going to a tuple, but if going to an array, the type consolidation is necessary
-                b = blocks_to_array_2d(
-                        blocks=self._blocks,
-                        shape=self._shape,
-                        dtype=row_dtype,
-                        )
+                b = self.values
                 for i in row_idx_iter:
                     yield b[i]
 
@@ -951,9 +1089,10 @@ class TypeBlocks(ContainerOperand):
             else:
                 dst_to_src = dict(
                         zip(columns_ic.iloc_dst, columns_ic.iloc_src)) #type: ignore [arg-type]
+                pairs = self._index.pairs
                 for idx in range(columns_ic.size):
                     if idx in dst_to_src:
-                        block_idx, block_col = self._index[dst_to_src[idx]]
+                        block_idx, block_col = pairs[dst_to_src[idx]]
                         b = self._blocks[block_idx]
                         if b.ndim == 1:
                             yield b
@@ -983,10 +1122,11 @@ class TypeBlocks(ContainerOperand):
             else:
                 columns_dst_to_src = dict(
                         zip(columns_ic.iloc_dst, columns_ic.iloc_src)) #type: ignore [arg-type]
+                pairs = self._index.pairs
 
                 for idx in range(columns_ic.size):
                     if idx in columns_dst_to_src:
-                        block_idx, block_col = self._index[columns_dst_to_src[idx]]
+                        block_idx, block_col = pairs[columns_dst_to_src[idx]]
                         b = self._blocks[block_idx]
 
                         if index_ic.is_subset:
@@ -1066,9 +1206,10 @@ class TypeBlocks(ContainerOperand):
             else:
                 dst_to_src = dict(
                         zip(columns_ic.iloc_dst, columns_ic.iloc_src)) #type: ignore [arg-type]
+                pairs = self._index.pairs
                 for idx in range(columns_ic.size):
                     if idx in dst_to_src:
-                        block_idx, block_col = self._index[dst_to_src[idx]]
+                        block_idx, block_col = pairs[dst_to_src[idx]]
                         b = self._blocks[block_idx]
                         if b.ndim == 1:
                             yield b
@@ -1102,10 +1243,11 @@ class TypeBlocks(ContainerOperand):
                 else:
                     columns_dst_to_src = dict(
                             zip(columns_ic.iloc_dst, columns_ic.iloc_src)) #type: ignore [arg-type]
+                    pairs = self._index.pairs
 
                     for idx in range(columns_ic.size):
                         if idx in columns_dst_to_src:
-                            block_idx, block_col = self._index[columns_dst_to_src[idx]]
+                            block_idx, block_col = pairs[columns_dst_to_src[idx]]
                             b = self._blocks[block_idx]
                             if index_ic.is_subset:
                                 if b.ndim == 1:
@@ -1166,9 +1308,9 @@ class TypeBlocks(ContainerOperand):
             raise AxisInvalid(f'invalid axis: {axis}') #pragma: no cover
 
         if values_for_lex is not None:
-            order = np.lexsort(values_for_lex)
+            order = np.lexsort([array_for_sort(a) for a in values_for_lex])
         elif values_for_sort is not None:
-            order = np.argsort(values_for_sort, kind=kind)
+            order = np.argsort(array_for_sort(values_for_sort), kind=kind)
         else:
             raise RuntimeError('unable to resovle sort type') #pragma: no cover
 
@@ -1259,6 +1401,8 @@ class TypeBlocks(ContainerOperand):
         '''
         if axis < 0 or axis > 1:
             raise AxisInvalid(f'invalid axis: {axis}')
+        # row-wise reductions use consolidated blocks where fragmentation warrants
+        blocks = self._consolidate_lazy() if axis == 1 else self._blocks
 
         func = partial(array_ufunc_axis_skipna,
                 skipna=skipna,
@@ -1266,8 +1410,19 @@ class TypeBlocks(ContainerOperand):
                 ufunc_skipna=ufunc_skipna,
                 )
 
-        if self.unified:
-            result = func(array=column_2d_filter(self._blocks[0]), axis=axis)
+        config = parallel_config(blocks, self.nbytes)
+
+        if len(blocks) <= 1:
+            array = column_2d_filter(blocks[0])
+            if config is not None and axis == 1:
+                # rows are reduced independently, so row-wise chunks produce identical results
+                return apply_chunked( # type: ignore
+                        (partial(chunk_reduce_rows, func, array),),
+                        (array.shape[0],),
+                        (array.nbytes,),
+                        config,
+                        )[0]
+            result = func(array=array, axis=axis)
             result.flags.writeable = False
             return result
 
@@ -1279,20 +1434,40 @@ class TypeBlocks(ContainerOperand):
             pos = 0 # used below undex axis 0
         elif composable: # axis 1
             # reduce all columns to 2d blocks with 1 column
-            shape = (self._shape[0], len(self._blocks))
+            shape = (self._shape[0], len(blocks))
         else: # axis 1, not block composable
-            # Cannot do block-wise processing, must resolve to single array and return
-            row_dtype = self._row_dtype if self._row_dtype is not None else DTYPE_FLOAT_DEFAULT
-
-            array = blocks_to_array_2d(
-                    blocks=self._blocks,
-                    shape=self._shape,
-                    dtype=row_dtype,
-                    )
+            # Cannot do block-wise processing; rows must be reduced from a single array, formed either from all rows or from row-wise tiles
+            array = VALUES_CACHE.get(self)
+            rows = self._shape[0]
+            if array is None:
+                dtype = self._row_dtype
+                nbytes = rows * self._shape[1] * dtype.itemsize
+                tile = partial(chunk_reduce_blocks, func, blocks, dtype)
+                if config is not None:
+                    return apply_chunked((tile,), (rows,), (nbytes,), config)[0] # type: ignore
+                keys = chunk_slices(rows, nbytes, TILE_NBYTES)
+                if len(keys) > 1:
+                    # PERF: reduce tiles of rows that remain in cache, rather than allocating the complete array
+                    result = np.concatenate([tile(key) for key in keys])
+                    result.flags.writeable = False
+                    return result
+                array = self.values
+            if config is not None:
+                return apply_chunked( # type: ignore
+                        (partial(chunk_reduce_rows, func, array),),
+                        (rows,),
+                        (array.nbytes,),
+                        config,
+                        )[0]
             result = func(array=array, axis=axis)
             result.flags.writeable = False
             return result
 
+        # if using the thread pool, reductions of 2D blocks into out are deferred; they are the same calls as made serially, such that results are identical
+        calls: tp.Optional[tp.List[tp.Callable[[], tp.Any]]] = None
+        if config is not None:
+            calls = []
+
         if dtypes:
             # If dtypes were specified, we know we have specific targets in mind for output
             # Favor self._row_dtype's kind if it is in dtypes, else take first of passed dtypes
@@ -1309,17 +1484,17 @@ class TypeBlocks(ContainerOperand):
             if dtype is None:
                 # if we do not have a mapping for this function and row dtype, try to get a compatible type for the result of the function applied to each block
                 block_dtypes = []
-                for b in self._blocks:
+                for b in blocks:
                     dt = ufunc_dtype_to_dtype(ufunc_selected, b.dtype)
                     if dt is not None:
                         block_dtypes.append(dt)
-                if len(block_dtypes) == len(self._blocks): # if all resolved
+                if len(block_dtypes) == len(blocks): # if all resolved
                     dtype = resolve_dtype_iter(block_dtypes)
                 else: # assume row_dtype is appropriate
                     dtype = self._row_dtype
 
         out = np.empty(shape, dtype=dtype)
-        for idx, b in enumerate(self._blocks):
+        for idx, b in enumerate(blocks):
             if axis == 0: # Combine rows, end with columns shape.
                 if size_one_unity and b.size == 1 and not skipna:
                     # No function call is necessary; if skipna could turn NaN to zero.
@@ -1334,6 +1509,8 @@ class TypeBlocks(ContainerOperand):
                     end = pos + span
                     if span == 1: # just one column, reducing to one value
                         out[pos] = func(array=b, axis=axis)
+                    elif calls is not None:
+                        calls.append(partial(func, array=b, axis=axis, out=out[pos: end]))
                     else:
                         func(array=b, axis=axis, out=out[pos: end])
                 pos = end
@@ -1348,9 +1525,15 @@ class TypeBlocks(ContainerOperand):
                         out[NULL_SLICE, idx] = func(array=column_2d_filter(b), axis=1)
                     else: # otherwise, keep as is
                         out[NULL_SLICE, idx] = b
+                elif calls is not None:
+                    calls.extend(partial(func, array=b[key], axis=axis, out=out[key, idx])
+                            for key in chunk_slices(b.shape[0], b.nbytes, config.chunk_nbytes)) # type: ignore
                 else:
                     func(array=b, axis=axis, out=out[NULL_SLICE, idx])
 
+        if calls:
+            apply_calls(calls, config) # type: ignore
+
         if axis == 0: # nothing more to do
             out.flags.writeable = False
             return out
@@ -1366,10 +1549,19 @@ class TypeBlocks(ContainerOperand):
         Return a TypeBlocks rounded to the given decimals. Negative decimals round to the left of the decimal point.
         '''
         func = partial(np.round, decimals=decimals)
-        # for now, we do not expose application of rounding on a subset of blocks, but is doable by setting the column_key
+        config = parallel_config(self._blocks, self.nbytes)
+        if config is not None:
+            blocks = apply_chunked(
+                    [partial(chunk_rows, func, b) for b in self._blocks],
+                    [self._shape[0]] * len(self._blocks),
+                    [b.nbytes for b in self._blocks],
+                    config,
+                    )
+        else:
+            # for now, we do not expose application of rounding on a subset of blocks, but is doable by setting the column_key
+            blocks = list(self._ufunc_blocks(column_key=NULL_SLICE, func=func))
         return self.__class__(
-                blocks=list(self._ufunc_blocks(column_key=NULL_SLICE, func=func)),
-                dtypes=self._dtypes.copy(), # list
+                blocks=blocks,
                 index=self._index.copy(),
                 shape=self._shape
                 )
@@ -1425,57 +1617,6 @@ class TypeBlocks(ContainerOperand):
     #---------------------------------------------------------------------------
     # extraction utilities
 
-    @staticmethod
-    def _cols_to_slice(indices: tp.Sequence[int]) -> slice:
-        '''Translate an iterable of contiguous integers into a slice. Integers are assumed to be intentionally ordered and contiguous.
-        '''
-        start_idx = indices[0]
-        # single column as a single slice
-        if len(indices) == 1:
-            return slice(start_idx, start_idx + 1)
-
-        stop_idx = indices[-1]
-        if stop_idx > start_idx: # ascending indices
-            return slice(start_idx, stop_idx + 1)
-
-        if stop_idx == 0:
-            return slice(start_idx, None, -1)
-        # stop is less than start, need to reduce by 1 to cover range
-        return slice(start_idx, stop_idx - 1, -1)
-
-
-    @classmethod
-    def _indices_to_contiguous_pairs(cls, indices: tp.Iterable[tp.Tuple[int, int]]
-        ) -> tp.Iterator[tp.Tuple[int, slice]]:
-        '''Indices are pairs of (block_idx, value); convert these to pairs of (block_idx, slice) when we identify contiguous indices within a block (these are block slices)
-
-        Args:
-            indices: can be a generator
-        '''
-        # store pairs of block idx, ascending col list
-        last: tp.Optional[tp.Tuple[int, int]] = None
-
-        for block_idx, col in indices:
-            if not last:
-                last = (block_idx, col)
-                bundle = [col]
-                continue
-            if last[0] == block_idx and abs(col - last[1]) == 1:
-                # if contiguous, update last, add to bundle
-                last = (block_idx, col)
-                # do not need to store all col, only the last, however probably easier to just accumulate all
-                bundle.append(col)
-                continue
-            # either new block, or not contiguous on same block
-            yield (last[0], cls._cols_to_slice(bundle))
-            # start a new bundle
-            bundle = [col]
-            last = (block_idx, col)
-
-        # last can be None
-        if last and bundle:
-            yield (last[0], cls._cols_to_slice(bundle))
-
     # NOTE: this might cache its results as it is it might be frequently called with the same arguments in some scenarios (group)
     def _key_to_block_slices(self,
             key: GetItemKeyTypeCompound,
@@ -1497,24 +1638,8 @@ class TypeBlocks(ContainerOperand):
                 # the index has the pair block, column integer
                 yield self._index[key]
             else: # all cases where we try to get contiguous slices
-                if isinstance(key, slice):
-                    #  slice the index; null slice already handled
-                    if not retain_key_order:
-                        key = slice_to_ascending_slice(key, self._shape[1])
-                    indices: tp.Iterable[tp.Tuple[int, int]] = self._index[key]
-                elif key.__class__ is np.ndarray and key.dtype == bool: #type: ignore
-                    # NOTE: if self._index was an array we could use Boolean selection directly
-                    indices = (self._index[idx] for idx, v in enumerate(key) if v)
-                elif isinstance(key, KEY_ITERABLE_TYPES):
-                    # an iterable of keys, may not have contiguous regions; provide in the order given; set as a generator; self._index is a list, not an np.array, so cannot slice self._index; requires iteration in passed generator so probably this is as fast as it can be.
-                    # NOTE: we assume key is a list of integers: if key is a list of Booleans, we will not get the same elementwise selection as if we selected from an array
-                    if retain_key_order:
-                        indices = (self._index[x] for x in key)
-                    else:
-                        indices = (self._index[x] for x in sorted(key))
-                else:
-                    raise NotImplementedError('Cannot handle key', key)
-                yield from self._indices_to_contiguous_pairs(indices)
+                # contiguous runs within blocks are found by vectorized comparison of block and column arrays
+                yield from self._index.iter_block_slices(key, retain_key_order)
 
     #---------------------------------------------------------------------------
     def _mask_blocks(self,
@@ -2710,7 +2835,7 @@ class TypeBlocks(ContainerOperand):
             ) -> tp.Iterator[tp.Any]:
         '''Alternative extractor that yields a full-row of values from a single integer selection. This will avoid any type coercion.
         '''
-        for b in self._blocks:
+        for b in self._consolidate_lazy():
             if b.ndim == 1:
                 yield b[key]
             else:
@@ -2724,7 +2849,7 @@ class TypeBlocks(ContainerOperand):
         '''Alternative extractor that yields tuples per row of values based on a selection of one or more columns. This interface yields all rows in the TypeBlocks.
         '''
         if key is None or (key.__class__ is slice and key == NULL_SLICE):
-            arrays = self._blocks
+            arrays = self._consolidate_lazy()
         else:
             arrays = list(self._slice_blocks(column_key=key))
 
@@ -2988,6 +3113,15 @@ class TypeBlocks(ContainerOperand):
             operator: tp.Callable[[np.ndarray], np.ndarray],
             ) -> 'TypeBlocks':
         # for now, do no reblocking; though, in many cases, operating on a unified block will be faster
+        config = parallel_config(self._blocks, self.nbytes)
+        if config is not None:
+            return self.from_blocks(apply_chunked(
+                    [partial(chunk_rows, operator, b) for b in self._blocks],
+                    [self._shape[0]] * len(self._blocks),
+                    [b.nbytes for b in self._blocks],
+                    config,
+                    ))
+
         def operation() -> tp.Iterator[np.ndarray]:
             for b in self._blocks:
                 result = operator(b)
@@ -3073,6 +3207,30 @@ class TypeBlocks(ContainerOperand):
                     operator=operator,
                     ))
 
+        config = parallel_config(
+                chain(self._blocks, other._blocks if isinstance(other, TypeBlocks) else (other,)), # type: ignore
+                self.nbytes,
+                )
+        if config is not None:
+            # process row-wise chunks concurrently; other operands are only sliced if aligned with self operands
+            if apply_column_2d_filter:
+                self_operands = [column_2d_filter(op) for op in self_operands]
+                other_operands = [column_2d_filter(op) for op in other_operands]
+            else:
+                self_operands = list(self_operands)
+            return self.from_blocks(apply_chunked(
+                    [partial(apply_binary_operator_chunk,
+                            values=a,
+                            other=b,
+                            other_sliced=apply_column_2d_filter,
+                            operator=operator,
+                            )
+                            for a, b in zip(self_operands, other_operands)],
+                    [self._shape[0]] * len(self_operands), # type: ignore
+                    [a.nbytes for a in self_operands],
+                    config,
+                    ))
+
         return self.from_blocks(apply_binary_operator_blocks(
                 values=self_operands,
                 other=other_operands,
@@ -3994,7 +4152,7 @@ class TypeBlocks(ContainerOperand):
         # same type from here
         if self._shape != other._shape:
             return False
-        if compare_dtype and self._dtypes != other._dtypes: # these are lists
+        if compare_dtype and not self._index.dtypes_equal(other._index):
             return False
 
         for i in range(self._shape[1]):
@@ -4019,8 +4177,6 @@ class TypeBlocks(ContainerOperand):
         if block.shape[0] != row_count:
             raise RuntimeError(f'appended block shape {block.shape} does not align with shape {self._shape}')
 
-        # get ref to append
-        block_idx = len(self._blocks) # next block
         if block.ndim == 1:
             # length already confirmed to match row count; even if this is a zero length 1D array, we keep it as it (by definition) defines a column (if the existing row_count is zero). said another way, a zero length, 1D array always has a shape of (0, 1)
             block_columns = 1
@@ -4033,10 +4189,10 @@ class TypeBlocks(ContainerOperand):
         # extend shape, or define it if not yet set
         self._shape = (row_count, self._shape[1] + block_columns)
 
-        # add block, dtypes, index
-        for i in range(block_columns):
-            self._index.append((block_idx, i))
-            self._dtypes.append(block.dtype)
+        # add block index, dtypes
+        self._index.register(block)
+        self._blocks_consolidated = None
+        VALUES_CACHE.discard(self)
 
         # make immutable copy if necessary before appending
         self._blocks.append(immutable_filter(block))
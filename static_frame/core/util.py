@@ -67,6 +67,7 @@ DTYPE_OBJECT_KIND = 'O'
 DTYPE_BOOL_KIND = 'b'
 
 DTYPE_STR_KINDS = ('U', 'S') # S is np.bytes_
+DTYPE_UNIQUE_HASH_KINDS = frozenset(('O', 'U', 'S')) # kinds for which hashing is faster than sorting
 DTYPE_INT_KINDS = ('i', 'u') # signed and unsigned
 DTYPE_INEXACT_KINDS = (DTYPE_FLOAT_KIND, DTYPE_COMPLEX_KIND) # kinds that support NaN values
 DTYPE_NAT_KINDS = (DTYPE_DATETIME_KIND, DTYPE_TIMEDELTA_KIND)
@@ -191,6 +192,12 @@ TIME_DELTA_ATTR_MAP = (
 
 # ufunc functions that will not work with DTYPE_STR_KINDS, but do work if converted to object arrays
 UFUNC_AXIS_STR_TO_OBJ = frozenset((np.min, np.max, np.sum))
+# shape-retaining ufunc functions that will not work with DTYPE_STR_KINDS, but do work if converted to object arrays
+UFUNC_SHAPE_STR_TO_OBJ = frozenset((np.cumsum, np.nancumsum))
+# ufunc functions applied to groups (or windows) of rows by array_group_reduce that are vectorized for numeric arrays
+UFUNC_GROUP_REDUCE = frozenset((np.sum, np.mean, np.min, np.max, np.var, np.std))
+# the maximum count of elements of windows of an array copied at one time by reduce_windows
+WINDOWS_ELEMENTS_MAX = 1 << 20
 
 FALSY_VALUES = frozenset((0, '', None, ()))
 
@@ -256,6 +263,8 @@ Bloc2DKeyType = tp.Union['Frame', np.ndarray]
 
 UFunc = tp.Callable[..., np.ndarray]
 AnyCallable = tp.Callable[..., tp.Any]
+# a function of an array and arrays of start and end positions of groups of rows, returning an array with a row per group
+GroupReduceType = tp.Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]
 
 Mapping = tp.Union[tp.Mapping[tp.Hashable, tp.Any], 'Series']
 CallableOrMapping = tp.Union[AnyCallable, tp.Mapping[tp.Hashable, tp.Any], 'Series']
@@ -980,9 +989,198 @@ def array_ufunc_axis_skipna(
         return ufunc_skipna(v, axis=axis, out=out)
     return ufunc(v, axis=axis, out=out)
 
+
+def window_sums(
+        array: np.ndarray,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        dtype: np.dtype,
+        ) -> np.ndarray:
+    '''Sum the rows of a 1D or 2D ``array`` from each position in ``starts`` to the corresponding position in ``ends`` as differences of cumulative sums, a cost independent of the size and overlap of windows. Only exact for integer ``dtype``.
+    '''
+    cumulative = np.empty((len(array) + 1,) + array.shape[1:], dtype=dtype)
+    cumulative[0] = 0
+    np.cumsum(array, axis=0, dtype=dtype, out=cumulative[1:])
+    return cumulative[ends] - cumulative[starts]
+
+
+def reduce_windows(
+        array: np.ndarray,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        func: tp.Callable[[np.ndarray], np.ndarray],
+        ) -> np.ndarray:
+    '''Reduce the rows of a 1D or 2D ``array`` from each position in ``starts`` to the corresponding position in ``ends`` with ``func``, a function that reduces the last axis of an array of windows. Windows of the same length are reduced together from a strided view, in chunks of at most ``WINDOWS_ELEMENTS_MAX`` elements.
+    '''
+    lengths = ends - starts
+    width = array.shape[1] if array.ndim == 2 else 1
+    post: tp.Optional[np.ndarray] = None
+
+    for length in ufunc_unique1d(lengths).tolist():
+        positions = np.flatnonzero(lengths == length)
+        windows = np.lib.stride_tricks.sliding_window_view(array, length, axis=0)
+        count = max(WINDOWS_ELEMENTS_MAX // max(length * width, 1), 1)
+        for i in range(0, len(positions), count):
+            selection = positions[i: i + count]
+            reduced = func(windows[starts[selection]])
+            if post is None:
+                post = np.empty((len(starts),) + reduced.shape[1:], dtype=reduced.dtype)
+            elif reduced.dtype != post.dtype:
+                post = post.astype(resolve_dtype(post.dtype, reduced.dtype))
+            post[selection] = reduced
+
+    if post is None: # no windows
+        return func(np.empty((0,) + array.shape[1:] + (1,), dtype=array.dtype))
+    return post
+
+
+def array_group_reduce(
+        array: np.ndarray,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        *,
+        skipna: bool,
+        ufunc: UFunc,
+        ufunc_skipna: UFunc,
+        ) -> np.ndarray:
+    '''Reduce groups of rows of a 1D or 2D ``array``, where each group is the rows from a position in ``starts`` to the corresponding position in ``ends``; groups, as with windows, can overlap. Returns an array with a row per group. Results are as :obj:`array_ufunc_axis_skipna` applied to each group.
+    '''
+    kind = array.dtype.kind
+    func = ufunc.func if ufunc.__class__ is partial else ufunc # type: ignore
+
+    if kind in DTYPE_NUMERICABLE_KINDS and func in UFUNC_GROUP_REDUCE:
+        is_inexact = kind in DTYPE_INEXACT_KINDS
+        # contiguous, non-empty groups that do not overlap can be reduced in one pass
+        is_disjoint = (bool((ends > starts).all())
+                and bool((ends[:-1] == starts[1:]).all())
+                and (not len(ends) or ends[-1] == len(array))
+                )
+        if is_disjoint and (func is np.min or func is np.max):
+            if skipna and is_inexact:
+                # fmin, fmax only return NaN if all values are NaN
+                reducer = np.fmin if func is np.min else np.fmax
+            else:
+                reducer = np.minimum if func is np.min else np.maximum
+            return reducer.reduceat(array, starts, axis=0)
+
+        if (is_disjoint or not is_inexact) and (func is np.sum or func is np.mean):
+            isna: tp.Optional[np.ndarray] = None
+            if skipna and is_inexact:
+                isna = np.isnan(array)
+                if isna.any():
+                    array = np.where(isna, 0, array)
+                else:
+                    isna = None
+
+            if kind == 'u':
+                dtype = DTYPE_UINT_DEFAULT
+            elif kind == 'i' or kind == DTYPE_BOOL_KIND:
+                dtype = DTYPE_INT_DEFAULT
+            else:
+                dtype = array.dtype
+
+            if is_disjoint:
+                sums = np.add.reduceat(array,
+                        starts,
+                        axis=0,
+                        dtype=DTYPE_FLOAT_DEFAULT if func is np.mean and not is_inexact else dtype,
+                        )
+            else: # PERF: integers can be summed exactly from cumulative sums, regardless of window size
+                sums = window_sums(array, starts, ends, dtype)
+            if func is np.sum:
+                return sums
+
+            if isna is not None:
+                counts = np.add.reduceat(~isna, starts, axis=0, dtype=DTYPE_INT_DEFAULT)
+            else:
+                counts = ends - starts
+                if array.ndim == 2:
+                    counts = counts.reshape(len(counts), 1)
+            with WarningsSilent():
+                # groups of all NaN have a zero count and return NaN
+                post = sums / counts
+            return post if not is_inexact else post.astype(array.dtype, copy=False)
+
+        return reduce_windows(array, starts, ends, partial(array_ufunc_axis_skipna,
+                skipna=skipna,
+                axis=-1,
+                ufunc=ufunc,
+                ufunc_skipna=ufunc_skipna,
+                ))
+
+    if array.ndim == 2:
+        # NOTE: reduce each column as 1D, as 1D and 2D object arrays handle None differently
+        return np.column_stack([array_group_reduce(array[:, i],
+                starts,
+                ends,
+                skipna=skipna,
+                ufunc=ufunc,
+                ufunc_skipna=ufunc_skipna,
+                ) for i in range(array.shape[1])])
+
+    post = [array_ufunc_axis_skipna(array[start: end],
+            skipna=skipna,
+            axis=0,
+            ufunc=ufunc,
+            ufunc_skipna=ufunc_skipna,
+            ) for start, end in zip(starts.tolist(), ends.tolist())]
+    array, _ = iterable_to_array_1d(post, count=len(post))
+    return array
+
+
+def array_group_count(
+        array: np.ndarray,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        *,
+        skipna: bool,
+        ) -> np.ndarray:
+    '''Count the values of groups of rows of a 1D or 2D ``array``, where each group is the rows from a position in ``starts`` to the corresponding position in ``ends``, optionally excluding NA values.
+    '''
+    if skipna:
+        return window_sums(~isna_array(array), starts, ends, DTYPE_INT_DEFAULT)
+    counts = ends - starts
+    if array.ndim == 2:
+        return np.repeat(counts.reshape(len(counts), 1), array.shape[1], axis=1)
+    return counts
+
+
+def array_group_select(
+        array: np.ndarray,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        *,
+        last: bool,
+        ) -> np.ndarray:
+    '''Select the first (or last) row of groups of rows of a 1D or 2D ``array``, where each group is the rows from a position in ``starts`` to the corresponding position in ``ends``.
+    '''
+    if (ends <= starts).any():
+        raise IndexError('cannot select from an empty group')
+    if last:
+        return array[ends - 1]
+    return array[starts]
+
 #-------------------------------------------------------------------------------
 # unique value discovery; based on NP's arraysetops.py
 
+# the maximum length of strings in an object array for conversion to a unicode array for sorting
+STR_FOR_SORT_LEN_MAX = 64
+STR_TYPE_SET = frozenset((str,))
+
+def array_for_sort(array: np.ndarray) -> np.ndarray:
+    '''Return an array that orders identically to the 1D ``array``. An object array of only ``str`` is converted to a unicode array, which NumPy sorts without Python comparisons. Strings with NUL characters (trailing NUL characters are not retained by a unicode array) or longer than ``STR_FOR_SORT_LEN_MAX`` are not converted.
+    '''
+    if array.dtype.kind != 'O' or not len(array):
+        return array
+    values = array.tolist()
+    # PERF: each check iterates in C
+    if set(map(type, values)) != STR_TYPE_SET or '\x00' in ''.join(values):
+        return array
+    size = max(map(len, values))
+    if size > STR_FOR_SORT_LEN_MAX:
+        return array
+    return array.astype(f'<U{size}')
+
 def argsort_array(array: np.ndarray, kind: str = DEFAULT_STABLE_SORT_KIND) -> np.ndarray:
     # NOTE: must use stable sort when returning positions
     if array.dtype.kind == 'O':
@@ -1029,11 +1227,46 @@ def ufunc_unique1d(array: np.ndarray) -> np.ndarray:
     return array[mask]
 
 
+def _ufunc_unique1d_indexer_hash(array: np.ndarray,
+        ) -> tp.Tuple[np.ndarray, np.ndarray]:
+    '''
+    Find the unique elements of a 1D array, in order of first appearance, by hashing. Returns unique values as well as index positions of those values in the original array. Raises TypeError if elements are not hashable.
+    '''
+    positions: tp.Dict[tp.Any, int] = {}
+    indexer = np.fromiter(
+            (positions.setdefault(v, len(positions)) for v in array.tolist()),
+            dtype=DTYPE_INT_DEFAULT,
+            count=len(array),
+            )
+    if array.dtype.kind == DTYPE_OBJECT_KIND:
+        # NOTE: assign elements individually, as tuples would otherwise be broadcast
+        unique = np.empty(len(positions), dtype=DTYPE_OBJECT)
+        for i, v in enumerate(positions):
+            unique[i] = v
+    else:
+        unique = np.array(list(positions), dtype=array.dtype)
+    return unique, indexer
+
+
 def ufunc_unique1d_indexer(array: np.ndarray,
         ) -> tp.Tuple[np.ndarray, np.ndarray]:
     '''
     Find the unique elements of an array. Optimized from NumPy implementation based on assumption of 1D array. Returns unique values as well as index positions of those values in the original array.
     '''
+    if array.dtype.kind in DTYPE_UNIQUE_HASH_KINDS:
+        # PERF: for strings and objects, hashing all elements and sorting only the unique values is much faster than sorting all elements
+        try:
+            unique, indexer = _ufunc_unique1d_indexer_hash(array)
+        except TypeError: # unhashable elements
+            pass
+        else:
+            order = argsort_array(unique)
+            remap = np.empty(len(order), dtype=DTYPE_INT_DEFAULT)
+            remap[order] = PositionsAllocator.get(len(order))
+            indexer = remap[indexer]
+            indexer.flags.writeable = False
+            return unique[order], indexer
+
     positions = argsort_array(array)
 
     # get the sorted array
@@ -1073,6 +1306,30 @@ def ufunc_unique1d_positions(array: np.ndarray,
     return positions[mask], indexer
 
 
+def ufunc_unique1d_indexer_ordered(array: np.ndarray,
+        ) -> tp.Tuple[np.ndarray, np.ndarray]:
+    '''
+    Find the unique elements of a 1D array, in order of first appearance. Returns unique values as well as index positions of those values in the original array.
+    '''
+    if array.dtype.kind in DTYPE_UNIQUE_HASH_KINDS:
+        try:
+            unique, indexer = _ufunc_unique1d_indexer_hash(array)
+        except TypeError: # unhashable elements
+            pass
+        else:
+            indexer.flags.writeable = False
+            return unique, indexer
+
+    # positions of first appearance, as ordered by unique values
+    positions, indexer = ufunc_unique1d_positions(array)
+    order = np.argsort(positions)
+    remap = np.empty(len(order), dtype=DTYPE_INT_DEFAULT)
+    remap[order] = PositionsAllocator.get(len(order))
+    indexer = remap[indexer]
+    indexer.flags.writeable = False
+    return array[positions[order]], indexer
+
+
 def ufunc_unique1d_counts(array: np.ndarray,
         ) -> tp.Tuple[np.ndarray, np.ndarray]:
     '''
@@ -1868,6 +2125,20 @@ def array_to_groups_and_locations(
     return ufunc_unique2d_indexer(array, axis=unique_axis)
 
 
+def locations_to_positions(
+        locations: np.ndarray,
+        count: int,
+        ) -> tp.Iterator[np.ndarray]:
+    '''Given the locations of each element's group (as returned by :obj:`array_to_groups_and_locations`) and the count of groups, yield, for each group, an immutable array of the ascending positions of its elements. All groups are found in a single pass, rather than one pass per group.
+    '''
+    order = np.argsort(locations, kind=DEFAULT_STABLE_SORT_KIND)
+    order.flags.writeable = False
+    start = 0
+    for end in np.bincount(locations, minlength=count).cumsum().tolist():
+        yield order[start: end]
+        start = end
+
+
 # def isna_element(value: tp.Any) -> bool:
 #     '''Return Boolean if value is an NA. This does not yet handle pd.NA
 #     '''
@@ -2892,6 +3163,224 @@ def ufunc_nanany(array: np.ndarray,
             axis=axis,
             out=out)
 
+#-------------------------------------------------------------------------------
+# cumulative functions that retain shape, applied in a single pass along an axis of a 1D or 2D array; as with np.nancumsum, the nan-prefixed variants skip NA values
+
+def _cumulative_count(
+        array: np.ndarray,
+        *,
+        skipna: bool,
+        axis: int = 0,
+        ) -> np.ndarray:
+    if skipna:
+        return np.cumsum(~isna_array(array), axis=axis, dtype=DTYPE_INT_DEFAULT)
+    shape = [1] * array.ndim
+    shape[axis] = array.shape[axis]
+    counts = np.arange(1, array.shape[axis] + 1, dtype=DTYPE_INT_DEFAULT).reshape(shape)
+    return np.broadcast_to(counts, array.shape).copy()
+
+
+def _cumulative_extreme(
+        array: np.ndarray,
+        *,
+        skipna: bool,
+        ufunc: np.ufunc,
+        ufunc_skipna: np.ufunc,
+        axis: int = 0,
+        ) -> np.ndarray:
+    '''
+    Accumulate ``ufunc`` (np.maximum or np.minimum); ``ufunc_skipna`` (np.fmax or np.fmin) is used to skip NaN and NaT. Leading NA values are retained.
+    '''
+    kind = array.dtype.kind
+    if kind in DTYPE_STR_KINDS:
+        # string dtypes do not support comparison ufuncs; selected values retain the source dtype
+        post = ufunc.accumulate(array.astype(DTYPE_OBJECT), axis=axis)
+        return post.astype(array.dtype) # type: ignore
+
+    if kind == 'O' and skipna:
+        isna = isna_array(array)
+        if isna.any():
+            if array.ndim == 2:
+                if axis == 1:
+                    return _cumulative_extreme(array.T,
+                            skipna=skipna,
+                            ufunc=ufunc,
+                            ufunc_skipna=ufunc_skipna,
+                            ).T
+                return np.column_stack([_cumulative_extreme(array[:, i],
+                        skipna=skipna,
+                        ufunc=ufunc,
+                        ufunc_skipna=ufunc_skipna,
+                        ) for i in range(array.shape[1])])
+            # NOTE: comparisons of objects cannot be vectorized; NA values are given the prior selection
+            post = array.copy()
+            select = max if ufunc is np.maximum else min
+            prior: tp.Any = None
+            found = False
+            for i, (value, value_isna) in enumerate(zip(array, isna.tolist())):
+                if not value_isna:
+                    prior = select(prior, value) if found else value
+                    found = True
+                if found:
+                    post[i] = prior
+            return post
+
+    if skipna and kind not in DTYPE_NUMERICABLE_KINDS and kind not in DTYPE_NAT_KINDS:
+        return ufunc.accumulate(array, axis=axis) # type: ignore
+    return (ufunc_skipna if skipna else ufunc).accumulate(array, axis=axis) # type: ignore
+
+
+def _cumulative_mean(
+        array: np.ndarray,
+        *,
+        skipna: bool,
+        axis: int = 0,
+        ) -> np.ndarray:
+    kind = array.dtype.kind
+    values = array
+    if skipna and (kind in DTYPE_INEXACT_KINDS or kind == 'O'):
+        isna = isna_array(array)
+        if isna.any():
+            values = np.where(isna, 0, array)
+
+    counts = _cumulative_count(array, skipna=skipna, axis=axis)
+    # accumulate in at least 64-bit precision
+    sums = np.cumsum(values,
+            axis=axis,
+            dtype=None if kind == DTYPE_COMPLEX_KIND or kind == 'O' else DTYPE_FLOAT_DEFAULT,
+            )
+    with WarningsSilent():
+        # positions preceded only by NA have a zero count and return NaN
+        post = sums / counts
+    if kind in DTYPE_INEXACT_KINDS:
+        return post.astype(array.dtype, copy=False) # type: ignore
+    return post # type: ignore
+
+
+def _cumulative_var(
+        array: np.ndarray,
+        *,
+        skipna: bool,
+        ddof: int,
+        axis: int = 0,
+        ) -> np.ndarray:
+    '''
+    Return the variance of all values up to and including each position along ``axis``. This uses the updates of Welford's algorithm, which, as each is independent of the prior update, can be vectorized as cumulative sums.
+    '''
+    if array.ndim == 2 and axis == 1:
+        return _cumulative_var(array.T, skipna=skipna, ddof=ddof).T
+
+    kind = array.dtype.kind
+    if kind == DTYPE_COMPLEX_KIND:
+        # as NumPy, the variance of complex values is the sum of the variance of the real and imaginary components
+        return (_cumulative_var(array.real, skipna=skipna, ddof=ddof) # type: ignore
+                + _cumulative_var(array.imag, skipna=skipna, ddof=ddof))
+
+    isna: tp.Optional[np.ndarray] = None
+    values = array
+    if skipna and (kind in DTYPE_INEXACT_KINDS or kind == 'O'):
+        isna = isna_array(array)
+        if isna.any():
+            values = np.where(isna, 0, array)
+        else:
+            isna = None
+    if values.dtype != DTYPE_FLOAT_DEFAULT:
+        values = values.astype(DTYPE_FLOAT_DEFAULT)
+
+    counts = _cumulative_count(array, skipna=skipna)
+    means = np.zeros(values.shape, dtype=DTYPE_FLOAT_DEFAULT)
+    np.divide(np.cumsum(values, axis=0), counts, out=means, where=counts > 0)
+    means_prior = np.empty_like(means)
+    means_prior[:1] = 0
+    means_prior[1:] = means[:-1]
+
+    # as (x - m_prior) * (x - m) is the change in the sum of squared deviations from including x, the sum of squared deviations is the cumulative sum of these changes
+    with WarningsSilent():
+        deltas = (values - means_prior) * (values - means)
+    if isna is not None:
+        deltas[isna] = 0
+
+    dof = counts - ddof
+    post = np.full(values.shape, np.nan, dtype=DTYPE_FLOAT_DEFAULT)
+    np.divide(np.cumsum(deltas, axis=0), dof, out=post, where=dof > 0)
+
+    if kind == DTYPE_FLOAT_KIND:
+        return post.astype(array.dtype, copy=False) # type: ignore
+    return post
+
+
+def ufunc_cummax(array: np.ndarray,
+        axis: int = 0,
+        ) -> np.ndarray:
+    return _cumulative_extreme(array,
+            skipna=False,
+            ufunc=np.maximum,
+            ufunc_skipna=np.fmax,
+            axis=axis,
+            )
+
+def ufunc_nancummax(array: np.ndarray,
+        axis: int = 0,
+        ) -> np.ndarray:
+    return _cumulative_extreme(array,
+            skipna=True,
+            ufunc=np.maximum,
+            ufunc_skipna=np.fmax,
+            axis=axis,
+            )
+
+def ufunc_cummin(array: np.ndarray,
+        axis: int = 0,
+        ) -> np.ndarray:
+    return _cumulative_extreme(array,
+            skipna=False,
+            ufunc=np.minimum,
+            ufunc_skipna=np.fmin,
+            axis=axis,
+            )
+
+def ufunc_nancummin(array: np.ndarray,
+        axis: int = 0,
+        ) -> np.ndarray:
+    return _cumulative_extreme(array,
+            skipna=True,
+            ufunc=np.minimum,
+            ufunc_skipna=np.fmin,
+            axis=axis,
+            )
+
+def ufunc_cummean(array: np.ndarray,
+        axis: int = 0,
+        ) -> np.ndarray:
+    return _cumulative_mean(array, skipna=False, axis=axis)
+
+def ufunc_nancummean(array: np.ndarray,
+        axis: int = 0,
+        ) -> np.ndarray:
+    return _cumulative_mean(array, skipna=True, axis=axis)
+
+def ufunc_cumstd(array: np.ndarray,
+        axis: int = 0,
+        ddof: int = 0,
+        ) -> np.ndarray:
+    return np.sqrt(_cumulative_var(array, skipna=False, ddof=ddof, axis=axis)) # type: ignore
+
+def ufunc_nancumstd(array: np.ndarray,
+        axis: int = 0,
+        ddof: int = 0,
+        ) -> np.ndarray:
+    return np.sqrt(_cumulative_var(array, skipna=True, ddof=ddof, axis=axis)) # type: ignore
+
+def ufunc_cumcount(array: np.ndarray,
+        axis: int = 0,
+        ) -> np.ndarray:
+    return _cumulative_count(array, skipna=False, axis=axis)
+
+def ufunc_nancumcount(array: np.ndarray,
+        axis: int = 0,
+        ) -> np.ndarray:
+    return _cumulative_count(array, skipna=True, axis=axis)
+
 #-------------------------------------------------------------------------------
 
 def array_from_element_attr(*,
@@ -0,0 +1,184 @@
+import sys
+import threading
+import typing as tp
+from collections import OrderedDict
+from functools import partial
+from weakref import ReferenceType
+from weakref import ref
+
+import numpy as np
+
+if tp.TYPE_CHECKING:
+    from static_frame.core.type_blocks import TypeBlocks  # pylint: disable=W0611 #pragma: no cover
+
+_module = sys.modules[__name__]
+
+
+class ValuesCacheConfig(tp.NamedTuple):
+    '''
+    Define how consolidated 2D values arrays are retained by :obj:`TypeBlocks` (and thus :obj:`Frame`) after first access. By default, arrays are retained up to a total of 256 MiB.
+
+    Args:
+        active: if False, no values arrays are retained.
+        nbytes_max: the maximum total bytes retained across all :obj:`TypeBlocks`, after which the least-recently used arrays are released; if None, retained bytes are unbounded.
+    '''
+    active: bool = True
+    nbytes_max: tp.Optional[int] = 1 << 28
+
+
+class ValuesCacheActive:
+    '''Utility interface for setting and storing the default values cache configuration.
+    '''
+
+    @staticmethod
+    def set(config: ValuesCacheConfig) -> None:
+        _module._values_cache_active = config # type: ignore
+        VALUES_CACHE.nbytes_max = config.nbytes_max if config.active else 0
+
+    @staticmethod
+    def get(**kwargs: tp.Union[bool, tp.Optional[int]]) -> ValuesCacheConfig:
+        config: ValuesCacheConfig = _module._values_cache_active # type: ignore
+        if not kwargs:
+            return config
+        return config._replace(**kwargs)
+
+    @classmethod
+    def update(cls, **kwargs: tp.Union[bool, tp.Optional[int]]) -> None:
+        cls.set(cls.get(**kwargs))
+
+
+class ValuesCache:
+    '''
+    A registry of :obj:`TypeBlocks` that retain a consolidated, immutable 2D values array, bounding the total bytes retained. :obj:`TypeBlocks` are referenced weakly: entries are discarded when a :obj:`TypeBlocks` is garbage collected, and the least-recently used arrays are evicted when ``nbytes_max`` is exceeded. All methods are thread safe.
+    '''
+    __slots__ = (
+            '_nbytes_max',
+            '_nbytes',
+            '_entries',
+            '_pending',
+            '_lock',
+            )
+
+    def __init__(self, nbytes_max: tp.Optional[int]) -> None:
+        '''
+        Args:
+            nbytes_max: the maximum total bytes retained; if None, retained bytes are unbounded; if 0, no arrays are retained.
+        '''
+        self._nbytes_max = nbytes_max
+        self._nbytes = 0
+        self._entries: tp.Dict[int, tp.Tuple[ReferenceType, int]] = OrderedDict()
+        # pairs of key, reference of collected TypeBlocks, removed from entries under the lock
+        self._pending: tp.List[tp.Tuple[int, ReferenceType]] = []
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._purge()
+            return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        '''The total bytes retained.
+        '''
+        with self._lock:
+            self._purge()
+            return self._nbytes
+
+    @property
+    def nbytes_max(self) -> tp.Optional[int]:
+        return self._nbytes_max
+
+    @nbytes_max.setter
+    def nbytes_max(self, value: tp.Optional[int]) -> None:
+        '''Set the maximum total bytes retained, evicting least-recently used arrays as necessary.
+        '''
+        with self._lock:
+            self._nbytes_max = value
+            self._evict()
+
+    #---------------------------------------------------------------------------
+    def _finalize(self, key: int, reference: ReferenceType) -> None:
+        # NOTE: called by the garbage collector at any time, possibly while the lock is held by an operation in progress; removal is thus deferred to the next operation, and list.append is atomic
+        self._pending.append((key, reference))
+
+    def _purge(self) -> None:
+        '''Remove entries of collected TypeBlocks. Must be called with the lock held.
+        '''
+        pending = self._pending
+        while pending:
+            key, reference = pending.pop()
+            entry = self._entries.get(key)
+            # the key (an id) might have been reused by a new entry
+            if entry is not None and entry[0] is reference:
+                del self._entries[key]
+                self._nbytes -= entry[1]
+
+    def _pop(self, key: int) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._nbytes -= entry[1]
+
+    def _evict(self) -> None:
+        '''Release least-recently used arrays until within ``nbytes_max``. Must be called with the lock held.
+        '''
+        self._purge()
+        if self._nbytes_max is None:
+            return
+        while self._nbytes > self._nbytes_max:
+            key_evict = next(iter(self._entries))
+            tb_evict = self._entries[key_evict][0]()
+            self._pop(key_evict)
+            if tb_evict is not None:
+                tb_evict._values_cache = None
+
+    #---------------------------------------------------------------------------
+    def get(self, tb: 'TypeBlocks') -> tp.Optional[np.ndarray]:
+        '''Return the values array retained by ``tb``, if defined, marking it as recently used.
+        '''
+        array = tb._values_cache
+        if array is not None:
+            with self._lock:
+                if id(tb) in self._entries:
+                    self._entries.move_to_end(id(tb)) # type: ignore
+        return array
+
+    def set(self, tb: 'TypeBlocks', array: np.ndarray) -> None:
+        '''Retain ``array`` on ``tb`` if it fits within ``nbytes_max``, evicting least-recently used arrays as necessary.
+        '''
+        nbytes = array.nbytes
+        with self._lock:
+            if self._nbytes_max is not None and nbytes > self._nbytes_max:
+                return
+            self._purge()
+            key = id(tb)
+            self._pop(key)
+            self._entries[key] = (ref(tb, partial(self._finalize, key)), nbytes)
+            self._nbytes += nbytes
+            tb._values_cache = array
+            self._evict()
+
+    def discard(self, tb: 'TypeBlocks') -> None:
+        '''Release the values array retained by ``tb``, if defined.
+        '''
+        if tb._values_cache is not None:
+            with self._lock:
+                tb._values_cache = None
+                self._pop(id(tb))
+
+    def clear(self) -> None:
+        '''Release all retained values arrays.
+        '''
+        with self._lock:
+            for reference, _ in list(self._entries.values()):
+                tb = reference()
+                if tb is not None:
+                    tb._values_cache = None
+            self._entries.clear()
+            self._pending.clear()
+            self._nbytes = 0
+
+
+#-------------------------------------------------------------------------------
+
+_module._values_cache_active = ValuesCacheConfig() # type: ignore
+VALUES_CACHE = ValuesCache(_module._values_cache_active.nbytes_max) # type: ignore
@@ -31,6 +31,8 @@ from static_frame.core.node_selector import InterfaceSelectTrio
 from static_frame.core.series import Series
 from static_frame.core.store_client_mixin import StoreClientMixin
 from static_frame.core.style_config import StyleConfig
+from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_INT_DEFAULT
 from static_frame.core.util import DTYPE_OBJECT
 from static_frame.core.util import NAME_DEFAULT
 from static_frame.core.util import GetItemKeyType
@@ -49,12 +51,14 @@ class Yarn(ContainerBase, StoreClientMixin):
             '_series',
             '_hierarchy',
             '_index',
+            '_offsets',
             '_deepcopy_from_bus',
             )
 
     _series: Series
     _hierarchy: IndexHierarchy
     _index: IndexBase
+    _offsets: np.ndarray
 
     _NDIM: int = 1
 
@@ -191,6 +195,18 @@ class Yarn(ContainerBase, StoreClientMixin):
         if len(self._index) != len(self._hierarchy):
             raise ErrorInitYarn(f'Length of supplied index ({len(self._index)}) not of sufficient size ({len(self._hierarchy)}).')
 
+        # cumulative widths of Bus: the start position of each Bus in the realized length, followed by the realized length
+        offsets = np.zeros(len(self._series) + 1, dtype=DTYPE_INT_DEFAULT)
+        np.cumsum(
+                np.fromiter((len(b) for b in self._series.values),
+                        count=len(self._series),
+                        dtype=DTYPE_INT_DEFAULT,
+                        ),
+                out=offsets[1:],
+                )
+        offsets.flags.writeable = False
+        self._offsets = offsets
+
     #---------------------------------------------------------------------------
     # deferred loading of axis info
 
@@ -493,6 +509,23 @@ class Yarn(ContainerBase, StoreClientMixin):
     #---------------------------------------------------------------------------
     # extraction
 
+    def _key_to_positions(self, key: GetItemKeyType) -> np.ndarray:
+        '''
+        Convert an iloc key (a slice, Boolean array, or iterable of integers) into an array of non-negative realized positions, without allocating an array of the realized length.
+        '''
+        size = len(self._index)
+        if key.__class__ is slice:
+            return np.arange(*key.indices(size), dtype=DTYPE_INT_DEFAULT) #type: ignore
+        if hasattr(key, 'values') and not isinstance(key, np.ndarray):
+            key = key.values #type: ignore
+        positions = np.asarray(key)
+        if positions.dtype == DTYPE_BOOL:
+            return np.flatnonzero(positions)
+        positions = positions.astype(DTYPE_INT_DEFAULT, copy=False).reshape(-1)
+        if len(positions) and positions.min() < 0:
+            positions = np.where(positions < 0, positions + size, positions)
+        return positions
+
     def _extract_iloc(self, key: GetItemKeyType) -> 'Yarn':
         '''
         Returns:
@@ -503,27 +536,42 @@ class Yarn(ContainerBase, StoreClientMixin):
             # got a single element, return a Frame
             return self._series[target_hierarchy[0]][target_hierarchy[1]] #type: ignore
 
+        # map realized positions to Bus positions and Bus-local positions
+        positions = self._key_to_positions(key)
+        bus_pos = np.searchsorted(self._offsets, positions, side='right') - 1
+
+        if len(bus_pos) > 1 and (bus_pos[1:] < bus_pos[:-1]).any():
+            # as each Bus can only be included once, Frames must be grouped by Bus; group by order of first occurrence of Bus, retaining order within each Bus
+            _, first, inverse = np.unique(bus_pos, return_index=True, return_inverse=True)
+            rank = np.empty(len(first), dtype=DTYPE_INT_DEFAULT)
+            rank[np.argsort(first, kind='stable')] = np.arange(len(first))
+            order = np.argsort(rank[inverse.reshape(-1)], kind='stable')
+            if (order[1:] < order[:-1]).any():
+                # the index and hierarchy must follow the grouped order
+                positions = positions[order]
+                bus_pos = bus_pos[order]
+                key = positions
+                target_hierarchy = self._hierarchy._extract_iloc(key)
+
+        local = positions - self._offsets[bus_pos]
+
         # get the outer-most index of the hierarchical index
         target_bus_index = target_hierarchy.unique(depth_level=0, order_by_occurrence=True)
         target_bus_index = next(iter(target_hierarchy._index_constructors))(target_bus_index)
 
-        # create a Boolean array equal to the entire realized length
-        valid = np.full(len(self._index), False)
-        valid[key] = True
         index = self._index.iloc[key]
-
         buses = np.empty(len(target_bus_index), dtype=DTYPE_OBJECT)
 
-        pos = 0
-        for bus_label, width in self._hierarchy.label_widths_at_depth(0):
-            if bus_label not in target_bus_index:
-                pos += width
-                continue
-            extract_per_bus = valid[pos: pos+width]
-            pos += width
+        # bus_pos is now grouped; find the start of each contiguous run
+        starts = np.flatnonzero(np.r_[True, bus_pos[1:] != bus_pos[:-1]]) if len(bus_pos) else bus_pos
+        ends = np.r_[starts[1:], len(bus_pos)]
 
-            idx = target_bus_index.loc_to_iloc(bus_label)
-            buses[idx] = self._series[bus_label]._extract_iloc(extract_per_bus)
+        bus_labels = self._series.index
+        bus_values = self._series.values
+        for start, end in zip(starts, ends):
+            bp = bus_pos[start]
+            idx = target_bus_index.loc_to_iloc(bus_labels[bp])
+            buses[idx] = bus_values[bp]._extract_iloc(local[start: end])
 
         buses.flags.writeable = False
         target_series = Series(buses,
@@ -868,6 +868,71 @@ class FrameIterGroupApply_R(FrameIterGroupApply, Reference):
         self.pdf_str_index_str.groupby(['zZbu', 'ztsv']).apply(lambda f: len(f))
 
 
+class FrameIterGroupReduce(Perf):
+    NUMBER = 100
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.sff_int = ff.parse('s(100_000,10)|v(int,float)|i(I,str)|c(I,str)').assign[
+                sf.ILoc[0]].apply(lambda s: s % 1000)
+        self.pdf_int = self.sff_int.to_pandas()
+
+class FrameIterGroupReduce_N(FrameIterGroupReduce, Native):
+
+    def int_sum(self) -> None:
+        self.sff_int.iter_group('zZbu').sum()
+
+    def int_mean(self) -> None:
+        self.sff_int.iter_group('zZbu').mean()
+
+    def int_apply_sum(self) -> None:
+        self.sff_int.iter_group('zZbu').apply(lambda f: f.sum())
+
+class FrameIterGroupReduce_R(FrameIterGroupReduce, Reference):
+
+    def int_sum(self) -> None:
+        self.pdf_int.groupby('zZbu').sum()
+
+    def int_mean(self) -> None:
+        self.pdf_int.groupby('zZbu').mean()
+
+    def int_apply_sum(self) -> None:
+        self.pdf_int.groupby('zZbu').apply(lambda f: f.sum())
+
+
+class SeriesIterWindowReduce(Perf):
+    NUMBER = 20
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.sfs_float = ff.parse('s(100_000,1)|v(float)|i(I,str)').iloc[:, 0]
+        self.pds_float = self.sfs_float.to_pandas()
+
+class SeriesIterWindowReduce_N(SeriesIterWindowReduce, Native):
+
+    def float_mean(self) -> None:
+        self.sfs_float.iter_window(size=20).mean()
+
+    def float_std(self) -> None:
+        self.sfs_float.iter_window(size=20).std()
+
+    def float_apply_mean(self) -> None:
+        self.sfs_float.iter_window_array(size=20).apply(np.mean)
+
+class SeriesIterWindowReduce_R(SeriesIterWindowReduce, Reference):
+
+    def float_mean(self) -> None:
+        self.pds_float.rolling(20).mean()
+
+    def float_std(self) -> None:
+        self.pds_float.rolling(20).std(ddof=0)
+
+    def float_apply_mean(self) -> None:
+        self.pds_float.rolling(20).apply(np.mean, raw=True)
+
+
 #-------------------------------------------------------------------------------
 class Pivot(Perf):
     NUMBER = 150
@@ -24,6 +24,7 @@ class TestUnit(TestCase):
             memory_total(i._positions, seen=seen),
             memory_total(i._recache, seen=seen),
             memory_total(i._name, seen=seen),
+            memory_total(i._labels_is_sorted, seen=seen),
             getsizeof(i) if id(i) not in seen else 0
         )))
 
@@ -36,6 +37,7 @@ class TestUnit(TestCase):
             memory_total(i._positions, seen=seen),
             memory_total(i._recache, seen=seen),
             memory_total(i._name, seen=seen),
+            memory_total(i._labels_is_sorted, seen=seen),
             memory_total(i._labels_mutable, seen=seen),
             memory_total(i._labels_mutable_dtype, seen=seen),
             memory_total(i._positions_mutable_count, seen=seen),
@@ -60,7 +62,9 @@ class TestUnit(TestCase):
             memory_total(tb._index, seen=seen),
             memory_total(tb._shape, seen=seen),
             memory_total(tb._row_dtype, seen=seen),
-            memory_total(tb._dtypes, seen=seen),
+            memory_total(tb._consolidate_config, seen=seen),
+            memory_total(tb._blocks_consolidated, seen=seen),
+            memory_total(tb._values_cache, seen=seen),
             getsizeof(tb) if id(tb) not in seen else 0,
         )))
 
@@ -151,11 +151,11 @@ class TestUnit(TestCase):
         self.assertTrue(len(post) > 0)
 
     @unittest.skip('pending')
-    def test_cols_to_slice(self) -> None:
+    def test_pairs_to_block_slices(self) -> None:
         pass
 
     @unittest.skip('pending')
-    def test_indices_to_contiguous_pairs(self) -> None:
+    def test_runs_to_block_slices(self) -> None:
         pass
 
     @unittest.skip('pending')
@@ -21,6 +21,7 @@ from static_frame.core.exception import AxisInvalid
 from static_frame.core.exception import ErrorNPYDecode
 from static_frame.core.exception import ErrorNPYEncode
 from static_frame.core.frame import Frame
+from static_frame.core.frame import FrameGO
 from static_frame.core.index import Index
 from static_frame.test.test_case import TestCase
 from static_frame.test.test_case import temp_file
@@ -601,6 +602,63 @@ class TestUnit(TestCase):
         # Assert that no error was printed to stderr.
         self.assertEqual(buffer.getvalue(), '')
 
+    #---------------------------------------------------------------------------
+    def test_archive_index_intern_a(self) -> None:
+        f1 = ff.parse('s(4,3)|v(int)|i(ID,dtD)|c(I,str)').rename('a')
+        f2 = ff.parse('s(4,3)|v(bool)|i(ID,dtD)|c(I,str)').rename('b')
+        f3 = f2.rename('c', index='x')
+
+        with TemporaryDirectory() as fp:
+            fps = [os.path.join(fp, f'{f.name}.npz') for f in (f1, f2, f3)]
+            for f, fp_npz in zip((f1, f2, f3), fps):
+                f.to_npz(fp_npz)
+
+            post1, post2, post3 = (Frame.from_npz(fp_npz) for fp_npz in fps)
+            self.assertIs(post1.index, post2.index)
+            self.assertIs(post1.columns, post2.columns)
+            self.assertIs(post1.columns, post3.columns)
+            # names differ
+            self.assertIsNot(post1.index, post3.index)
+            self.assertTrue(post1.index.equals(post3.index))
+
+            # grow-only columns are not shared
+            post4 = FrameGO.from_npz(fps[0])
+            self.assertIsNot(post4.columns, post1.columns)
+            self.assertIs(post4.index, post1.index)
+
+    def test_archive_index_intern_b(self) -> None:
+        f1 = ff.parse('s(4,3)|v(int)|i((I,ID),(str,dtD))|c(I,str)').rename('a')
+        f2 = ff.parse('s(4,3)|v(bool)|i((I,ID),(str,dtD))|c(I,str)').rename('b')
+        b1 = Bus.from_frames((f1, f2))
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp)
+            b2 = Bus.from_zip_npz(fp)
+            self.assertIs(b2['a'].index, b2['b'].index)
+            self.assertIs(b2['a'].columns, b2['b'].columns)
+            self.assertEqual(b2['a'].index.depth, 2)
+
+    def test_archive_index_intern_c(self) -> None:
+        names = (1, True, 1.0, (1, 'a'), (True, 'a'))
+        frames = [ff.parse('s(4,3)|v(int)|i(I,str)').rename(index=name) for name in names]
+
+        with TemporaryDirectory() as fp:
+            fps = [os.path.join(fp, f'{i}.npz') for i in range(len(frames))]
+            for f, fp_npz in zip(frames, fps):
+                f.to_npz(fp_npz)
+
+            posts = [Frame.from_npz(fp_npz) for fp_npz in fps]
+            for name, post in zip(names, posts):
+                self.assertEqual(post.index.name, name)
+                self.assertIs(post.index.name.__class__, name.__class__)
+                if name.__class__ is tuple:
+                    self.assertEqual(
+                            [n.__class__ for n in post.index.name],
+                            [n.__class__ for n in name],
+                            )
+            self.assertIsNot(posts[0].index, posts[1].index)
+            self.assertIsNot(posts[3].index, posts[4].index)
+
     #---------------------------------------------------------------------------
     def test_archive_zip_file_open_a(self) -> None:
 
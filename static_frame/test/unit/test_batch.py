@@ -1,4 +1,5 @@
 import datetime
+import os
 import time
 import typing as tp
 
@@ -23,9 +24,15 @@ def func1(f: Frame) -> Frame:
     return f.loc['q']
 
 
+def func_pid_shape(f: Frame) -> tp.Tuple[int, tp.Tuple[int, int]]:
+    return os.getpid(), f.shape
+
 def func2(label: tp.Hashable, f: Frame) -> Frame:
     return f.loc['q']
 
+def func3(s: Series) -> Series:
+    return s * 10
+
 class TestUnit(TestCase):
 
     def test_normalize_container_a(self) -> None:
@@ -2691,6 +2698,76 @@ class TestUnit(TestCase):
                 ['U', 'U', 'U']
                 )
 
+    #---------------------------------------------------------------------------
+
+    def test_batch_pipeline_a(self) -> None:
+        f1 = ff.parse('s(4,3)|v(float)|c(I,str)').rename('a')
+        f2 = ff.parse('s(4,3)|v(float)|c(I,str)').rename('b')
+        b1 = Batch.from_frames((f1, f2))
+        b2 = b1.iloc[:2].fillna(0).sum()
+        # operations are recorded without evaluation
+        self.assertEqual(len(b1._pipeline), 0)
+        self.assertEqual(len(b2._pipeline), 3)
+        self.assertEqual(b2._pipeline[0].args[0], '_extract_iloc')
+        post = b2.to_frame()
+        self.assertEqual(post.index.values.tolist(), ['a', 'b'])
+        self.assertEqual(post.loc['a'].values.tolist(),
+                f1.iloc[:2].fillna(0).sum().values.tolist())
+
+    def test_batch_pipeline_b(self) -> None:
+        f1 = Frame.from_dict(dict(a=(1,2), b=(3,4)), index=('x', 'y'), name='f1')
+        f2 = Frame.from_dict(dict(c=(1,2,3), b=(4,5,6)), index=('x', 'q', 'z'), name='f2')
+        f3 = Frame.from_dict(dict(d=(10,20), b=(50,60)), index=('x', 'q'), name='f3')
+
+        # a dropped item does not proceed to later steps
+        post = (Batch.from_frames((f1, f2, f3), max_workers=2)
+                .apply_except(func1, KeyError)
+                .apply(func3)
+                .to_frame(fill_value=0))
+        self.assertEqual(post.to_pairs(),
+                (('b', (('f2', 50), ('f3', 600))), ('c', (('f2', 20), ('f3', 0))), ('d', (('f2', 0), ('f3', 200))))
+                )
+
+    def test_batch_pipeline_c(self) -> None:
+        f1 = ff.parse('s(20,4)|v(int,float)').rename('a')
+        f2 = ff.parse('s(20,4)|v(int,float)').rename('b')
+
+        with temp_file('.zip') as fp:
+            Batch.from_frames((f1, f2)).to_zip_npz(fp)
+            post1 = Batch.from_zip_npz(fp, max_workers=2).loc[:10].via_container.sum().to_frame()
+            post2 = Batch.from_zip_npz(fp).loc[:10].via_container.sum().to_frame()
+            self.assertTrue(post1.equals(post2, compare_dtype=True))
+
+    def test_batch_pipeline_d(self) -> None:
+        f1 = ff.parse('s(20,4)|v(int,float)').rename('a')
+        f2 = ff.parse('s(20,4)|v(int,float)').rename('b')
+
+        with temp_file('.zip') as fp:
+            Batch.from_frames((f1, f2)).to_zip_parquet(fp)
+            b1 = Batch.from_zip_parquet(fp, max_workers=2, config=StoreConfig(index_depth=1))
+            self.assertIsNotNone(b1._store)
+            # the store is retained by derived Batch, such that workers read
+            b2 = b1.apply_items(func2).iloc[:3]
+            self.assertIs(b2._store, b1._store)
+            post1 = b1.loc[:10].sum().to_frame()
+            post2 = Batch.from_zip_parquet(fp, config=StoreConfig(index_depth=1)).loc[:10].sum().to_frame()
+            self.assertTrue(post1.equals(post2, compare_dtype=True))
+
+    def test_batch_pipeline_e(self) -> None:
+        f1 = ff.parse('s(20,4)|v(int,float)').rename('a')
+        f2 = ff.parse('s(20,4)|v(int,float)').rename('b')
+
+        with temp_file('.zip') as fp:
+            Batch.from_frames((f1, f2)).to_zip_pickle(fp)
+            b1 = Batch.from_zip_pickle(fp, max_workers=2)
+            # Frames read in the calling process are never used
+            b1._items = ()
+            post = dict(b1.apply(func_pid_shape).items())
+            self.assertEqual(set(post.keys()), {'a', 'b'})
+            # Frames are read, and processed, in worker processes
+            self.assertTrue(all(pid != os.getpid() for pid, _ in post.values()))
+            self.assertEqual([shape for _, shape in post.values()], [(20, 4), (20, 4)])
+
 if __name__ == '__main__':
     import unittest
     unittest.main()
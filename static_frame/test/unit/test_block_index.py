@@ -0,0 +1,170 @@
+import copy
+import pickle
+
+import numpy as np
+
+from static_frame.core.block_index import FROM_WIDTHS_ITER_MAX
+from static_frame.core.block_index import BlockIndex
+from static_frame.core.block_index import pairs_to_block_slices
+from static_frame.core.block_index import runs_to_block_slices
+from static_frame.core.type_blocks import TypeBlocks
+from static_frame.test.test_case import TestCase
+
+
+class TestUnit(TestCase):
+
+    #---------------------------------------------------------------------------
+    def test_runs_to_block_slices_a(self) -> None:
+        block = np.array([0, 0, 2, 2])
+        column = np.array([1, 2, 3, 1])
+        self.assertEqual(list(runs_to_block_slices(block, column)), [
+                (0, slice(1, 3)),
+                (2, slice(3, 4)),
+                (2, slice(1, 2)),
+                ])
+
+    def test_runs_to_block_slices_b(self) -> None:
+        block = np.array([0, 0, 0, 1, 1, 1, 1])
+        column = np.array([2, 1, 0, 3, 2, 1, 2])
+        self.assertEqual(list(runs_to_block_slices(block, column)), [
+                (0, slice(2, None, -1)),
+                (1, slice(3, 0, -1)),
+                (1, slice(2, 3)),
+                ])
+
+    def test_runs_to_block_slices_c(self) -> None:
+        # a change of direction ends a run
+        block = np.array([0, 0, 0, 0])
+        column = np.array([0, 1, 0, 1])
+        post = list(runs_to_block_slices(block, column))
+        self.assertEqual(post[0], (0, slice(0, 2)))
+        a = np.arange(8).reshape(2, 4)
+        self.assertEqual(
+                np.concatenate([a[:, s] for _, s in post], axis=1).tolist(),
+                a[:, column].tolist(),
+                )
+
+    def test_runs_to_block_slices_d(self) -> None:
+        empty = np.array([], dtype=np.int64)
+        self.assertEqual(list(runs_to_block_slices(empty, empty)), [])
+        self.assertEqual(list(runs_to_block_slices(np.array([3]), np.array([5]))),
+                [(3, slice(5, 6))])
+
+    def test_runs_to_block_slices_e(self) -> None:
+        # long selections use array operations; results match iterating pairs
+        rng = np.random.default_rng(0)
+        block = np.sort(rng.integers(0, 4, 200))
+        column = rng.integers(0, 3, 200)
+        column[50:120] = np.arange(70)
+        column[150:190] = np.arange(40)[::-1]
+        self.assertEqual(list(runs_to_block_slices(block, column)),
+                list(pairs_to_block_slices(zip(block.tolist(), column.tolist()))))
+
+    def test_pairs_to_block_slices_a(self) -> None:
+        self.assertEqual(list(pairs_to_block_slices([])), [])
+        self.assertEqual(list(pairs_to_block_slices([(0, 2), (0, 1), (0, 0), (0, 1)])),
+                [(0, slice(2, None, -1)), (0, slice(1, 2))])
+        self.assertEqual(list(pairs_to_block_slices([(1, 0), (1, 2), (2, 3), (2, 4)])),
+                [(1, slice(0, 1)), (1, slice(2, 3)), (2, slice(3, 5))])
+
+    #---------------------------------------------------------------------------
+    def test_block_index_from_pairs_a(self) -> None:
+        bi = BlockIndex.from_pairs([(0, 0), (0, 1), (1, 0)], [np.dtype(int), np.dtype(bool)])
+        self.assertEqual(len(bi), 3)
+        self.assertEqual(bi[1], (0, 1))
+        self.assertIs(bi._block, None)
+        # arrays are created on demand, then maintained with pairs
+        self.assertEqual(bi.block.tolist(), [0, 0, 1])
+        self.assertEqual(bi.column.tolist(), [0, 1, 0])
+        bi.register(np.arange(4).reshape(2, 2))
+        self.assertEqual(bi.pairs, [(0, 0), (0, 1), (1, 0), (2, 0), (2, 1)])
+        self.assertEqual(bi.block.tolist(), [0, 0, 1, 2, 2])
+        self.assertEqual(bi.column.tolist(), [0, 1, 0, 0, 1])
+
+    def test_block_index_from_widths_b(self) -> None:
+        widths = [1] * (FROM_WIDTHS_ITER_MAX + 1)
+        bi = BlockIndex.from_widths(widths, [np.dtype(int)] * len(widths))
+        self.assertIs(bi._pairs, None)
+        self.assertEqual(bi[-1], (FROM_WIDTHS_ITER_MAX, 0))
+        self.assertEqual(bi.pairs, [(i, 0) for i in range(len(widths))])
+
+    #---------------------------------------------------------------------------
+    def test_block_index_from_widths_a(self) -> None:
+        bi = BlockIndex.from_widths([2, 1, 3], [np.dtype(int), np.dtype(bool), np.dtype(float)])
+        self.assertEqual(len(bi), 6)
+        self.assertEqual(list(bi), [(0, 0), (0, 1), (1, 0), (2, 0), (2, 1), (2, 2)])
+        self.assertEqual(list(reversed(bi))[0], (2, 2))
+        self.assertEqual(bi[-1], (2, 2))
+        self.assertEqual(bi[2], (1, 0))
+        self.assertEqual(bi.dtypes.tolist(),
+                [np.dtype(int), np.dtype(int), np.dtype(bool), np.dtype(float), np.dtype(float), np.dtype(float)])
+
+        with self.assertRaises(IndexError):
+            _ = bi[6]
+
+    def test_block_index_register_a(self) -> None:
+        bi = BlockIndex()
+        self.assertFalse(bi.register(np.empty((3, 0))))
+        for i in range(20):
+            self.assertTrue(bi.register(np.arange(3)))
+        self.assertTrue(bi.register(np.arange(6).reshape(3, 2)))
+        self.assertEqual(len(bi), 22)
+        self.assertEqual(bi.block.tolist()[-4:], [18, 19, 20, 20])
+        self.assertEqual(bi.column.tolist()[-4:], [0, 0, 0, 1])
+
+        bi2 = bi.copy()
+        bi2.register(np.arange(3))
+        self.assertEqual(len(bi), 22)
+        self.assertEqual(len(bi2), 23)
+
+    def test_block_index_copy_a(self) -> None:
+        bi1 = BlockIndex.from_widths([2, 1], [np.dtype(int), np.dtype(str)])
+        bi2 = copy.deepcopy(bi1)
+        bi3 = pickle.loads(pickle.dumps(bi1))
+        for bi in (bi2, bi3):
+            self.assertEqual(list(bi), list(bi1))
+            self.assertTrue(bi.dtypes_equal(bi1))
+
+    def test_block_index_dtypes_equal_a(self) -> None:
+        bi1 = BlockIndex.from_widths([2, 1], [np.dtype(int), np.dtype(int)])
+        bi2 = BlockIndex.from_widths([3], [np.dtype(int)])
+        bi3 = BlockIndex.from_widths([3], [np.dtype(float)])
+        self.assertTrue(bi1.dtypes_equal(bi2))
+        self.assertFalse(bi1.dtypes_equal(bi3))
+        self.assertFalse(bi1.dtypes_equal(BlockIndex()))
+
+    #---------------------------------------------------------------------------
+    def test_block_index_iter_block_slices_a(self) -> None:
+        tb = TypeBlocks.from_blocks((np.arange(6).reshape(2, 3), np.arange(2), np.arange(4).reshape(2, 2)))
+        bi = tb._index
+
+        self.assertEqual(list(bi.iter_block_slices(slice(1, 5))),
+                [(0, slice(1, 3)), (1, slice(0, 1)), (2, slice(0, 1))])
+        self.assertEqual(list(bi.iter_block_slices(slice(None, None, -1))),
+                [(2, slice(1, None, -1)), (1, slice(0, 1)), (0, slice(2, None, -1))])
+        self.assertEqual(list(bi.iter_block_slices(slice(None, None, -1), retain_key_order=False)),
+                [(0, slice(0, 3)), (1, slice(0, 1)), (2, slice(0, 2))])
+        self.assertEqual(list(bi.iter_block_slices(np.array([True, False, True, True, False, True]))),
+                [(0, slice(0, 1)), (0, slice(2, 3)), (1, slice(0, 1)), (2, slice(1, 2))])
+        self.assertEqual(list(bi.iter_block_slices([5, 0, 1])),
+                [(2, slice(1, 2)), (0, slice(0, 2))])
+        self.assertEqual(list(bi.iter_block_slices([5, 0, 1], retain_key_order=False)),
+                [(0, slice(0, 2)), (2, slice(1, 2))])
+        self.assertEqual(list(bi.iter_block_slices([])), [])
+
+        with self.assertRaises(NotImplementedError):
+            list(bi.iter_block_slices('a'))
+
+    def test_block_index_iter_block_slices_b(self) -> None:
+        bi1 = BlockIndex.from_widths([3, 1, 2], [np.dtype(int)] * 3)
+        bi2 = bi1.copy()
+        bi2.block # create arrays
+        for key in (slice(1, 5), slice(None, None, -1), [5, 0, 1], np.array([True, False, True, True, False, True])):
+            self.assertEqual(list(bi1.iter_block_slices(key)), list(bi2.iter_block_slices(key)))
+            self.assertEqual(list(bi1.iter_block_slices(key, retain_key_order=False)),
+                    list(bi2.iter_block_slices(key, retain_key_order=False)))
+
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
@@ -0,0 +1,148 @@
+import numpy as np
+
+from static_frame.core.block_parallel import BlockParallelActive
+from static_frame.core.block_parallel import BlockParallelConfig
+from static_frame.core.block_parallel import apply_chunked
+from static_frame.core.block_parallel import chunk_rows
+from static_frame.core.block_parallel import chunk_slices
+from static_frame.core.block_parallel import get_executor
+from static_frame.core.block_parallel import parallel_config
+from static_frame.core.frame import Frame
+from static_frame.core.type_blocks import TypeBlocks
+from static_frame.test.test_case import TestCase
+
+
+class TestUnit(TestCase):
+
+    def setUp(self) -> None:
+        self._config = BlockParallelActive.get()
+        BlockParallelActive.update(active=True, nbytes_min=0, chunk_nbytes=64, max_workers=2)
+
+    def tearDown(self) -> None:
+        BlockParallelActive.set(self._config)
+
+    #---------------------------------------------------------------------------
+    def test_parallel_config_a(self) -> None:
+        a1 = np.arange(10)
+        self.assertIsNotNone(parallel_config((a1,), a1.nbytes))
+        self.assertIsNone(parallel_config((a1, np.array(['a'])), a1.nbytes))
+        self.assertIsNone(parallel_config((a1, np.array([None])), a1.nbytes))
+
+        BlockParallelActive.update(nbytes_min=1000)
+        self.assertIsNone(parallel_config((a1,), a1.nbytes))
+
+        BlockParallelActive.update(nbytes_min=0, max_workers=1)
+        self.assertIsNone(parallel_config((a1,), a1.nbytes))
+
+        BlockParallelActive.set(BlockParallelConfig(active=False))
+        self.assertIsNone(parallel_config((a1,), a1.nbytes))
+
+    def test_block_parallel_config_a(self) -> None:
+        self.assertFalse(BlockParallelConfig().active)
+        self.assertFalse(self._config.active)
+
+    def test_get_executor_a(self) -> None:
+        e1 = get_executor(2)
+        e2 = get_executor(3)
+        self.assertIsNot(e1, e2)
+        self.assertIs(get_executor(2), e1)
+        # a prior executor remains usable
+        self.assertEqual(e1.submit(sum, (1, 2)).result(), 3)
+
+    def test_chunk_slices_a(self) -> None:
+        self.assertEqual(chunk_slices(10, 64, 64), [slice(None)])
+        self.assertEqual(chunk_slices(10, 0, 64), [slice(None)])
+        self.assertEqual(chunk_slices(10, 160, 64),
+                [slice(0, 4), slice(4, 8), slice(8, 12)])
+
+    def test_apply_chunked_a(self) -> None:
+        a1 = np.arange(40).reshape(20, 2)
+        a2 = np.arange(3)
+        config = BlockParallelActive.get()
+        post = apply_chunked(
+                [lambda key: chunk_rows(np.negative, a1, key),
+                lambda key: chunk_rows(np.negative, a2, key)],
+                [20, 3],
+                [a1.nbytes, a2.nbytes],
+                config,
+                )
+        self.assertEqual(post[0].tolist(), (-a1).tolist())
+        self.assertEqual(post[1].tolist(), [0, -1, -2])
+        self.assertFalse(post[0].flags.writeable)
+        self.assertFalse(post[1].flags.writeable)
+
+    #---------------------------------------------------------------------------
+    def test_type_blocks_unary_a(self) -> None:
+        a1 = np.arange(60).reshape(20, 3)
+        a2 = np.arange(20) * 0.5
+        tb = TypeBlocks.from_blocks((a1, a2))
+        post = -tb
+        self.assertEqual(post.shapes.tolist(), [(20, 3), (20,)])
+        self.assertEqual(post.values.tolist(), (-tb.values).tolist())
+        self.assertEqual(abs(post).values.tolist(), tb.values.tolist())
+
+    def test_type_blocks_binary_a(self) -> None:
+        a1 = np.arange(60).reshape(20, 3)
+        a2 = np.arange(20) > 10
+        tb1 = TypeBlocks.from_blocks((a1, a2))
+        tb2 = TypeBlocks.from_blocks((a1 * 2, a2))
+
+        post = tb1 + tb2
+        BlockParallelActive.update(active=False)
+        self.assertTrue(post.equals(tb1 + tb2, compare_dtype=True))
+        BlockParallelActive.update(active=True)
+        self.assertEqual((tb1 * 2).values.tolist(), (tb1.values * 2).tolist())
+        self.assertEqual((tb1 == 3).values.tolist(), (tb1.values == 3).tolist())
+
+        row = np.arange(4)
+        self.assertEqual((tb1 - row).values.tolist(), (tb1.values - row).tolist())
+
+        other = np.arange(80).reshape(20, 4)
+        self.assertEqual((tb1 < other).values.tolist(), (tb1.values < other).tolist())
+
+    def test_type_blocks_round_a(self) -> None:
+        tb = TypeBlocks.from_blocks((np.arange(40).reshape(20, 2) / 3, np.arange(20) / 7))
+        post = round(tb, 2)
+        self.assertEqual(post.shapes.tolist(), [(20, 2), (20,)])
+        self.assertEqual(post.values.tolist(), np.round(tb.values, 2).tolist())
+
+    def test_type_blocks_ufunc_axis_a(self) -> None:
+        a1 = np.arange(60).reshape(20, 3)
+        a2 = np.arange(20) * 0.5
+        a3 = np.arange(40).reshape(20, 2)
+        f1 = Frame(TypeBlocks.from_blocks((a1, a2, a3)))
+        f2 = Frame(a1)
+        values = f1.values
+
+        self.assertEqual(f1.sum(axis=0).values.tolist(), values.sum(axis=0).tolist())
+        self.assertEqual(f1.sum(axis=1).values.tolist(), values.sum(axis=1).tolist())
+        self.assertEqual(f1.max(axis=1).values.tolist(), values.max(axis=1).tolist())
+        self.assertEqual(f1.mean(axis=1).values.tolist(), values.mean(axis=1).tolist())
+        self.assertEqual(f2.min(axis=0).values.tolist(), a1.min(axis=0).tolist())
+        self.assertEqual(f2.prod(axis=1).values.tolist(), a1.prod(axis=1).tolist())
+
+    def test_type_blocks_ufunc_axis_b(self) -> None:
+        # results must be identical with and without the thread pool
+        a1 = np.random.default_rng(0).random((40, 8)) * 1e6
+        a2 = np.random.default_rng(1).random(40)
+        a3 = np.random.default_rng(2).random((40, 3)).astype(np.float32)
+        frames = (
+                Frame(a1),
+                Frame(TypeBlocks.from_blocks((a1, a2, a3))),
+                Frame(TypeBlocks.from_blocks((a1.T.copy().T, a2))), # F-ordered
+                )
+        funcs = ('sum', 'mean', 'std', 'var', 'prod', 'min', 'max')
+        for f in frames:
+            for func in funcs:
+                for axis in (0, 1):
+                    BlockParallelActive.update(active=True)
+                    post1 = getattr(f, func)(axis=axis).values
+                    BlockParallelActive.update(active=False)
+                    post2 = getattr(f, func)(axis=axis).values
+                    self.assertEqual(post1.dtype, post2.dtype)
+                    self.assertEqual(post1.tobytes(), post2.tobytes())
+
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
@@ -0,0 +1,155 @@
+import numpy as np
+
+from static_frame.core.consolidate import ConsolidateActive
+from static_frame.core.consolidate import ConsolidateConfig
+from static_frame.core.consolidate import Fragmentation
+from static_frame.core.frame import Frame
+from static_frame.core.frame import FrameGO
+from static_frame.core.memory_measure import memory_total
+from static_frame.core.type_blocks import TypeBlocks
+from static_frame.test.test_case import TestCase
+
+
+class TestUnit(TestCase):
+
+    #---------------------------------------------------------------------------
+    def test_fragmentation_a(self) -> None:
+        config = ConsolidateConfig(block_count_min=4, fragmentation_min=0.5)
+        self.assertEqual(Fragmentation(0, 0, 0).fragmentation, 0.0)
+        self.assertEqual(Fragmentation(4, 1, 4).fragmentation, 0.75)
+        self.assertTrue(Fragmentation(4, 1, 4).exceeds(config))
+        self.assertFalse(Fragmentation(4, 3, 4).exceeds(config))
+        self.assertFalse(Fragmentation(3, 1, 3).exceeds(config))
+        self.assertFalse(Fragmentation(4, 1, 4).exceeds(config._replace(active=False)))
+
+    def test_consolidate_active_a(self) -> None:
+        config = ConsolidateActive.get()
+        try:
+            self.assertEqual(ConsolidateActive.get(block_count_min=2).block_count_min, 2)
+            self.assertEqual(ConsolidateActive.get(), config)
+
+            ConsolidateActive.update(block_count_min=2)
+            self.assertEqual(ConsolidateActive.get().block_count_min, 2)
+            self.assertEqual(ConsolidateActive.get().fragmentation_min, config.fragmentation_min)
+        finally:
+            ConsolidateActive.set(config)
+
+    #---------------------------------------------------------------------------
+    def test_type_blocks_consolidate_lazy_a(self) -> None:
+        tb = TypeBlocks.from_blocks([np.arange(3) for _ in range(40)] + [np.array(['a', 'b', 'c'])])
+        self.assertEqual(tb.fragmentation, (41, 2, 41))
+
+        # column-wise access does not consolidate
+        _ = tb._extract_array(column_key=3)
+        self.assertEqual(len(tb._blocks), 41)
+
+        # a pending column-wise generator is not affected by row-wise access
+        columns = tb.axis_values(axis=0)
+        self.assertEqual(next(columns).tolist(), [0, 1, 2])
+
+        row = list(tb.iter_row_elements(1))
+        self.assertEqual(row, [1] * 40 + ['b'])
+        blocks = tb._consolidate_lazy()
+        self.assertEqual([b.shape for b in blocks], [(3, 40), (3,)])
+        self.assertFalse(blocks[0].flags.writeable)
+
+        # the stored blocks and index are not mutated
+        self.assertEqual(len(tb._blocks), 41)
+        self.assertEqual(tb.fragmentation, (41, 2, 41))
+        self.assertEqual(list(tb._index)[38:], [(38, 0), (39, 0), (40, 0)])
+        self.assertEqual(len(list(columns)), 40)
+
+        # appending discards the consolidated blocks
+        tb.append(np.arange(3))
+        self.assertIs(tb._blocks_consolidated, None)
+        self.assertEqual(tb._extract_array(column_key=-1).tolist(), [0, 1, 2])
+        self.assertEqual(tb.shape, (3, 42))
+        self.assertEqual(list(tb.iter_row_elements(2)), [2] * 40 + ['c', 2])
+        self.assertEqual(len(tb._consolidate_lazy()), 3)
+
+    def test_type_blocks_consolidate_lazy_b(self) -> None:
+        tb = TypeBlocks.from_blocks([np.arange(3) for _ in range(40)])
+        tb._consolidate_config = ConsolidateConfig(active=False)
+        _ = tb.values
+        self.assertIs(tb._consolidate_lazy(), tb._blocks)
+        self.assertEqual(len(tb._blocks), 40)
+
+        # the configuration is retained by copies
+        tb = TypeBlocks.from_blocks([np.arange(3) for _ in range(4)])
+        tb._consolidate_config = ConsolidateConfig(block_count_min=4)
+        tb2 = tb.copy()
+        self.assertEqual(tb2.values.tolist(), [[0] * 4, [1] * 4, [2] * 4])
+        self.assertEqual(len(tb2._consolidate_lazy()), 1)
+        self.assertEqual(len(tb2._blocks), 4)
+        self.assertIs(tb._blocks_consolidated, None)
+
+    def test_type_blocks_consolidate_lazy_c(self) -> None:
+        # the decision not to consolidate is retained until the next append
+        tb = TypeBlocks.from_blocks([np.arange(3), np.array(['a', 'b', 'c'])] * 20)
+        self.assertFalse(tb.fragmentation.exceeds(ConsolidateActive.get(block_count_min=2)))
+        blocks = tb._consolidate_lazy()
+        self.assertIs(blocks, tb._blocks)
+        self.assertIs(tb._consolidate_lazy(), blocks)
+        self.assertEqual(list(tb.iter_row_elements(0)), [0, 'a'] * 20)
+
+        tb.append(np.arange(3))
+        self.assertIs(tb._blocks_consolidated, None)
+        self.assertEqual(len(tb._consolidate_lazy()), 41)
+
+    def test_type_blocks_consolidate_lazy_d(self) -> None:
+        # data larger than nbytes_max is not consolidated, and so is not retained twice
+        tb = TypeBlocks.from_blocks([np.arange(1000) for _ in range(40)])
+        tb._consolidate_config = ConsolidateConfig(nbytes_max=tb.nbytes - 1)
+        nbytes_total = memory_total(tb)
+        self.assertEqual(list(tb.iter_row_elements(2)), [2] * 40)
+        self.assertIs(tb._consolidate_lazy(), tb._blocks)
+        self.assertEqual(memory_total(tb), nbytes_total)
+
+        # otherwise, the retained consolidated blocks are reported
+        tb = tb.copy()
+        tb._consolidate_config = ConsolidateConfig(nbytes_max=tb.nbytes)
+        nbytes_total = memory_total(tb)
+        self.assertEqual(list(tb.iter_row_elements(2)), [2] * 40)
+        self.assertEqual(len(tb._consolidate_lazy()), 1)
+        self.assertTrue(memory_total(tb) - nbytes_total >= tb.nbytes)
+
+        tb._consolidate_config = ConsolidateConfig(nbytes_max=None)
+        tb.append(np.arange(1000))
+        self.assertEqual(len(tb._consolidate_lazy()), 1)
+
+    #---------------------------------------------------------------------------
+    def test_frame_consolidate_policy_a(self) -> None:
+        f1 = FrameGO(index=range(3))
+        for i in range(40):
+            f1[i] = np.arange(3) * i
+        self.assertEqual(f1.fragmentation.block_count, 40)
+        self.assertEqual(f1.fragmentation.block_count_consolidated, 1)
+
+        f2 = f1.consolidate_policy(ConsolidateConfig(active=False))
+        self.assertEqual(f2.sum(axis=1).values.tolist(), [0, 780, 1560])
+        self.assertEqual(f2.fragmentation.block_count, 40)
+
+        s = f1.sum(axis=1)
+        self.assertEqual(s.values.tolist(), [0, 780, 1560])
+        self.assertEqual(len(f1._blocks._consolidate_lazy()), 1)
+        self.assertEqual(f1.fragmentation.block_count, 40)
+
+        f1[40] = np.array(['a', 'b', 'c'])
+        self.assertEqual(f1.fragmentation, (41, 2, 41))
+        self.assertEqual(f1.iloc[2].values.tolist()[-2:], [78, 'c'])
+
+    def test_frame_consolidate_policy_b(self) -> None:
+        f1 = Frame.from_concat([Frame(np.arange(2), columns=(f'c{i}',)) for i in range(4)], axis=1)
+        self.assertEqual(f1.fragmentation.block_count, 4)
+
+        f2 = f1.consolidate_policy(ConsolidateConfig(block_count_min=2))
+        self.assertEqual(tuple(f2.iter_tuple(axis=1, constructor=tuple)), ((0, 0, 0, 0), (1, 1, 1, 1)))
+        self.assertEqual(len(f2._blocks._consolidate_lazy()), 1)
+        self.assertEqual(f2.fragmentation.block_count, 4)
+        self.assertIs(f1._blocks._blocks_consolidated, None)
+        self.assertTrue(f2.equals(f1, compare_dtype=True))
+
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
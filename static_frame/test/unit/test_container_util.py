@@ -27,6 +27,8 @@ from static_frame.core.container_util import key_to_ascending_key
 from static_frame.core.container_util import matmul
 from static_frame.core.container_util import pandas_to_numpy
 from static_frame.core.container_util import pandas_version_under_1
+from static_frame.core.container_util import values_for_lex_descending
+from static_frame.core.rank import rank_1d
 from static_frame.core.exception import AxisInvalid
 from static_frame.core.fill_value_auto import FillValueAuto
 from static_frame.core.frame import FrameHE
@@ -807,6 +809,28 @@ class TestUnit(TestCase):
         self.assertEqual([a.shape for a in stack],
                 [(2, 1)])
 
+    #---------------------------------------------------------------------------
+    def test_values_for_lex_descending_a(self) -> None:
+        for a in (
+                np.array([3, -1, 3, np.iinfo(np.int64).min, np.iinfo(np.int64).max]),
+                np.array([3, 0, 255, 3], dtype=np.uint8),
+                np.array([True, False, True]),
+                np.array([0.5, -2.0, 0.5, np.inf]),
+                np.array(['2021', '1999', '2021'], dtype='datetime64[Y]'),
+                np.array(['b', 'a', 'b', 'c']),
+                ):
+            post = values_for_lex_descending(a)
+            self.assertEqual(len(post), 1)
+            self.assertEqual(np.lexsort(post).tolist(),
+                    np.lexsort([rank_1d(a, method='dense', ascending=False)]).tolist())
+
+    def test_values_for_lex_descending_b(self) -> None:
+        # NaN and NaT are ordered first, retaining their order
+        a1 = np.array([1.0, np.nan, 3.0, np.nan, 2.0])
+        self.assertEqual(np.lexsort(values_for_lex_descending(a1)).tolist(), [1, 3, 2, 4, 0])
+        a2 = np.array(['2020', 'NaT', '2021'], dtype='datetime64[Y]')
+        self.assertEqual(np.lexsort(values_for_lex_descending(a2)).tolist(), [1, 2, 0])
+
 
 if __name__ == '__main__':
     import unittest
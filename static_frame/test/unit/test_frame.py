@@ -36,6 +36,7 @@ from static_frame import IndexSecond
 from static_frame import IndexYear
 from static_frame import IndexYearGO
 from static_frame import IndexYearMonth
+from static_frame import NPZ
 from static_frame import Series
 from static_frame import TypeBlocks
 from static_frame import mloc
@@ -4023,6 +4024,50 @@ class TestUnit(TestCase):
                 (('p', (('w', 2), ('x', 30), ('y', 2), ('z', 30))), ('q', (('w', 4), ('x', 1020), ('y', 190), ('z', 2190))), ('r', (('w', 12), ('x', 61200), ('y', 190), ('z', 109500))))
                 )
 
+    def test_frame_cummax_a(self) -> None:
+        records = (
+                (2, 2.5, 'c', True),
+                (30, np.nan, 'a', False),
+                (1, 1.5, 'd', True),
+                )
+        f1 = Frame.from_records(records,
+                columns=('p', 'q', 'r', 's'),
+                index=('x', 'y', 'z'))
+
+        f2 = f1.cummax()
+        self.assertEqual(f2.to_pairs(0),
+                (('p', (('x', 2), ('y', 30), ('z', 30))), ('q', (('x', 2.5), ('y', 2.5), ('z', 2.5))), ('r', (('x', 'c'), ('y', 'c'), ('z', 'd'))), ('s', (('x', True), ('y', True), ('z', True))))
+                )
+        # block types are retained
+        self.assertEqual(f2.dtypes.values.tolist(), f1.dtypes.values.tolist())
+
+        self.assertEqual(f1[['p', 'q']].cummin(axis=1).to_pairs(0),
+                (('p', (('x', 2.0), ('y', 30.0), ('z', 1.0))), ('q', (('x', 2.0), ('y', 30.0), ('z', 1.0))))
+                )
+
+        with self.assertRaises(AxisInvalid):
+            f1.cummax(axis=2)
+
+    def test_frame_cummean_a(self) -> None:
+        records = (
+                (2, 2.5, None),
+                (30, np.nan, 'a'),
+                (1, 1.5, 'b'),
+                )
+        f1 = Frame.from_records(records,
+                columns=('p', 'q', 'r'),
+                index=('x', 'y', 'z'))
+
+        self.assertEqual(f1[['p', 'q']].cummean().to_pairs(0),
+                (('p', (('x', 2.0), ('y', 16.0), ('z', 11.0))), ('q', (('x', 2.5), ('y', 2.5), ('z', 2.0))))
+                )
+        self.assertEqual(f1.cumcount().to_pairs(0),
+                (('p', (('x', 1), ('y', 2), ('z', 3))), ('q', (('x', 1), ('y', 1), ('z', 2))), ('r', (('x', 0), ('y', 1), ('z', 2))))
+                )
+        self.assertEqual(round(f1[['p', 'q']].cumstd(skipna=False).fillna(-1), 2).to_pairs(0),
+                (('p', (('x', 0.0), ('y', 14.0), ('z', 13.44))), ('q', (('x', 0.0), ('y', -1.0), ('z', -1.0))))
+                )
+
     def test_frame_min_a(self) -> None:
         # reindex both axis
         records = (
@@ -5216,6 +5261,24 @@ class TestUnit(TestCase):
                 (('a', (('x', 3), ('y', 8), ('z', 2))), ('c', (('x', 3), ('y', 4), ('z', 6))), ('b', (('x', 7), ('y', 1), ('z', 9))))
                 )
 
+    def test_frame_sort_values_q(self) -> None:
+        f1 = sf.Frame.from_fields((
+                np.array(['2021-01-02', '2021-01-01', '2021-01-02', '2021-01-01', 'NaT'], dtype='datetime64[D]'),
+                np.array(['b', 'a', 'a', 'b', 'a'], dtype=object),
+                np.array([1.5, np.nan, 0.5, 2.5, 1.0]),
+                ),
+                columns=('date', 'symbol', 'price'),
+                index=tuple('vwxyz'),
+                )
+        f2 = f1.sort_values(['date', 'symbol'], ascending=(False, True))
+        self.assertEqual(f2.index.values.tolist(), ['z', 'x', 'v', 'w', 'y'])
+
+        f3 = f1.sort_values(['symbol', 'price'], ascending=(True, False))
+        self.assertEqual(f3.index.values.tolist(), ['w', 'z', 'x', 'y', 'v'])
+
+        f4 = f1.sort_values('symbol', ascending=False)
+        self.assertEqual(f4.index.values.tolist(), ['y', 'v', 'z', 'x', 'w'])
+
     #---------------------------------------------------------------------------
 
     def test_frame_relabel_a(self) -> None:
@@ -9856,6 +9919,43 @@ class TestUnit(TestCase):
             self.assertTrue(f1.equals(f2))
             self.assertIs(f2.__class__, FrameGO)
 
+    def test_frame_to_npz_l(self) -> None:
+        f1 = Frame.from_fields((
+                np.array(['a', 'bb', 'a', 'c'] * 25, dtype=object),
+                np.arange(100),
+                ), columns=('a', 'b'))
+        f2 = f1.assign.loc[3, 'a'](None)
+
+        with temp_file('.npz') as fp:
+            with self.assertRaises(ErrorNPYEncode):
+                f1.to_npz(fp) # object blocks cannot be stored
+            f1.to_npz(fp, dictionary_encode=True)
+            f3 = Frame.from_npz(fp)
+            self.assertTrue(f1.equals(f3, compare_dtype=True))
+
+            # not all strings, so cannot be encoded
+            with self.assertRaises(ErrorNPYEncode):
+                f2.to_npz(fp, dictionary_encode=True)
+
+    def test_frame_to_npz_m(self) -> None:
+        f1 = Frame.from_fields((
+                np.array(['AAPL', 'MSFT', 'IBM', 'AAPL'] * 25, dtype='<U8'),
+                np.array(['a', 'bb', 'a', 'c'] * 25, dtype=object),
+                np.array(['abcdefghij' + str(i) for i in range(100)]),
+                ), columns=('a', 'b', 'c'), name='foo')
+
+        with temp_file('.npz') as fp:
+            f1.to_npz(fp, dictionary_encode=True)
+            f2 = Frame.from_npz(fp)
+            contents = NPZ(fp).contents
+
+        self.assertTrue(f1.equals(f2, compare_dtype=True, compare_name=True))
+        self.assertEqual(f2['b'].values.tolist(), ['a', 'bb', 'a', 'c'] * 25)
+        # the high-cardinality column c is stored as is
+        self.assertEqual(
+                [n for n in contents.index if n.startswith('__blocks_dictionary_')],
+                ['__blocks_dictionary_0__.npy', '__blocks_dictionary_1__.npy'])
+
     def test_frame_to_npz_empty(self) -> None:
         f1 = Frame()
 
@@ -9976,6 +10076,16 @@ class TestUnit(TestCase):
             f2.equals(f3, compare_dtype=True, compare_class=True, compare_name=True)
             self.assertEqual(f3._blocks.shapes.tolist(), [(20, 50)])
 
+    def test_frame_to_npy_j(self) -> None:
+        f1 = Frame(np.array([['a', 'b'], ['b', 'a']] * 50, dtype=object), name='foo')
+
+        with TemporaryDirectory() as fp:
+            os.rmdir(fp) # let it be re-created
+            f1.to_npy(fp, dictionary_encode=True)
+            f2 = Frame.from_npy(fp)
+            self.assertTrue(f1.equals(f2, compare_dtype=True, compare_name=True))
+            self.assertEqual(f2._blocks.shapes.tolist(), [(100, 2)])
+
     def test_frame_to_npy_failure_a(self) -> None:
         from datetime import date
         with TemporaryDirectory() as fp:
@@ -1,4 +1,5 @@
 import typing as tp
+from functools import partial
 
 import frame_fixtures as ff
 import numpy as np
@@ -744,6 +745,69 @@ class TestUnit(TestCase):
         self.assertEqual(post2[obj_b].to_pairs(0),
                 (('a', ((2, 5),)), ('b', ((2, 6),)), ('c', ((2, obj_b),))))
 
+    def test_frame_iter_group_reduce_a(self) -> None:
+        f = ff.parse('s(7,4)|v(int,float,bool,str)|c(I,str)').assign[
+                'zZbu'].apply(lambda s: s % 3)
+        f = f.assign.loc[f.index.iloc[1], 'ztsv'](np.nan)
+
+        for name in ('sum', 'mean', 'min', 'max', 'count'):
+            f1 = f.drop['zkuW'] if name in ('sum', 'mean') else f
+            post = getattr(f1.iter_group('zZbu'), name)()
+            self.assertEqual(post.index.name, 'zZbu')
+            self.assertEqual(post.columns.values.tolist(), f1.columns.values.tolist())
+            # reductions are equivalent to those of each group
+            for label, g in f1.iter_group_items('zZbu'):
+                for column in f1.columns:
+                    expected = getattr(g[column], name)()
+                    if isinstance(expected, str):
+                        self.assertEqual(post.loc[label, column], expected)
+                    else:
+                        self.assertAlmostEqual(post.loc[label, column], expected)
+
+        post1 = f.iter_group('zZbu', drop=True).first()
+        self.assertEqual(post1[['zUvW', 'zkuW']].to_pairs(),
+                (('zUvW', ((0, True), (1, False), (2, False))), ('zkuW', ((0, 'z2Oo'), (1, 'zCE3'), (2, 'z5l6')))))
+        self.assertTrue(np.isnan(post1.loc[2, 'ztsv']))
+
+        post2 = f.iter_group('zZbu', drop=True).last()
+        self.assertEqual(post2.to_pairs(),
+                (('ztsv', ((0, -610.8), (1, 1325.38), (2, 114.58))), ('zUvW', ((0, True), (1, True), (2, True))), ('zkuW', ((0, 'z2Oo'), (1, 'zIA5'), (2, 'zr4u')))))
+
+    def test_frame_iter_group_reduce_b(self) -> None:
+        objs = [object() for _ in range(2)]
+        f = sf.FrameGO.from_records(
+                [[1, 2.5, objs[0]], [3, np.nan, objs[0]], [5, 6.0, objs[1]]],
+                columns=tuple('abc'),
+                )
+        # keys that cannot be sorted
+        post1 = f.iter_group('c', drop=True).sum()
+        self.assertEqual(post1.__class__, sf.FrameGO)
+        self.assertEqual(post1.to_pairs(),
+                (('a', ((objs[0], 4), (objs[1], 5))), ('b', ((objs[0], 2.5), (objs[1], 6.0)))))
+        post2 = f.iter_group_items(['c', 'a'], drop=True).mean(skipna=False)
+        self.assertEqual(set(post2.index), {(objs[0], 1), (objs[0], 3), (objs[1], 5)})
+        self.assertEqual(post2.loc[(objs[0], 1), 'b'], 2.5)
+        self.assertTrue(np.isnan(post2.loc[(objs[0], 3), 'b']))
+
+    def test_frame_iter_group_reduce_c(self) -> None:
+        f = sf.Frame.from_records([[1, 2, 1], [3, 4, 3], [5, np.nan, 1]],
+                index=('x', 'y', 'z'),
+                columns=tuple('abc'),
+                )
+        # group columns by values in a row
+        post1 = f.iter_group('x', axis=1).count()
+        self.assertEqual(post1.to_pairs(),
+                ((1, (('x', 2), ('y', 2), ('z', 2))), (2, (('x', 1), ('y', 1), ('z', 0)))))
+        post2 = f.iter_group_array('x', axis=1).sum()
+        self.assertEqual(post2.to_pairs(),
+                ((1, (('x', 2.0), ('y', 6.0), ('z', 6.0))), (2, (('x', 2.0), ('y', 4.0), ('z', 0.0)))))
+
+        post3 = f.iloc[:0].iter_group('a').max()
+        self.assertEqual(post3.shape, (0, 3))
+
+        with self.assertRaises(AxisInvalid):
+            f.iter_group('a', axis=2).sum()
+
     #---------------------------------------------------------------------------
 
     def test_frame_iter_group_labels_a(self) -> None:
@@ -1031,6 +1095,37 @@ class TestUnit(TestCase):
         self.assertEqual(len(post), 18)
         self.assertTrue(all(f.shape == (3, 4) for f in post))
 
+    def test_frame_iter_window_reduce_a(self) -> None:
+        f1 = Frame.from_records(((1, 2.5, 'a'), (3, np.nan, 'b'), (5, 6.5, 'c'), (7, 8.5, 'd')),
+                columns=('p', 'q', 'r'),
+                index=('w', 'x', 'y', 'z'))
+
+        post1 = f1.iter_window(size=2).max()
+        self.assertEqual(post1.to_pairs(),
+                (('p', (('x', 3), ('y', 5), ('z', 7))), ('q', (('x', 2.5), ('y', 6.5), ('z', 8.5))), ('r', (('x', 'b'), ('y', 'c'), ('z', 'd')))))
+        self.assertEqual(post1.dtypes.values.tolist(),
+                [np.dtype(np.int64), np.dtype(np.float64), np.dtype('<U1')])
+
+        post2 = f1[['p', 'q']].iter_window(size=3).mean()
+        self.assertEqual(post2.to_pairs(),
+                (('p', (('y', 3.0), ('z', 5.0))), ('q', (('y', 4.5), ('z', 7.5)))))
+
+        post3 = f1.iter_window_array(size=2, step=2, label_shift=-1).last()
+        self.assertEqual(post3.fillna(0).to_pairs(),
+                (('p', (('w', 3), ('y', 7))), ('q', (('w', 0.0), ('y', 8.5))), ('r', (('w', 'b'), ('y', 'd')))))
+
+    def test_frame_iter_window_reduce_b(self) -> None:
+        f1 = Frame.from_records(((1, 2, 3), (4, 5, 6)),
+                columns=('p', 'q', 'r'),
+                index=('x', 'y'))
+        post1 = f1.iter_window(size=2, axis=1).sum()
+        self.assertEqual(post1.to_pairs(),
+                (('q', (('x', 3), ('y', 9))), ('r', (('x', 5), ('y', 11)))))
+
+        post2 = f1.iter_window(size=2, axis=1, label_shift=-1, window_sized=False).count()
+        self.assertEqual(post2.to_pairs(),
+                (('p', (('x', 2), ('y', 2))), ('q', (('x', 2), ('y', 2))), ('r', (('x', 1), ('y', 1)))))
+
     #---------------------------------------------------------------------------
 
     def test_frame_axis_interface_a(self) -> None:
@@ -7,6 +7,8 @@ from io import StringIO
 
 import numpy as np
 from arraykit import mloc
+from automap import AutoMap  # pylint: disable=E0611
+from automap import FrozenAutoMap  # pylint: disable=E0611
 
 from static_frame import DisplayConfig
 from static_frame import Frame
@@ -23,6 +25,8 @@ from static_frame.core.exception import ErrorInitIndex
 from static_frame.core.exception import ErrorInitIndexNonUnique
 from static_frame.core.exception import LocInvalid
 from static_frame.core.index import _index_initializer_needs_init
+from static_frame.core.loc_map import FrozenAutoMapDeferred
+from static_frame.core.loc_map import RangeMap
 from static_frame.core.util import NULL_SLICE
 from static_frame.core.util import PositionsAllocator
 from static_frame.core.util import arrays_equal
@@ -154,6 +158,75 @@ class TestUnit(TestCase):
         with self.assertRaises(ErrorInitIndex):
             _ = Index(np.array(('2021-02', '2022-04'), dtype=np.datetime64))
 
+    def test_index_init_n(self) -> None:
+        # ascending labels are unique, and the map is created on first lookup
+        idx1 = Index(np.array([2, 5, 9]))
+        self.assertIs(idx1._map.__class__, FrozenAutoMapDeferred)
+        self.assertTrue(idx1._labels_is_sorted)
+        self.assertTrue(5 in idx1)
+        self.assertEqual(idx1.loc_to_iloc(9), 2)
+        self.assertIs(idx1._map.__class__, FrozenAutoMap)
+
+        idx2 = Index(np.array(['b', 'c', 'f']))
+        self.assertIs(idx2._map.__class__, FrozenAutoMapDeferred)
+        self.assertFalse(idx2._labels_is_sorted)
+        self.assertEqual(idx2.loc_to_iloc(['f', 'b']), [2, 0])
+
+        with self.assertRaises(ErrorInitIndexNonUnique):
+            _ = Index(np.array([2, 5, 5]))
+
+        self.assertIs(Index(np.array([5, 2]))._map.__class__, FrozenAutoMap)
+        self.assertIs(IndexGO(np.array([2, 5]))._map.__class__, AutoMap)
+
+    def test_index_init_o(self) -> None:
+        idx1 = Index(np.array([2, 5, 9, 1]), name='a')
+
+        # slice and Boolean selections of unique labels are unique
+        idx2 = idx1[1:]
+        self.assertIs(idx2._map.__class__, FrozenAutoMapDeferred)
+        self.assertEqual(idx2.name, 'a')
+        self.assertEqual(idx2.loc_to_iloc(1), 2)
+
+        idx3 = idx1[np.array([True, False, True, True])]
+        self.assertIs(idx3._map.__class__, FrozenAutoMapDeferred)
+        self.assertEqual(idx3.loc_to_iloc([9, 2]), [1, 0])
+
+        with self.assertRaises(ErrorInitIndexNonUnique):
+            _ = idx1[[0, 0]]
+
+        idx4 = pickle.loads(pickle.dumps(idx2))
+        self.assertEqual(idx4.loc_to_iloc(5), 0)
+        idx5 = copy.deepcopy(idx3)
+        self.assertEqual(idx5.loc_to_iloc(9), 1)
+
+        # selections of all labels share the map, realized or deferred
+        self.assertIs(idx1._extract_iloc(None)._map, idx1._map) # type: ignore
+        self.assertIs(idx1[:]._map, idx1._map)
+        idx6 = idx1[1:][:]
+        self.assertIs(idx6._map.__class__, FrozenAutoMapDeferred)
+        self.assertIs(idx6[:]._map, idx6._map)
+        self.assertEqual(idx6.loc_to_iloc(1), 2)
+
+    def test_index_init_p(self) -> None:
+        # evenly spaced labels are mapped to positions arithmetically
+        idx1 = Index(np.arange(100, 200, 4))
+        self.assertEqual(idx1.loc_to_iloc(108), 2)
+        self.assertIs(idx1._map.__class__, RangeMap)
+        self.assertEqual(idx1.loc_to_iloc([196, 100]), [24, 0])
+        self.assertEqual(idx1.loc_to_iloc(slice(104, 112)), slice(1, 4, None))
+        with self.assertRaises(KeyError):
+            _ = idx1.loc_to_iloc(102)
+
+        idx2 = IndexDate.from_date_range('2020-01-01', '2020-03-31')
+        self.assertEqual(idx2.loc_to_iloc('2020-02-01'), 31)
+        self.assertIs(idx2._map.__class__, RangeMap)
+        self.assertTrue(np.datetime64('2020-03-31') in idx2)
+        self.assertFalse(np.datetime64('2020-04-01') in idx2)
+
+        idx3 = copy.deepcopy(idx1)
+        self.assertEqual(idx3.loc_to_iloc(112), 3)
+        idx4 = pickle.loads(pickle.dumps(idx2))
+        self.assertEqual(idx4.loc_to_iloc('2020-01-03'), 2)
 
     #---------------------------------------------------------------------------
 
@@ -308,6 +381,45 @@ class TestUnit(TestCase):
         post1 = idx1.loc_to_iloc([3, 0])
         self.assertEqual(post1.tolist(), [3, 0]) #type: ignore
 
+    def test_index_loc_to_iloc_n(self) -> None:
+        idx1 = Index((3, 10, 20, 40))
+        post1 = idx1.loc_to_iloc(np.array([40, 3]))
+        self.assertEqual(post1.tolist(), [3, 0]) #type: ignore
+        self.assertTrue(idx1._labels_is_sorted)
+
+        with self.assertRaises(KeyError):
+            idx1.loc_to_iloc(np.array([40, 4]))
+
+        idx2 = Index((3, 20, 10))
+        self.assertEqual(idx2.loc_to_iloc(np.array([10, 3])), [2, 0])
+        self.assertFalse(idx2._labels_is_sorted)
+
+    def test_index_loc_to_iloc_p(self) -> None:
+        idx1 = Index(np.arange(10_000) ** 2)
+        key = list(range(9_999, -1, -2))
+        # long lists of numbers are resolved as arrays
+        post1 = idx1.loc_to_iloc([k ** 2 for k in key])
+        self.assertEqual(post1.tolist(), key) #type: ignore
+        self.assertEqual(idx1.loc_to_iloc([16, 0]), [4, 0])
+        # lists that are not homogeneous numbers are mapped per label
+        post2 = idx1._loc_to_iloc([True, 'a', *range(5_000)], partial_selection=True)
+        self.assertEqual(post2[:3], [1, 0, 1]) #type: ignore
+
+        # missing labels raise the same KeyError for short and long lists and arrays
+        key = [0, 2, 3] + [1] * 5_000
+        for k in (key, key[:3], np.array(key), np.array(key[:3])):
+            with self.assertRaises(KeyError) as cm:
+                idx1.loc_to_iloc(k)
+            self.assertEqual(cm.exception.args, (2,))
+
+    def test_index_loc_to_iloc_o(self) -> None:
+        idx1 = IndexGO((1, 2))
+        self.assertEqual(idx1.loc_to_iloc(np.array([2])).tolist(), [1]) #type: ignore
+        idx1.append(0)
+        # the cached evaluation is discarded when labels change
+        self.assertEqual(idx1.loc_to_iloc(np.array([0, 2])), [2, 1])
+        self.assertFalse(idx1._labels_is_sorted)
+
     #---------------------------------------------------------------------------
 
     def test_index_mloc_a(self) -> None:
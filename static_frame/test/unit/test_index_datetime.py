@@ -417,7 +417,7 @@ class TestUnit(TestCase):
         post = index._loc_to_iloc(
                 ['2017-12-01', '2018-01-01', '2018-02-01'],
                 partial_selection=True)
-        self.assertEqual(post, [0, 31])
+        self.assertEqual(post.tolist(), [0, 31]) #type: ignore [union-attr]
 
     def test_index_millisecond_a(self) -> None:
 
@@ -781,7 +781,7 @@ class TestUnit(TestCase):
         dt64 = np.datetime64
         idx = IndexDate.from_date_range('2020-01-01', '2020-01-31')
 
-        self.assertEqual(idx.loc_to_iloc(['2020-01-15', '2020-01-29']),
+        self.assertEqual(idx.loc_to_iloc(['2020-01-15', '2020-01-29']).tolist(), #type: ignore [union-attr]
                 [14, 28])
 
         self.assertEqual(idx.loc_to_iloc(idx == dt64('2020-01-13')).tolist(), #type: ignore [union-attr]
@@ -791,6 +791,23 @@ class TestUnit(TestCase):
 
         self.assertEqual(idx.loc_to_iloc('2020-01-29'), 28)
 
+    def test_index_datetime_loc_to_iloc_b(self) -> None:
+        idx1 = IndexMinute(np.arange('2020-01-30T00:00', '2020-03-02T00:00', 360, dtype='datetime64[m]'))
+        self.assertEqual(idx1.loc_to_iloc('2020-02').tolist(), list(range(8, 124))) #type: ignore [union-attr]
+        self.assertTrue(idx1._labels_is_sorted)
+
+        self.assertEqual(idx1.loc_to_iloc(slice('2020-01-31', '2020-02-01')), slice(4, 12))
+        self.assertEqual(idx1.loc_to_iloc(slice('2020-02', None)), slice(8, None))
+        self.assertEqual(idx1.loc_to_iloc(slice('2020-01-15', '2020-01-20')), slice(0, 0))
+
+        post1 = idx1.loc_to_iloc(np.array(['2020-03', '2020-01', '2020-03'], dtype='datetime64[M]'))
+        self.assertEqual(post1.tolist(), [0, 1, 2, 3, 4, 5, 6, 7, 124, 125, 126, 127]) #type: ignore [union-attr]
+
+        # an unsorted index converts labels to the unit of the key
+        idx2 = IndexMinute(idx1.values[::-1])
+        self.assertEqual(idx2.loc_to_iloc('2020-02').tolist(), list(range(4, 120))) #type: ignore [union-attr]
+        self.assertFalse(idx2._labels_is_sorted)
+
     def test_index_date_threshold_a(self) -> None:
 
         index = IndexDate.from_date_range('2019-01-01', '2020-02-28')
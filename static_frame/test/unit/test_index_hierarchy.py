@@ -378,10 +378,10 @@ class TestUnit(TestCase):
         self.assertEqual(post, 9)
 
         post = ih._loc_to_iloc(HLoc['II', 'A'])
-        self.assertEqual(list(post), [7, 8, 9])
+        self.assertEqual(post, slice(7, 10))
 
         post = ih._loc_to_iloc(HLoc['I', 'C'])
-        self.assertEqual(list(post), [5, 6])
+        self.assertEqual(post, slice(5, 7))
 
         post = ih._loc_to_iloc(HLoc['I', ['A', 'C']])
         self.assertEqual(list(post), [0, 1, 5, 6])
@@ -614,12 +614,12 @@ class TestUnit(TestCase):
         ih1_alt = IndexHierarchy.from_tree(tree_alt)
 
         post1 = ih1._loc_to_iloc(HLoc['b'])
-        self.assertEqual(list(post1), list(ih1_alt._loc_to_iloc(HLoc['b'])))
-        self.assertEqual(list(post1), list(range(20, 40)))
+        self.assertEqual(post1, ih1_alt._loc_to_iloc(HLoc['b']))
+        self.assertEqual(post1, slice(20, 40))
 
         post2 = ih1._loc_to_iloc(HLoc['b', 10:12])
-        self.assertEqual(list(post2), list(ih1_alt._loc_to_iloc(HLoc['b', 10:12])))
-        self.assertEqual(list(post2), [30, 31, 32])
+        self.assertEqual(post2, ih1_alt._loc_to_iloc(HLoc['b', 10:12]))
+        self.assertEqual(post2, slice(30, 33))
 
         post3 = ih1._loc_to_iloc(HLoc['b', [0, 10, 19]])
         self.assertEqual(list(post3), list(ih1_alt._loc_to_iloc(HLoc['b', [0, 10, 19]])))
@@ -754,6 +754,38 @@ class TestUnit(TestCase):
         post = ih2._loc_to_iloc(HLoc[:, 4:1])
         self.assertListEqual(list(post), [1, 2])
 
+    def test_hierarchy_loc_to_iloc_t(self) -> None:
+        ih = IndexHierarchy.from_product(('I', 'II'), ('A', 'B'), (1, 2))
+
+        self.assertEqual(ih._loc_to_iloc([('II', 'A', 2), ('I', 'B', 1)]), [5, 2])
+        self.assertEqual(
+                ih._loc_to_iloc(np.array([('II', 'B', 2), ('I', 'A', 1)], dtype=object)),
+                [7, 0],
+                )
+        # components that are not labels are resolved per key
+        with self.assertRaises(RuntimeError):
+            ih._loc_to_iloc([('I', 'A', 1), ('I', slice(None), 1)])
+
+    def test_hierarchy_loc_to_iloc_u(self) -> None:
+        ih = IndexHierarchy.from_labels([('I', 'A'), ('I', 'B'), ('II', 'A')])
+
+        with self.assertRaises(KeyError) as cm:
+            ih._loc_to_iloc([('I', 'A'), ('III', 'A'), ('II', 'B'), ('I', 'C')])
+        # all missing labels are reported, including those found at every depth
+        self.assertEqual(cm.exception.args[0], [('III', 'A'), ('II', 'B'), ('I', 'C')])
+
+        with self.assertRaises(KeyError) as cm:
+            ih._loc_to_iloc(np.array([('II', 'B'), ('I', 'B')], dtype=object))
+        self.assertEqual(cm.exception.args[0], [('II', 'B')])
+
+    def test_hierarchy_loc_to_iloc_v(self) -> None:
+        ih = IndexHierarchy.from_product(
+                ('a', 'b'),
+                IndexDate.from_date_range('2020-01-01', '2020-01-03'),
+                )
+        post = ih._loc_to_iloc([('b', '2020-01-02'), ('a', np.datetime64('2020-01-03'))])
+        self.assertEqual(post, [4, 2])
+
     #---------------------------------------------------------------------------
 
     def test_hierarchy_loc_to_iloc_index_hierarchy_a(self) -> None:
@@ -819,6 +851,45 @@ class TestUnit(TestCase):
 
         self.assertListEqual(post, [4, 3, 2, 1, 0])
 
+    def test_hierarchy_loc_to_iloc_sorted_a(self) -> None:
+        ih1 = IndexHierarchy.from_product(('a', 'b', 'c'), (1, 2, 3), ('x', 'y'))
+        self.assertTrue(ih1._get_indexers_is_sorted())
+
+        self.assertEqual(ih1.loc_to_iloc(HLoc['b']), slice(6, 12))
+        self.assertEqual(ih1.loc_to_iloc(HLoc['b', 2]), slice(8, 10))
+        self.assertEqual(ih1.loc_to_iloc(HLoc['a':'b']), slice(0, 12))
+        self.assertEqual(ih1.loc_to_iloc(HLoc['c', 2:]), slice(14, 18))
+        self.assertEqual(ih1.loc_to_iloc(HLoc['b', 3, 'x':]), slice(10, 12))
+
+        # selections at inner depths are only applied within the range
+        self.assertEqual(ih1.loc_to_iloc(HLoc['b':, 2]).tolist(), [8, 9, 14, 15])
+        self.assertEqual(ih1.loc_to_iloc(HLoc['a', :, 'y']).tolist(), [1, 3, 5])
+        self.assertEqual(ih1.loc_to_iloc(HLoc['c', [1, 3]]).tolist(), [12, 13, 16, 17])
+
+        # results match those of the same labels unsorted
+        ih2 = IndexHierarchy.from_labels(sorted(ih1.values.tolist(), key=lambda l: l[1]))
+        self.assertFalse(ih2._get_indexers_is_sorted())
+        for key in (HLoc['b'], HLoc['b', 2], HLoc['a':'b', 3], HLoc['c', 2:, 'y']):
+            self.assertEqual(
+                    sorted(ih1[ih1.loc_to_iloc(key)].values.tolist()), # type: ignore
+                    sorted(ih2[ih2.loc_to_iloc(key)].values.tolist()), # type: ignore
+                    )
+
+        with self.assertRaises(KeyError):
+            ih1.loc_to_iloc(HLoc['d'])
+
+    def test_hierarchy_loc_to_iloc_sorted_b(self) -> None:
+        ih1 = IndexHierarchyGO.from_product(('a', 'b'), (1, 2))
+        self.assertTrue(ih1._get_indexers_is_sorted())
+
+        ih2 = copy.deepcopy(ih1)
+        self.assertTrue(ih2._indexers_is_sorted)
+
+        ih1.append(('a', 3))
+        self.assertEqual(ih1.loc_to_iloc(HLoc['a']).tolist(), [0, 1, 4])
+        self.assertFalse(ih1._get_indexers_is_sorted())
+        self.assertEqual(ih2.loc_to_iloc(HLoc['a']), slice(0, 2))
+
     #---------------------------------------------------------------------------
 
     def test_hierarchy_extract_iloc_a(self) -> None:
@@ -1547,6 +1618,24 @@ class TestUnit(TestCase):
                 )
         self.assertEqual(ih.name, ('a', 'b'))
 
+    def test_hierarchy_from_arrays_e(self) -> None:
+        a1 = np.array(['b', 'a', 'b', 'a'])
+        a2 = np.array([3, 3, 1, None], dtype=object)
+        a3 = np.array([2.5, 0.5, 0.5, 1.5])
+        ih1 = IndexHierarchy._from_arrays((a1, a2, a3), retain_order=True)
+        ih2 = IndexHierarchy.from_labels(zip(a1, a2, a3))
+
+        self.assertTrue(ih1.equals(ih2, compare_dtype=True))
+        for i in range(3):
+            self.assertEqual(ih1.index_at_depth(i).values.tolist(),
+                    ih2.index_at_depth(i).values.tolist())
+        self.assertEqual(ih1.index_at_depth(0).values.tolist(), ['b', 'a'])
+        self.assertEqual(ih1.index_at_depth(2).values.tolist(), [2.5, 0.5, 1.5])
+
+        ih3 = IndexHierarchy._from_arrays((a1, a2, a3))
+        self.assertEqual(ih3.index_at_depth(0).values.tolist(), ['a', 'b'])
+        self.assertTrue(ih1.equals(ih3))
+
     #---------------------------------------------------------------------------
 
     def test_hierarchy_contains_a(self) -> None:
@@ -2008,6 +2097,42 @@ class TestUnit(TestCase):
         with self.assertRaises(RuntimeError):
             ihgo.append(('A', 'B', 'C'))
 
+    def test_hierarchy_index_go_g(self) -> None:
+        ihgo = IndexHierarchyGO.from_labels((('a', 0), ('b', 1)))
+        # interleave appends and lookups, extending indexers and map in-place
+        for i in range(2, 40):
+            ihgo.append(('abc'[i % 3], i))
+            self.assertEqual(ihgo._loc_to_iloc(('abc'[i % 3], i)), i)
+            self.assertEqual(ihgo._loc_to_iloc(('a', 0)), 0)
+
+        ihgo.extend(IndexHierarchy.from_labels((('d', 40), ('a', 41))))
+        self.assertEqual(ihgo._loc_to_iloc(('a', 41)), 41)
+        self.assertEqual(len(ihgo), 42)
+        self.assertEqual(ihgo.values[-3:].tolist(), [['a', 39], ['d', 40], ['a', 41]])
+        self.assertEqual(ihgo.shape, (42, 2))
+        self.assertTrue(ihgo.equals(IndexHierarchyGO.from_labels(ihgo.values.tolist())))
+
+    def test_hierarchy_index_go_h(self) -> None:
+        ihgo1 = IndexHierarchyGO.from_labels((('a', 0), ('b', 1)))
+        ihgo1.append(('c', 2))
+        self.assertEqual(len(ihgo1), 3)
+
+        # copies share indexers and map, which must not be extended in-place thereafter
+        ihgo2 = ihgo1.copy()
+        ih3 = IndexHierarchy(ihgo1)
+        ihgo1.append(('d', 3))
+        ihgo2.append(('e', 3))
+        self.assertEqual(ihgo1._loc_to_iloc(('d', 3)), 3)
+        self.assertEqual(ihgo2._loc_to_iloc(('e', 3)), 3)
+        self.assertNotIn(('e', 3), ihgo1)
+        self.assertNotIn(('d', 3), ihgo2)
+        self.assertNotIn(('d', 3), ih3)
+        self.assertEqual(ih3.values.tolist(), [['a', 0], ['b', 1], ['c', 2]])
+
+        ihgo1.append(('a', 0))
+        with self.assertRaises(ErrorInitIndexNonUnique):
+            ihgo1._loc_to_iloc(('a', 0))
+
     #---------------------------------------------------------------------------
 
     @run_with_static_and_grow_only
@@ -7,10 +7,12 @@ import numpy as np
 from static_frame import IndexHierarchy
 from static_frame.core.exception import ErrorInitIndexNonUnique
 from static_frame.core.index import Index
+from static_frame.core.index import IndexGO
 from static_frame.core.index_datetime import IndexDate
 from static_frame.core.index_hierarchy import build_indexers_from_product
 from static_frame.core.loc_map import HierarchicalLocMap
 from static_frame.core.loc_map import LocMap
+from static_frame.core.loc_map import RangeMap
 from static_frame.core.util import DTYPE_UINT_DEFAULT
 from static_frame.core.util import NULL_SLICE
 from static_frame.core.util import PositionsAllocator
@@ -111,6 +113,74 @@ class TestLocMapUnit(TestCase):
                 )
         self.assertEqual(post1, slice(0, 85, None))
 
+    def test_loc_map_sorted_a(self) -> None:
+        labels = np.array([2, 5, 9, 14, 20])
+        post1 = LocMap.sorted_loc_to_iloc(labels=labels, key=np.array([20, 2, 9]))
+        self.assertEqual(post1.tolist(), [4, 0, 2])
+
+        key = np.array([21, 5, 1, 10])
+        with self.assertRaises(KeyError) as cm:
+            LocMap.sorted_loc_to_iloc(labels=labels, key=key)
+        self.assertEqual(cm.exception.args[0], 21)
+
+        post2 = LocMap.sorted_loc_to_iloc(labels=labels, key=key, partial_selection=True)
+        self.assertEqual(post2.tolist(), [1])
+
+    def test_loc_map_datetime64_bounds_a(self) -> None:
+        labels = np.array(['2020-01-30', '2020-02-01', '2020-02-27', '2020-03-01'], dtype='datetime64[D]')
+        self.assertEqual(LocMap.datetime64_bounds(labels, np.datetime64('2020-02')), (1, 3))
+        self.assertEqual(LocMap.datetime64_bounds(labels, np.datetime64('2020-04')), (4, 4))
+        self.assertEqual(LocMap.datetime64_bounds(labels, np.datetime64('2020-02-27T00')), (2, 3))
+        self.assertEqual(LocMap.datetime64_bounds(labels, np.datetime64('2020-02-27T01')), (3, 3))
+
+        lower, upper = LocMap.datetime64_bounds(labels, np.array(['2020-01', '2020-03'], dtype='datetime64[M]')) # type: ignore
+        self.assertEqual(lower.tolist(), [0, 3])
+        self.assertEqual(upper.tolist(), [1, 4])
+
+        self.assertIsNone(LocMap.datetime64_bounds(labels.astype('datetime64[W]'), np.datetime64('2020-02')))
+
+    def test_loc_map_is_sorted_lookup_a(self) -> None:
+        labels = np.array([0.5, 1.5])
+        self.assertTrue(LocMap.is_sorted_lookup(labels, np.array([1.5])))
+        self.assertFalse(LocMap.is_sorted_lookup(labels, np.array([np.nan])))
+        self.assertFalse(LocMap.is_sorted_lookup(labels, np.array([1])))
+        self.assertFalse(LocMap.is_sorted_lookup(np.array(['a', 'b']), np.array(['a'])))
+
+        labels = np.array(['2020-01-01', '2020-01-02'], dtype='datetime64[D]')
+        self.assertTrue(LocMap.is_sorted_lookup(labels, labels[:1]))
+        self.assertFalse(LocMap.is_sorted_lookup(labels, labels.astype('datetime64[s]')))
+
+    def test_loc_map_range_map_a(self) -> None:
+        self.assertIsNone(RangeMap.from_labels(np.array([0, 2, 3])))
+        self.assertIsNone(RangeMap.from_labels(np.array([3, 2, 1])))
+
+        rm = RangeMap.from_labels(np.arange(10, 40, 5, dtype=np.uint8))
+        self.assertEqual(len(rm), 6) # type: ignore
+        self.assertEqual(list(rm), [10, 15, 20, 25, 30, 35]) # type: ignore
+        self.assertEqual(rm[25], 3) # type: ignore
+        self.assertEqual(rm[np.int64(35)], 5) # type: ignore
+        self.assertEqual(rm.get(15.0), 1) # type: ignore
+        self.assertIsNone(rm.get(15.5)) # type: ignore
+        self.assertIsNone(rm.get(np.nan)) # type: ignore
+        self.assertIsNone(rm.get(40)) # type: ignore
+        self.assertIsNone(rm.get(5)) # type: ignore
+        self.assertFalse('15' in rm) # type: ignore
+        with self.assertRaises(KeyError):
+            _ = rm[12] # type: ignore
+
+        labels = np.arange('2020-01-01', '2020-01-03', 6, dtype='datetime64[h]')
+        rm = RangeMap.from_labels(labels)
+        self.assertEqual(rm[np.datetime64('2020-01-02T06')], 5) # type: ignore
+        self.assertIsNone(rm.get(np.datetime64('2020-01-02T07'))) # type: ignore
+        # as with a FrozenAutoMap, other units and integers are not matched
+        self.assertIsNone(rm.get(np.datetime64('2020-01-02'))) # type: ignore
+        self.assertIsNone(rm.get(6)) # type: ignore
+        self.assertEqual(list(rm), list(labels)) # type: ignore
+
+        rm = RangeMap.from_labels(np.array([-3]))
+        self.assertEqual(rm[-3], 0) # type: ignore
+        self.assertFalse(-2 in rm) # type: ignore
+
 
 class TestHierarchicalLocMapUnit(TestCase):
 
@@ -432,6 +502,41 @@ class TestHierarchicalLocMapUnit(TestCase):
         post = hlmap.indexers_to_iloc(indexers.T.astype(DTYPE_UINT_DEFAULT))
         self.assertListEqual(post, list(range(10)))
 
+    def test_extend_a(self) -> None:
+        indices = [
+                IndexGO(np.arange(5)),
+                IndexGO(tuple('ABCDE')),
+                ]
+        indexers = np.array([[3, 0, 1], [2, 1, 0]])
+        hlmap = HierarchicalLocMap(indices=indices, indexers=indexers)
+
+        indices[1].append('F')
+        self.assertTrue(hlmap.extend(indices=indices, indexers=np.array([[4], [5]])))
+        self.assertEqual(hlmap.loc_to_iloc((4, 'F'), indices), 3)
+        self.assertEqual(hlmap.loc_to_iloc((3, 'C'), indices), 0)
+
+        with self.assertRaises(ErrorInitIndexNonUnique):
+            hlmap.extend(indices=indices, indexers=np.array([[0, 3], [1, 2]]))
+
+        # when a depth requires more bits, the encoding must be rebuilt
+        indices[0].extend((5, 6, 7))
+        self.assertFalse(hlmap.extend(indices=indices, indexers=np.array([[7], [0]])))
+
+    def test_labels_to_iloc_a(self) -> None:
+        indices = [
+                Index(np.arange(5)),
+                Index(tuple('ABCDE')),
+                ]
+        indexers = np.array([[3, 0, 1, 4], [2, 1, 0, 4]])
+        hlmap = HierarchicalLocMap(indices=indices, indexers=indexers)
+
+        post = hlmap.labels_to_iloc([[4, 3, 0], ['E', 'C', 'B']], indices)
+        self.assertEqual(post, [3, 0, 1])
+
+        with self.assertRaises(KeyError) as cm:
+            hlmap.labels_to_iloc([[4, 9, 0], ['E', 'C', 'A']], indices)
+        self.assertEqual(cm.exception.args[0], [(9, 'C'), (0, 'A')])
+
     def test_indexers_to_iloc_b(self) -> None:
         indices = [
                 Index(np.arange(5)),
@@ -449,60 +449,106 @@ class TestUnit(TestCase):
     def test_getsizeof_total_type_blocks_1d_array(self) -> None:
         a = np.array([1, 2, 3])
         tb = TypeBlocks.from_blocks(a)
-        self.assertTrue(memory_total(tb), sum(getsizeof(e) for e in (
-            np.array([1, 2, 3]),
-            tb._blocks, # [np.array([1, 2, 3])],
-            0,
+        bi = tb._index
+        self.assertEqual(memory_total(tb), sum(getsizeof(e) for e in (
+            a,
+            tb._blocks, # [a]
             (0, 0),
-            tb._index, # [(0, 0)],
-            3, 1,
-            tb._shape, # (3, 1),
-            np.dtype('int64'),
-            tb._dtypes, # [np.dtype('int64')],
-            # _row_dtype, # np.dtype('int64') is already included
-            tb
+            0,
+            bi._pairs, # [(0, 0)]
+            1, # bi._count
+            np.dtype(np.int64),
+            bi._dtypes, # [np.dtype(np.int64)]
+            None, # bi._block, bi._column, tb._consolidate_config, tb._values_cache
+            bi,
+            3,
+            (3, 1), # tb._shape
+            tb,
         )))
 
     def test_getsizeof_total_type_blocks_list_of_1d_arrays(self) -> None:
-        tb = TypeBlocks.from_blocks([
-            np.array([1, 2, 3]),
-            np.array([4, 5, 6])
-        ])
+        a1 = np.array([1, 2, 3])
+        a2 = np.array([4, 5, 6])
+        tb = TypeBlocks.from_blocks([a1, a2])
+        bi = tb._index
         self.assertEqual(memory_total(tb), sum(getsizeof(e) for e in (
-            np.array([1, 2, 3]),
-            np.array([4, 5, 6]),
-            tb._blocks, # [np.array([1, 2, 3]), np.array([4, 5, 6])],
-            0,
+            a1,
+            a2,
+            tb._blocks, # [a1, a2]
             (0, 0),
-            1,
+            0,
             (1, 0),
-            tb._index, # [(0, 0), (1, 0)],
-            3, 2,
-            tb._shape, # (3, 2),
-            np.dtype('int64'),
-            tb._dtypes, # [np.dtype('int64'), np.dtype('int64')],
-            # _row_dtype, # np.dtype('int64') is already included
-            tb
+            1,
+            bi._pairs, # [(0, 0), (1, 0)]
+            2, # bi._count
+            np.dtype(np.int64),
+            bi._dtypes, # [np.dtype(np.int64), np.dtype(np.int64)]
+            None, # bi._block, bi._column, tb._consolidate_config, tb._values_cache
+            bi,
+            3,
+            (3, 2), # tb._shape
+            tb,
         )))
 
     def test_getsizeof_total_type_blocks_2d_array(self) -> None:
-        tb = TypeBlocks.from_blocks(np.array([[1, 2, 3], [4, 5, 6]]))
+        a = np.array([[1, 2, 3], [4, 5, 6]])
+        tb = TypeBlocks.from_blocks(a)
+        bi = tb._index
         self.assertEqual(memory_total(tb), sum(getsizeof(e) for e in (
-            np.array([[1, 2, 3],[4, 5, 6]]),
-            tb._blocks, # [np.array([[1, 2, 3],[4, 5, 6]])],
-            0,
+            a,
+            tb._blocks, # [a]
             (0, 0),
+            0,
+            (0, 1),
             1,
+            (0, 2),
+            2,
+            bi._pairs, # [(0, 0), (0, 1), (0, 2)]
+            3, # bi._count, tb._shape[1]
+            np.dtype(np.int64),
+            bi._dtypes, # [np.dtype(np.int64)]
+            None, # bi._block, bi._column, tb._consolidate_config, tb._values_cache
+            bi,
+            (2, 3), # tb._shape
+            tb,
+        )))
+
+    def test_getsizeof_total_block_index(self) -> None:
+        tb = TypeBlocks.from_blocks(np.array([[1, 2, 3], [4, 5, 6]]))
+        bi = tb._index
+        self.assertEqual(memory_total(bi), sum(getsizeof(e) for e in (
+            (0, 0),
+            0,
             (0, 1),
+            1,
+            (0, 2),
             2,
+            bi._pairs, # [(0, 0), (0, 1), (0, 2)]
+            3, # bi._count
+            np.dtype(np.int64),
+            bi._dtypes, # [np.dtype(np.int64)]
+            None, # bi._block, bi._column
+            bi,
+        )))
+
+    def test_getsizeof_total_block_index_arrays(self) -> None:
+        tb = TypeBlocks.from_blocks(np.array([[1, 2, 3], [4, 5, 6]]))
+        bi = tb._index.copy()
+        bi.block # creates arrays lazily
+        self.assertEqual(memory_total(bi), sum(getsizeof(e) for e in (
+            (0, 0),
+            0,
+            (0, 1),
+            1,
             (0, 2),
-            tb._index, # [(0, 0), (0, 1), (0, 2)],
+            2,
+            bi._pairs,
             3,
-            tb._shape, # (2, 3),
-            np.dtype('int64'),
-            tb._dtypes, #[np.dtype('int64'), np.dtype('int64'), np.dtype('int64')],
-            # _row_dtype, # np.dtype('int64') is already included
-            tb
+            np.dtype(np.int64),
+            bi._dtypes,
+            bi._block,
+            bi._column,
+            bi,
         )))
 
     #---------------------------------------------------------------------------
@@ -597,6 +643,7 @@ class TestUnit(TestCase):
             y._series,
             y._hierarchy,
             y._index,
+            y._offsets,
             y._deepcopy_from_bus,
         )) + getsizeof(y))
 
@@ -0,0 +1,246 @@
+import time
+from multiprocessing.shared_memory import SharedMemory
+
+import frame_fixtures as ff
+import numpy as np
+
+from static_frame.core.batch import Batch
+from static_frame.core.frame import Frame
+from static_frame.core.frame import FrameGO
+from static_frame.core.pool import ArrayDescriptor
+from static_frame.core.pool import FrameDescriptor
+from static_frame.core.pool import SeriesDescriptor
+from static_frame.core.pool import cost_nbytes
+from static_frame.core.pool import pool_items
+from static_frame.core.pool import segments_release
+from static_frame.core.pool import transport_decode
+from static_frame.core.pool import transport_encode
+from static_frame.core.pool import transport_unlink
+from static_frame.core.series import Series
+from static_frame.test.test_case import TestCase
+
+
+def func_sum(f: Frame) -> Series:
+    return f.sum()
+
+def func_sum_a(f: Frame) -> int:
+    return f['a'].sum() # type: ignore
+
+STARTED = []
+
+def func_sleep(x: int) -> int:
+    STARTED.append(x)
+    time.sleep(x * 0.01)
+    return x
+
+def func_sleep_frame(label: str, f: Frame) -> Frame:
+    STARTED.append(label)
+    time.sleep(len(f) * 0.001)
+    return f
+
+def func_raise(x: int) -> int:
+    if x % 2:
+        raise KeyError(x)
+    return x * 10
+
+
+class TestUnit(TestCase):
+
+    #---------------------------------------------------------------------------
+    def test_transport_encode_a(self) -> None:
+        f1 = ff.parse('s(4,6)|v(int,str,bool,float)|i(I,str)|c(I,str)')
+        segments = []
+        payload = transport_encode(f1, segments, nbytes_min=0)
+        self.assertIs(payload.__class__, FrameDescriptor)
+        # one segment per non-object block
+        self.assertEqual(len(segments), len(f1._blocks._blocks))
+        self.assertTrue(all(b.__class__ is ArrayDescriptor for b in payload.blocks))
+
+        f2 = transport_decode(payload, unlink=True)
+        self.assertTrue(f2.equals(f1, compare_dtype=True, compare_class=True, compare_name=True))
+        self.assertFalse(f2.values.flags.writeable)
+
+        with self.assertRaises(FileNotFoundError):
+            SharedMemory(name=payload.blocks[0].name)
+        segments_release(segments)
+        self.assertEqual(segments, [])
+
+    def test_transport_encode_b(self) -> None:
+        f1 = ff.parse('s(3,2)|v(object,int)').to_frame_go()
+        segments = []
+        payload = transport_encode(f1, segments, nbytes_min=0)
+        # object arrays are not transported by shared memory
+        self.assertIs(payload.blocks[0].__class__, np.ndarray)
+        self.assertIs(payload.blocks[1].__class__, ArrayDescriptor)
+
+        f2 = transport_decode(payload, unlink=True)
+        self.assertIs(f2.__class__, FrameGO)
+        self.assertTrue(f2.equals(f1, compare_dtype=True, compare_class=True))
+        segments_release(segments)
+
+    def test_transport_encode_c(self) -> None:
+        s1 = Series(np.arange(4), index=tuple('abcd'), name='x')
+        a1 = np.arange(6).reshape(2, 3)
+        segments = []
+        payload = transport_encode((s1, a1, 'foo'), segments, nbytes_min=0)
+        self.assertIs(payload[0].__class__, SeriesDescriptor)
+        self.assertIs(payload[1].__class__, ArrayDescriptor)
+        self.assertEqual(payload[2], 'foo')
+
+        s2, a2, label = transport_decode(payload, unlink=False)
+        self.assertTrue(s2.equals(s1, compare_dtype=True, compare_name=True))
+        self.assertEqual(a2.tolist(), a1.tolist())
+        self.assertEqual(label, 'foo')
+
+        transport_unlink(payload)
+        with self.assertRaises(FileNotFoundError):
+            SharedMemory(name=payload[1].name)
+        # unlinking again is a no-op
+        transport_unlink(payload)
+        segments_release(segments)
+
+    def test_transport_encode_d(self) -> None:
+        a1 = np.arange(4)
+        segments = []
+        # below the size threshold, arrays are passed unchanged
+        self.assertIs(transport_encode(a1, segments), a1)
+        self.assertEqual(segments, [])
+
+    #---------------------------------------------------------------------------
+    def test_pool_items_a(self) -> None:
+        frames = [ff.parse('s(20000,4)|v(float)').rename(str(i)) for i in range(5)]
+        post = list(pool_items(func_sum,
+                ((f.name, f) for f in frames),
+                max_workers=2,
+                chunksize=2,
+                ))
+        self.assertEqual([label for label, _ in post], ['0', '1', '2', '3', '4'])
+        for f, (_, s) in zip(frames, post):
+            self.assertTrue(s.equals(f.sum()))
+
+    def test_pool_items_b(self) -> None:
+        post = list(pool_items(func_raise,
+                ((i, i) for i in range(6)),
+                max_workers=2,
+                exception=KeyError,
+                ))
+        self.assertEqual(post, [(0, 0), (2, 20), (4, 40)])
+
+        with self.assertRaises(KeyError):
+            _ = list(pool_items(func_raise, ((i, i) for i in range(6)), max_workers=2))
+
+    def test_pool_items_c(self) -> None:
+        post = list(pool_items(func_raise,
+                ((i, i) for i in range(0, 10, 2)),
+                max_workers=2,
+                chunksize=3,
+                use_threads=True,
+                ))
+        self.assertEqual(post, [(0, 0), (2, 20), (4, 40), (6, 60), (8, 80)])
+
+        with self.assertRaises(ValueError):
+            _ = list(pool_items(func_raise, (), chunksize=0))
+
+    def test_pool_items_d(self) -> None:
+        frames = [ff.parse('s(20000,4)|v(int,float)').rename(str(i)) for i in range(8)]
+        post = Batch.from_frames(frames, max_workers=2).apply(func_sum).to_frame()
+        self.assertEqual(post.index.values.tolist(), [str(i) for i in range(8)])
+        self.assertTrue(post.loc['3'].equals(frames[3].sum().rename('3')))
+
+    def test_pool_items_e(self) -> None:
+        STARTED.clear()
+        values = (3, 0, 10, 1, 5)
+        # submission is in descending cost, results are in the order of items
+        post = list(pool_items(func_sleep,
+                ((str(v), v) for v in values),
+                max_workers=1,
+                use_threads=True,
+                cost=lambda x: x,
+                ))
+        self.assertEqual(STARTED, [10, 5, 3, 1, 0])
+        self.assertEqual(post, [(str(v), v) for v in values])
+
+    def test_pool_items_f(self) -> None:
+        values = (20, 0, 1)
+        post = list(pool_items(func_sleep,
+                ((str(v), v) for v in values),
+                max_workers=3,
+                use_threads=True,
+                ordered=False,
+                ))
+        # results are yielded in order of completion
+        self.assertEqual(post[-1], ('20', 20))
+        self.assertEqual(sorted(post), [('0', 0), ('1', 1), ('20', 20)])
+
+    def test_pool_items_g(self) -> None:
+        post = list(pool_items(func_raise,
+                ((i, i) for i in range(7)),
+                max_workers=2,
+                exception=KeyError,
+                cost=lambda x: -x,
+                use_threads=True,
+                ))
+        self.assertEqual(post, [(0, 0), (2, 20), (4, 40), (6, 60)])
+
+    def test_cost_nbytes_a(self) -> None:
+        f1 = ff.parse('s(4,6)|v(int,float)')
+        a1 = np.arange(10, dtype=np.int64)
+        self.assertEqual(cost_nbytes(f1), 192)
+        self.assertEqual(cost_nbytes((f1, a1, 'foo')), 272)
+        self.assertEqual(cost_nbytes('foo'), 0)
+
+    def test_frame_iter_apply_pool_a(self) -> None:
+        f1 = Frame.from_dict(dict(a=(1, 2, 3, 4), b=(0, 4, 0, 5)), index=tuple('wxyz'))
+        post = f1.iter_group('b').apply_pool(func_sum_a, max_workers=2, cost=cost_nbytes)
+        self.assertEqual(post.to_pairs(), ((0, 4), (4, 2), (5, 4)))
+
+    def test_frame_iter_apply_pool_b(self) -> None:
+        f1 = Frame.from_dict(dict(a=(1, 2, 3, 4), b=(0, 4, 0, 5)), index=tuple('wxyz'))
+        post = f1.iter_group('b').apply_pool(func_sum_a, max_workers=2, use_threads=True, ordered=False)
+        self.assertEqual(dict(post.to_pairs()), {0: 4, 4: 2, 5: 4})
+        with self.assertRaises(RuntimeError):
+            f1['a'].iter_element().apply_pool(abs, max_workers=2, ordered=False)
+
+    def test_frame_iter_apply_pool_c(self) -> None:
+        f1 = Frame.from_dict(dict(a=(1, 2, 3, 4), b=(0, 4, 0, 5)), index=tuple('wxyz'))
+        calls = []
+        delegate = f1['a'].iter_element()
+        # raised on calling, before any values are processed
+        with self.assertRaises(RuntimeError):
+            delegate.apply_pool(calls.append, max_workers=2, use_threads=True, ordered=False)
+        self.assertEqual(calls, [])
+
+        delegate = f1['a'].iter_element_items()
+        with self.assertRaises(RuntimeError):
+            delegate.apply_pool(lambda k, v: calls.append(v), max_workers=2, use_threads=True, ordered=False)
+        self.assertEqual(calls, [])
+
+    #---------------------------------------------------------------------------
+    def test_batch_cost_a(self) -> None:
+        frames = [ff.parse(f's({size},2)').rename(str(size)) for size in (3, 40, 1, 10)]
+
+        STARTED.clear()
+        post = Batch.from_frames(frames, max_workers=1, use_threads=True
+                ).apply_items(func_sleep_frame).to_frame()
+        # without cost, submission follows the order of frames
+        self.assertEqual(STARTED, ['3', '40', '1', '10'])
+
+        STARTED.clear()
+        post = Batch.from_frames(frames,
+                max_workers=1,
+                use_threads=True,
+                cost=len,
+                ).apply_items(func_sleep_frame).to_frame()
+        self.assertEqual(STARTED, ['40', '10', '3', '1'])
+        self.assertEqual(post.index.values.tolist()[:2], [['3', 0], ['3', 1]])
+
+    def test_batch_ordered_a(self) -> None:
+        frames = [ff.parse(f's({size},2)').rename(str(size)) for size in (100, 1, 2)]
+        b1 = Batch.from_frames(frames, max_workers=3, use_threads=True, ordered=False)
+        post = tuple(b1.apply_items(func_sleep_frame).keys())
+        self.assertEqual(post[-1], '100')
+        self.assertEqual(sorted(post), ['1', '100', '2'])
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
@@ -1201,6 +1201,18 @@ class TestUnit(TestCase):
                 (('zZbu', (('zmVj', 55768.8), ('z2Oo', 85125.8), ('z5l6', 95809.2), ('zCE3', 112903.8), ('zr4u', 116693.2), ('zYVB', 109129.2), ('zOyq', 84782.8), ('zIA5', 89954.4), ('zGDJ', 24929.2), ('zmhG', 43655.2), ('zo2Q', 28049.0), ('zjZQ', 21071.6), ('zO5l', 20315.6), ('zEdH', 77254.8), ('zB7E', 21935.2), ('zwIp', -21497.8))), ('ztsv', (('zmVj', 19801.8), ('z2Oo', 616.2), ('z5l6', -25398.6), ('zCE3', -34343.8), ('zr4u', 2873.2), ('zYVB', -30222.0), ('zOyq', -49512.4), ('zIA5', -3803.0), ('zGDJ', -15530.0), ('zmhG', 19152.0), ('zo2Q', 59952.2), ('zjZQ', 63255.8), ('zO5l', 57918.2), ('zEdH', 93699.6), ('zB7E', 56150.2), ('zwIp', 17830.4))))
                 )
 
+    def test_quilt_iter_window_reduce_a(self) -> None:
+        f1 = ff.parse('s(20,2)|v(int)|i(I,str)|c(I,str)')
+        q1 = Quilt.from_frame(f1, chunksize=4, axis=0, retain_labels=False)
+
+        post1 = q1.iter_window(size=5).mean()
+        post2 = Batch(q1.iter_window_items(size=5)).mean().to_frame()
+        self.assertTrue(post1.equals(post2, compare_dtype=True))
+
+        post3 = q1.iter_window_array(size=3, step=3).sum()
+        self.assertEqual(post3.shape, (6, 2))
+        self.assertEqual(post3.iloc[0].values.tolist(), f1.iloc[:3].sum().values.tolist())
+
     def test_quilt_iter_window_b1(self) -> None:
         from string import ascii_lowercase
 
@@ -1476,6 +1476,41 @@ class TestUnit(TestCase):
                 (('a', 10), ('b', 200), ('c', 6000))
                 )
 
+    def test_series_cummax_a(self) -> None:
+        s1 = Series.from_items(zip('abcd', (10, np.nan, 5, 30)))
+        self.assertEqual(s1.cummax().to_pairs(),
+                (('a', 10.0), ('b', 10.0), ('c', 10.0), ('d', 30.0))
+                )
+        self.assertEqual(s1.cummin().to_pairs(),
+                (('a', 10.0), ('b', 10.0), ('c', 5.0), ('d', 5.0))
+                )
+        self.assertEqual(s1.cummax(skipna=False).fillna(None).to_pairs(),
+                (('a', 10.0), ('b', None), ('c', None), ('d', None))
+                )
+        s2 = Series.from_items(zip('abc', ('b', 'a', 'c')))
+        self.assertEqual(s2.cummin().to_pairs(), (('a', 'b'), ('b', 'a'), ('c', 'a')))
+
+    def test_series_cummean_a(self) -> None:
+        s1 = Series.from_items(zip('abcd', (10, np.nan, 20, 30)))
+        self.assertEqual(s1.cummean().to_pairs(),
+                (('a', 10.0), ('b', 10.0), ('c', 15.0), ('d', 20.0))
+                )
+        self.assertEqual(s1.cumcount().to_pairs(),
+                (('a', 1), ('b', 1), ('c', 2), ('d', 3))
+                )
+        self.assertEqual(s1.cumcount(skipna=False).to_pairs(),
+                (('a', 1), ('b', 2), ('c', 3), ('d', 4))
+                )
+
+    def test_series_cumstd_a(self) -> None:
+        s1 = Series.from_items(zip('abcd', (10, np.nan, 20, 30)))
+        self.assertEqual(round(s1.cumstd(), 4).to_pairs(),
+                (('a', 0.0), ('b', 0.0), ('c', 5.0), ('d', 8.165))
+                )
+        post = s1.cumstd(ddof=1)
+        self.assertTrue(post.iloc[:2].isna().all())
+        self.assertEqual(round(post.iloc[2:], 4).values.tolist(), [7.0711, 10.0])
+
     def test_series_median_a(self) -> None:
 
         s1 = Series.from_items(zip('abcde', (10, 20, 0, 15, 30)))
@@ -3760,6 +3795,43 @@ class TestUnit(TestCase):
         self.assertEqual(post2.to_pairs(),
                 ((4, 2.0), (5, 3.0), (6, 4.0), (7, 5.0), (8, 6.0), (9, 7.0), (10, 8.0), (11, 9.0)))
 
+    def test_series_iter_window_reduce_a(self) -> None:
+        s1 = Series((1, 2, np.nan, 4, 5, 6), index=self.get_letters(6))
+
+        post1 = s1.iter_window(size=3).mean()
+        self.assertEqual(post1.to_pairs(),
+                (('c', 1.5), ('d', 3.0), ('e', 4.5), ('f', 5.0)))
+        self.assertTrue(post1.equals(s1.iter_window(size=3).apply(lambda s: s.mean())))
+
+        post2 = s1.iter_window(size=3).sum(skipna=False)
+        self.assertEqual(post2.fillna(0).to_pairs(),
+                (('c', 0.0), ('d', 0.0), ('e', 0.0), ('f', 15.0)))
+
+        post3 = s1.iter_window(size=2, step=2, label_shift=-1).max()
+        self.assertEqual(post3.to_pairs(), (('a', 2.0), ('c', 4.0), ('e', 6.0)))
+
+        post4 = s1.iter_window(size=3, window_sized=False).count()
+        self.assertEqual(post4.to_pairs(),
+                (('c', 2), ('d', 2), ('e', 2), ('f', 3)))
+
+        post5 = s1.iter_window_array(size=2).std(ddof=1)
+        self.assertTrue(post5.equals(
+                s1.iter_window(size=2).apply(lambda s: s.std(ddof=1)))) # type: ignore
+
+    def test_series_iter_window_reduce_b(self) -> None:
+        s1 = Series(('a', 'b', 'c', 'd'), index=self.get_letters(4))
+        post1 = s1.iter_window(size=2).max()
+        self.assertEqual(post1.to_pairs(), (('b', 'b'), ('c', 'c'), ('d', 'd')))
+
+        post2 = s1.iter_window(size=2, step=2).first()
+        self.assertEqual(post2.to_pairs(), (('b', 'a'), ('d', 'c')))
+
+        post3 = s1.iter_window(size=5).sum()
+        self.assertEqual(len(post3), 0)
+
+        with self.assertRaises(RuntimeError):
+            s1.iter_window(size=2, window_func=lambda w: w).max()
+
     #---------------------------------------------------------------------------
 
     def test_series_bool_a(self) -> None:
@@ -16,6 +16,8 @@ from static_frame.core.store_zip import StoreZipParquet
 from static_frame.core.store_zip import StoreZipPickle
 from static_frame.core.store_zip import StoreZipTSV
 from static_frame.core.store_zip import _StoreZip
+from static_frame.core.store_zip import zip_file_cache_release
+from static_frame.core.store_zip import zip_file_cached
 from static_frame.test.test_case import TestCase
 from static_frame.test.test_case import temp_file
 
@@ -463,6 +465,51 @@ class TestUnitMultiProcess(TestCase):
             post = tuple(st.read_many(('a', 'b', 'c')))
             self.assertEqual(len(post), 3)
 
+    def test_store_zip_payloads_a(self) -> None:
+
+        f1 = ff.parse('s(4,6)|v(int,int,bool)|i(I,str)|c(I,str)').rename('a')
+        f2 = ff.parse('s(4,8)|v(bool,str,float)|i(I,str)|c(I,str)').rename('b')
+        config = StoreConfig(index_depth=1, include_index=True, label_encoder=str.upper, label_decoder=str.lower)
+
+        with temp_file('.zip') as fp:
+            st = StoreZipNPZ(fp)
+            st.write(((f.name, f) for f in (f1, f2)), config=config)
+
+            payloads = list(st._read_many_payloads(('a', 'b'),
+                    config=config,
+                    container_type=FrameGO,
+                    ))
+            self.assertEqual([p.label_encoded for p in payloads], ['A', 'B'])
+            self.assertEqual([p.name for p in payloads], ['a', 'b'])
+
+            f3 = StoreZipNPZ._payload_to_frame(payloads[1])
+            self.assertIs(f3.__class__, FrameGO)
+            self.assertTrue(f3.equals(f2, compare_name=True))
+            zip_file_cache_release()
+
+    def test_zip_file_cached_a(self) -> None:
+        f1 = ff.parse('s(4,6)|v(int,float)').rename('a')
+        f2 = ff.parse('s(8,6)|v(int,float)').rename('b')
+
+        with temp_file('.zip') as fp:
+            st = StoreZipPickle(fp)
+            st.write(((f.name, f) for f in (f1,)))
+
+            zf1 = zip_file_cached(fp)
+            # the archive is opened once for reading many members
+            self.assertIs(zip_file_cached(fp), zf1)
+            self.assertEqual(zf1.namelist(), ['a.pickle'])
+
+            # a modified archive is opened again
+            st.write(((f.name, f) for f in (f1, f2)))
+            zf2 = zip_file_cached(fp)
+            self.assertIsNot(zf2, zf1)
+            self.assertEqual(zf2.namelist(), ['a.pickle', 'b.pickle'])
+
+            zip_file_cache_release()
+            self.assertIsNot(zip_file_cached(fp), zf2)
+            zip_file_cache_release()
+
 if __name__ == '__main__':
     import unittest
     unittest.main()
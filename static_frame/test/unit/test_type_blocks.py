@@ -8,6 +8,9 @@ from arraykit import immutable_filter
 
 from static_frame import TypeBlocks
 from static_frame import mloc
+from static_frame.core.block_index import pairs_to_block_slices
+from static_frame.core.block_index import runs_to_block_slices
+from static_frame.core.block_parallel import TILE_NBYTES
 from static_frame.core.container_util import get_col_dtype_factory
 from static_frame.core.container_util import get_col_fill_value_factory
 from static_frame.core.display_config import DisplayConfig
@@ -62,21 +65,23 @@ class TestUnit(TestCase):
     def test_type_blocks_contiguous_pairs(self) -> None:
 
         a = [(0, 1), (0, 2), (2, 3), (2, 1)]
-        post = list(TypeBlocks._indices_to_contiguous_pairs(a))
-        self.assertEqual(post, [
-                (0, slice(1, 3)),
-                (2, slice(3, 4)),
-                (2, slice(1, 2)),
-                ])
+        block, column = np.array(a).T
+        for post in (list(pairs_to_block_slices(a)), list(runs_to_block_slices(block, column))):
+            self.assertEqual(post, [
+                    (0, slice(1, 3)),
+                    (2, slice(3, 4)),
+                    (2, slice(1, 2)),
+                    ])
 
         a = [(0, 0), (0, 1), (0, 2), (1, 4), (2, 1), (2, 3)]
-        post = list(TypeBlocks._indices_to_contiguous_pairs(a))
-        self.assertEqual(post, [
-                (0, slice(0, 3)),
-                (1, slice(4, 5)),
-                (2, slice(1, 2)),
-                (2, slice(3, 4)),
-            ])
+        block, column = np.array(a).T
+        for post in (list(pairs_to_block_slices(a)), list(runs_to_block_slices(block, column))):
+            self.assertEqual(post, [
+                    (0, slice(0, 3)),
+                    (1, slice(4, 5)),
+                    (2, slice(1, 2)),
+                    (2, slice(3, 4)),
+                ])
 
     def test_type_blocks_b(self) -> None:
 
@@ -3889,6 +3894,15 @@ class TestUnit(TestCase):
         self.assertEqual([x[0] for x in post], [0, 1])
         self.assertEqual([x[2].shape for x in post], [(2,), (4,)])
 
+    def test_type_blocks_group_match_g(self) -> None:
+        # unsortable keys are grouped in order of first appearance
+        a1 = np.array([3, 'a', None, 'a', 3, 3], dtype=object)
+        tb1 = TypeBlocks.from_blocks((a1, np.arange(6)))
+        post = tuple(group_match(tb1, axis=0, key=0))
+        self.assertEqual([p[0] for p in post], [3, 'a', None])
+        self.assertEqual([p[1].tolist() for p in post], [[0, 4, 5], [1, 3], [2]])
+        self.assertEqual([p[2].values[:, 1].tolist() for p in post], [[0, 4, 5], [1, 3], [2]])
+
     def test_type_blocks_group_match_f(self) -> None:
         tb1 = ff.parse('s(7,3)|v(int)').assign[1].apply(
                 lambda s: s % 3)._blocks
@@ -3992,6 +4006,29 @@ class TestUnit(TestCase):
         self.assertEqual(post.dtype, np.dtype(float))
         self.assertEqual(post.tolist(), [-88017.0, -610.8])
 
+    def test_type_blocks_ufunc_axis_skipna_f(self) -> None:
+        # non-composable row-wise reductions of many rows are done in tiles, without forming the complete values array
+        a1 = np.arange(120_000).reshape(40_000, 3) * 0.1
+        a1[::7, 1] = np.nan
+        blocks = (np.arange(40_000), a1, (np.arange(40_000) % 3).astype(np.float32))
+        for ufunc, ufunc_skipna in ((np.mean, np.nanmean), (np.std, np.nanstd), (np.var, np.nanvar)):
+            for skipna in (True, False):
+                tb = TypeBlocks.from_blocks(blocks)
+                self.assertTrue(tb.nbytes > TILE_NBYTES)
+                post = tb.ufunc_axis_skipna(
+                        skipna=skipna,
+                        axis=1,
+                        ufunc=ufunc,
+                        ufunc_skipna=ufunc_skipna,
+                        composable=False,
+                        dtypes=(),
+                        size_one_unity=False,
+                        )
+                self.assertIs(tb._values_cache, None)
+                self.assertFalse(post.flags.writeable)
+                func = ufunc_skipna if skipna else ufunc
+                self.assertEqual(post.tobytes(), func(tb.values, axis=1).tobytes())
+
     #---------------------------------------------------------------------------
     def test_type_blocks_slice_blocks_a(self) -> None:
         tb1 = ff.parse('s(3,6)|v(int,int,bool,bool)')._blocks
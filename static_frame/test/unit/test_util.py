@@ -29,11 +29,16 @@ from static_frame.core.util import argmin_1d
 from static_frame.core.util import argmin_2d
 from static_frame.core.util import array1d_to_last_contiguous_to_edge
 from static_frame.core.util import array_deepcopy
+from static_frame.core.util import array_for_sort
+from static_frame.core.util import array_group_count
+from static_frame.core.util import array_group_reduce
+from static_frame.core.util import array_group_select
 from static_frame.core.util import array_from_element_apply
 from static_frame.core.util import array_from_element_method
 from static_frame.core.util import array_sample
 from static_frame.core.util import array_shift
 from static_frame.core.util import array_to_duplicated
+from static_frame.core.util import array_to_groups_and_locations
 from static_frame.core.util import array_ufunc_axis_skipna
 from static_frame.core.util import binary_transition
 from static_frame.core.util import blocks_to_array_2d
@@ -56,7 +61,9 @@ from static_frame.core.util import iterable_to_array_2d
 from static_frame.core.util import iterable_to_array_nd
 from static_frame.core.util import key_to_datetime_key
 from static_frame.core.util import list_to_tuple
+from static_frame.core.util import locations_to_positions
 from static_frame.core.util import prepare_iter_for_array
+from static_frame.core.util import reduce_windows
 from static_frame.core.util import roll_1d
 from static_frame.core.util import roll_2d
 from static_frame.core.util import setdiff1d
@@ -67,12 +74,22 @@ from static_frame.core.util import to_datetime64
 from static_frame.core.util import to_timedelta64
 from static_frame.core.util import ufunc_all
 from static_frame.core.util import ufunc_any
+from static_frame.core.util import ufunc_cummax
+from static_frame.core.util import ufunc_cummean
+from static_frame.core.util import ufunc_cumstd
 from static_frame.core.util import ufunc_dtype_to_dtype
 from static_frame.core.util import ufunc_nanall
 from static_frame.core.util import ufunc_nanany
+from static_frame.core.util import ufunc_nancumcount
+from static_frame.core.util import ufunc_nancummax
+from static_frame.core.util import ufunc_nancummean
+from static_frame.core.util import ufunc_nancummin
+from static_frame.core.util import ufunc_nancumstd
 from static_frame.core.util import ufunc_set_iter
 from static_frame.core.util import ufunc_unique
 from static_frame.core.util import ufunc_unique1d_counts
+from static_frame.core.util import ufunc_unique1d_indexer
+from static_frame.core.util import ufunc_unique1d_indexer_ordered
 from static_frame.core.util import ufunc_unique1d_positions
 from static_frame.core.util import ufunc_unique2d_indexer
 from static_frame.core.util import union1d
@@ -2377,6 +2394,52 @@ class TestUnit(TestCase):
         self.assertFalse(ufunc_nanall(np.array([np.nan, False, False], dtype=object)))
         self.assertFalse(ufunc_nanall(np.array([None, False, False], dtype=object)))
 
+    def test_ufunc_cummax_a(self) -> None:
+        a1 = np.array([np.nan, 3.0, np.nan, 1.0, 4.0])
+        self.assertEqual(ufunc_nancummax(a1)[1:].tolist(), [3.0, 3.0, 3.0, 4.0])
+        self.assertTrue(np.isnan(ufunc_nancummax(a1)[0]))
+        self.assertTrue(np.isnan(ufunc_cummax(a1)).all())
+        self.assertEqual(ufunc_nancummin(a1)[1:].tolist(), [3.0, 3.0, 1.0, 1.0])
+
+        a2 = np.array([None, 'b', None, 'a', 'c'], dtype=object)
+        self.assertEqual(ufunc_nancummax(a2).tolist(), [None, 'b', 'b', 'b', 'c'])
+        self.assertEqual(ufunc_nancummin(a2).tolist(), [None, 'b', 'b', 'a', 'a'])
+
+        a3 = np.array([['b', 'a'], ['a', 'c']])
+        post = ufunc_cummax(a3, axis=1)
+        self.assertEqual(post.dtype, a3.dtype)
+        self.assertEqual(post.tolist(), [['b', 'b'], ['a', 'c']])
+
+    def test_ufunc_cummean_a(self) -> None:
+        a1 = np.array([np.nan, 2, 4, np.nan, 6], dtype=np.float32)
+        post1 = ufunc_nancummean(a1)
+        self.assertEqual(post1.dtype, a1.dtype)
+        self.assertEqual(post1[1:].tolist(), [2.0, 3.0, 3.0, 4.0])
+        self.assertTrue(np.isnan(post1[0]))
+        self.assertTrue(np.isnan(ufunc_cummean(a1)).all())
+
+        a2 = np.array([[1, 2], [3, 4]])
+        self.assertEqual(ufunc_cummean(a2, axis=0).tolist(), [[1.0, 2.0], [2.0, 3.0]])
+        self.assertEqual(ufunc_cummean(a2, axis=1).tolist(), [[1.0, 1.5], [3.0, 3.5]])
+        self.assertEqual(ufunc_nancumcount(a1).tolist(), [0, 1, 2, 2, 3])
+
+    def test_ufunc_cumstd_a(self) -> None:
+        a1 = np.array([1e9 + 4, np.nan, 1e9 + 7, 1e9 + 13, 1e9 + 16])
+        post1 = ufunc_nancumstd(a1)
+        for i in range(len(a1)):
+            self.assertAlmostEqual(post1[i], np.nanstd(a1[:i + 1]))
+
+        post2 = ufunc_cumstd(a1[[0, 2, 3]], ddof=1)
+        self.assertTrue(np.isnan(post2[0]))
+        self.assertEqual(post2[1:].round(6).tolist(), [2.12132, 4.582576])
+
+        a2 = np.array([[1, 2, 3], [3, 6, 9]])
+        post3 = ufunc_cumstd(a2, axis=1)
+        self.assertEqual(post3.round(6).tolist(), [[0.0, 0.5, 0.816497], [0.0, 1.5, 2.44949]])
+
+        a3 = np.array([1 + 1j, 3 + 3j])
+        self.assertEqual(ufunc_cumstd(a3).tolist(), [0.0, np.std(a3)])
+
     def test_container_all_b(self) -> None:
         self.assertTrue(ufunc_all(np.array([True, True])))
         self.assertTrue(ufunc_all(np.array([1, 2])))
@@ -2601,6 +2664,121 @@ class TestUnit(TestCase):
 
     #---------------------------------------------------------------------------
 
+    def test_locations_to_positions_a(self) -> None:
+        groups, locations = array_to_groups_and_locations(np.array([5, 2, 5, 7, 2, 5]))
+        post = list(locations_to_positions(locations, len(groups)))
+        self.assertEqual(groups.tolist(), [2, 5, 7])
+        self.assertEqual([p.tolist() for p in post], [[1, 4], [0, 2, 5], [3]])
+        self.assertFalse(post[0].flags.writeable)
+        self.assertEqual(list(locations_to_positions(np.array([], dtype=np.int64), 0)), [])
+
+    def test_array_group_reduce_a(self) -> None:
+        a1 = np.array([[1, 2], [3, np.nan], [5, 6], [np.nan, np.nan]])
+        starts = np.array([0, 1, 3])
+        ends = np.array([1, 3, 4])
+
+        post1 = array_group_reduce(a1, starts, ends, skipna=True, ufunc=np.sum, ufunc_skipna=np.nansum)
+        self.assertEqual(post1.tolist(), [[1.0, 2.0], [8.0, 6.0], [0.0, 0.0]])
+
+        post2 = array_group_reduce(a1, starts, ends, skipna=True, ufunc=np.mean, ufunc_skipna=np.nanmean)
+        self.assertEqual(post2[:2].tolist(), [[1.0, 2.0], [4.0, 6.0]])
+        self.assertTrue(np.isnan(post2[2]).all())
+
+        post3 = array_group_reduce(a1, starts, ends, skipna=False, ufunc=np.min, ufunc_skipna=np.nanmin)
+        self.assertEqual(post3[:2, 0].tolist(), [1.0, 3.0])
+        self.assertTrue(np.isnan(post3[1, 1]))
+
+        post4 = array_group_reduce(a1, starts, ends, skipna=True, ufunc=np.max, ufunc_skipna=np.nanmax)
+        self.assertEqual(post4[:2].tolist(), [[1.0, 2.0], [5.0, 6.0]])
+
+    def test_array_group_reduce_b(self) -> None:
+        starts = np.array([0, 2])
+        ends = np.array([2, 4])
+        a1 = np.array([True, True, False, True])
+        post1 = array_group_reduce(a1, starts, ends, skipna=True, ufunc=np.sum, ufunc_skipna=np.nansum)
+        self.assertEqual(post1.dtype, np.dtype(np.int64))
+        self.assertEqual(post1.tolist(), [2, 1])
+
+        a2 = np.array([250, 10, 3, 4], dtype=np.uint8)
+        post2 = array_group_reduce(a2, starts, ends, skipna=True, ufunc=np.sum, ufunc_skipna=np.nansum)
+        self.assertEqual(post2.tolist(), [260, 7])
+
+        a3 = np.array([None, 'a', None, None], dtype=object)
+        post3 = array_group_reduce(a3, starts, ends, skipna=True, ufunc=np.sum, ufunc_skipna=np.nansum)
+        self.assertEqual(post3[0], 'a')
+        self.assertTrue(np.isnan(post3[1]))
+
+        a4 = np.array(['a', 'b', 'c', 'd'])
+        post4 = array_group_reduce(a4, starts, ends, skipna=True, ufunc=np.max, ufunc_skipna=np.nanmax)
+        self.assertEqual(post4.tolist(), ['b', 'd'])
+
+    def test_array_group_count_a(self) -> None:
+        a1 = np.array([[1, None], [3, 'a'], [None, None]], dtype=object)
+        starts = np.array([0, 2])
+        ends = np.array([2, 3])
+        self.assertEqual(array_group_count(a1, starts, ends, skipna=True).tolist(), [[2, 1], [0, 0]])
+        self.assertEqual(array_group_count(a1, starts, ends, skipna=False).tolist(), [[2, 2], [1, 1]])
+
+    def test_array_group_select_a(self) -> None:
+        a1 = np.array([10, 20, 30, 40, 50])
+        starts = np.array([0, 1, 4])
+        ends = np.array([1, 4, 5])
+        self.assertEqual(array_group_select(a1, starts, ends, last=False).tolist(), [10, 20, 50])
+        self.assertEqual(array_group_select(a1, starts, ends, last=True).tolist(), [10, 40, 50])
+
+    def test_array_group_reduce_c(self) -> None:
+        # overlapping windows
+        a1 = np.array([1.0, np.nan, 3.0, 4.0, np.inf])
+        starts = np.array([0, 0, 1, 2, 3])
+        ends = np.array([1, 3, 4, 5, 5])
+
+        post1 = array_group_reduce(a1, starts, ends, skipna=True, ufunc=np.sum, ufunc_skipna=np.nansum)
+        self.assertEqual(post1.tolist(), [1.0, 4.0, 7.0, np.inf, np.inf])
+
+        post2 = array_group_reduce(a1, starts, ends, skipna=False, ufunc=np.sum, ufunc_skipna=np.nansum)
+        self.assertEqual(post2[[0, 3, 4]].tolist(), [1.0, np.inf, np.inf])
+        self.assertTrue(np.isnan(post2[[1, 2]]).all())
+
+        post3 = array_group_reduce(a1, starts, ends, skipna=True, ufunc=np.std, ufunc_skipna=np.nanstd)
+        self.assertEqual(post3[:3].tolist(), [0.0, 1.0, 0.5])
+
+        a2 = np.array([[1, 10], [2, 20], [3, 30]], dtype=np.int8)
+        post4 = array_group_reduce(a2, np.array([0, 1]), np.array([2, 3]), skipna=True, ufunc=np.mean, ufunc_skipna=np.nanmean)
+        self.assertEqual(post4.tolist(), [[1.5, 15.0], [2.5, 25.0]])
+
+        post5 = array_group_reduce(a2, np.array([0, 0]), np.array([0, 3]), skipna=True, ufunc=np.sum, ufunc_skipna=np.nansum)
+        self.assertEqual(post5.tolist(), [[0, 0], [6, 60]])
+
+    def test_reduce_windows_a(self) -> None:
+        a1 = np.arange(10)
+        starts = np.array([0, 2, 5])
+        ends = np.array([3, 4, 10])
+        post = reduce_windows(a1, starts, ends, lambda w: w.max(axis=-1))
+        self.assertEqual(post.tolist(), [2, 3, 9])
+
+        post = reduce_windows(a1, starts[:0], ends[:0], lambda w: w.max(axis=-1))
+        self.assertEqual(post.tolist(), [])
+
+    def test_array_for_sort_a(self) -> None:
+        a1 = np.array(['b', 'a', 'ccc', 'a'], dtype=object)
+        post = array_for_sort(a1)
+        self.assertEqual(post.dtype, np.dtype('<U3'))
+        self.assertEqual(np.argsort(post, kind='stable').tolist(), np.argsort(a1, kind='stable').tolist())
+
+        # not converted
+        a2 = np.array(['b', 1], dtype=object)
+        self.assertIs(array_for_sort(a2), a2)
+        a3 = np.array(['b', 'a\x00'], dtype=object)
+        self.assertIs(array_for_sort(a3), a3)
+        a4 = np.array(['b', 'a' * 100], dtype=object)
+        self.assertIs(array_for_sort(a4), a4)
+        a5 = np.array([3, 1])
+        self.assertIs(array_for_sort(a5), a5)
+        a6 = np.array([], dtype=object)
+        self.assertIs(array_for_sort(a6), a6)
+
+    #---------------------------------------------------------------------------
+
     def test_ufunc_unique1d_positions_a(self) -> None:
         pos, indexer = ufunc_unique1d_positions(np.array([3, 2, 3, 2, 5, 3]))
         self.assertEqual(pos.tolist(), [1, 0, 4])
@@ -2616,6 +2794,34 @@ class TestUnit(TestCase):
         self.assertEqual(pos.tolist(), [0, 1, 2])
         self.assertEqual(indexer.tolist(), [0, 1, 2, 1, 0])
 
+    def test_ufunc_unique1d_indexer_a(self) -> None:
+        values, indexer = ufunc_unique1d_indexer(np.array(['c', 'a', 'c', 'b']))
+        self.assertEqual(values.tolist(), ['a', 'b', 'c'])
+        self.assertEqual(values.dtype, np.dtype('<U1'))
+        self.assertEqual(indexer.tolist(), [2, 0, 2, 1])
+
+        values, indexer = ufunc_unique1d_indexer(np.array([(1, 2), 'a', (1, 2)], dtype=object))
+        self.assertEqual(values.tolist(), [(1, 2), 'a'])
+        self.assertEqual(indexer.tolist(), [0, 1, 0])
+
+        values, indexer = ufunc_unique1d_indexer(np.array([None, 'b', 3, 'b'], dtype=object))
+        self.assertEqual(values.tolist(), [None, 'b', 3])
+        self.assertEqual(indexer.tolist(), [0, 1, 2, 1])
+
+    def test_ufunc_unique1d_indexer_ordered_a(self) -> None:
+        values, indexer = ufunc_unique1d_indexer_ordered(np.array([3, 2, 3, 5, 2]))
+        self.assertEqual(values.tolist(), [3, 2, 5])
+        self.assertEqual(indexer.tolist(), [0, 1, 0, 2, 1])
+        self.assertFalse(indexer.flags.writeable)
+
+        values, indexer = ufunc_unique1d_indexer_ordered(np.array(['c', 'a', 'c', 'b']))
+        self.assertEqual(values.tolist(), ['c', 'a', 'b'])
+        self.assertEqual(indexer.tolist(), [0, 1, 0, 2])
+
+        values, indexer = ufunc_unique1d_indexer_ordered(np.array(['b', None, 3, 'b'], dtype=object))
+        self.assertEqual(values.tolist(), ['b', None, 3])
+        self.assertEqual(indexer.tolist(), [0, 1, 2, 0])
+
     #---------------------------------------------------------------------------
 
     def test_dtype_from_element_a(self) -> None:
@@ -0,0 +1,165 @@
+import gc
+import pickle
+import threading
+from copy import deepcopy
+
+import numpy as np
+
+from static_frame.core.frame import Frame
+from static_frame.core.frame import FrameGO
+from static_frame.core.type_blocks import TypeBlocks
+from static_frame.core.values_cache import VALUES_CACHE
+from static_frame.core.values_cache import ValuesCache
+from static_frame.core.values_cache import ValuesCacheActive
+from static_frame.core.values_cache import ValuesCacheConfig
+from static_frame.test.test_case import TestCase
+
+
+class TestUnit(TestCase):
+
+    #---------------------------------------------------------------------------
+    def test_values_cache_a(self) -> None:
+        cache = ValuesCache(nbytes_max=200)
+        tb1 = TypeBlocks.from_blocks((np.arange(10), np.arange(10)))
+        tb2 = TypeBlocks.from_blocks((np.arange(10), np.arange(10)))
+        a1 = np.arange(20).reshape(10, 2)
+        a2 = np.arange(20).reshape(10, 2)
+
+        cache.set(tb1, a1)
+        self.assertIs(cache.get(tb1), a1)
+        self.assertEqual(cache.nbytes, 160)
+
+        # exceeding the cap evicts the least-recently used
+        cache.set(tb2, a2)
+        self.assertIs(cache.get(tb2), a2)
+        self.assertIs(cache.get(tb1), None)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.nbytes, 160)
+
+        # arrays larger than the cap are not retained
+        cache.set(tb1, np.arange(30))
+        self.assertIs(cache.get(tb1), None)
+
+        cache.discard(tb2)
+        self.assertIs(cache.get(tb2), None)
+        self.assertEqual(cache.nbytes, 0)
+
+    def test_values_cache_b(self) -> None:
+        cache = ValuesCache(nbytes_max=None)
+        tb1 = TypeBlocks.from_blocks((np.arange(10), np.arange(10)))
+        cache.set(tb1, np.arange(20).reshape(10, 2))
+        self.assertEqual(len(cache), 1)
+
+        # entries are removed when the TypeBlocks is collected
+        del tb1
+        gc.collect()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.nbytes, 0)
+
+        tb2 = TypeBlocks.from_blocks((np.arange(10), np.arange(10)))
+        cache.set(tb2, np.arange(20).reshape(10, 2))
+        cache.clear()
+        self.assertIs(tb2._values_cache, None)
+        self.assertEqual(cache.nbytes, 0)
+
+    def test_values_cache_c(self) -> None:
+        cache = ValuesCache(nbytes_max=None)
+        tb1 = TypeBlocks.from_blocks((np.arange(10), np.arange(10)))
+        cache.set(tb1, np.arange(20).reshape(10, 2))
+
+        # a finalizer called while the lock is held defers removal
+        with cache._lock:
+            cache._finalize(id(tb1), cache._entries[id(tb1)][0])
+            self.assertEqual(len(cache._entries), 1)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.nbytes, 0)
+
+        # lowering the cap evicts
+        cache.set(tb1, np.arange(20).reshape(10, 2))
+        cache.nbytes_max = 100
+        self.assertIs(tb1._values_cache, None)
+        self.assertEqual(cache.nbytes, 0)
+
+    def test_values_cache_d(self) -> None:
+        cache = ValuesCache(nbytes_max=2000)
+
+        def func() -> None:
+            for _ in range(200):
+                tb = TypeBlocks.from_blocks((np.arange(10), np.arange(10)))
+                cache.set(tb, np.arange(20).reshape(10, 2))
+                cache.get(tb)
+                if id(tb) % 2:
+                    cache.discard(tb)
+
+        threads = [threading.Thread(target=func) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        gc.collect()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.nbytes, 0)
+
+    def test_values_cache_active_a(self) -> None:
+        config = ValuesCacheActive.get()
+        self.assertEqual(config, ValuesCacheConfig())
+        self.assertEqual(config.nbytes_max, 1 << 28)
+        tb1 = TypeBlocks.from_blocks((np.arange(3), np.arange(3) * 2.0))
+        try:
+            ValuesCacheActive.update(active=False)
+            self.assertEqual(VALUES_CACHE.nbytes_max, 0)
+            _ = tb1.values
+            self.assertIs(tb1._values_cache, None)
+
+            ValuesCacheActive.update(active=True, nbytes_max=None)
+            self.assertIs(VALUES_CACHE.nbytes_max, None)
+            a1 = tb1.values
+            self.assertIs(tb1._values_cache, a1)
+
+            # lowering the cap releases retained arrays
+            ValuesCacheActive.update(nbytes_max=8)
+            self.assertIs(tb1._values_cache, None)
+        finally:
+            ValuesCacheActive.set(config)
+        self.assertEqual(VALUES_CACHE.nbytes_max, config.nbytes_max)
+
+    #---------------------------------------------------------------------------
+    def test_type_blocks_values_cache_a(self) -> None:
+        tb1 = TypeBlocks.from_blocks((np.arange(3), np.arange(3) * 2.0))
+        a1 = tb1.values
+        self.assertFalse(a1.flags.writeable)
+        self.assertIs(tb1.values, a1)
+
+        self.assertIs(pickle.loads(pickle.dumps(tb1))._values_cache, None)
+        self.assertIs(deepcopy(tb1)._values_cache, None)
+        self.assertIs(tb1.copy()._values_cache, None)
+
+        # appending invalidates
+        tb1.append(np.array([True, False, True]))
+        a2 = tb1.values
+        self.assertIsNot(a2, a1)
+        self.assertEqual(a2.shape, (3, 3))
+        VALUES_CACHE.discard(tb1)
+
+    def test_type_blocks_values_cache_b(self) -> None:
+        # a single block is returned without retention
+        tb1 = TypeBlocks.from_blocks(np.arange(6).reshape(3, 2))
+        _ = tb1.values
+        self.assertIs(tb1._values_cache, None)
+
+    def test_frame_values_cache_a(self) -> None:
+        f1 = FrameGO.from_dict(dict(a=(1, 2), b=(3.5, 4.5)))
+        self.assertIs(f1.values, f1.values)
+        self.assertEqual(f1.sum(axis=1).values.tolist(), [4.5, 6.5])
+
+        f1['c'] = (10, 20)
+        self.assertEqual(f1.values.tolist(), [[1, 3.5, 10], [2, 4.5, 20]])
+        self.assertEqual(f1.mean(axis=1).values.tolist(), [14.5 / 3, 26.5 / 3])
+
+        f2 = Frame(f1)
+        self.assertEqual(f2.values.tolist(), f1.values.tolist())
+
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
@@ -366,9 +366,10 @@ class TestUnit(TestCase):
                 (('f7', (4, 2)), ('f3', (4, 4)))
                 )
 
+        # Frames are grouped by Bus, such that labels and Frames remain aligned
         y2 = y1.loc[['f1', 'f7', 'f3']]
         self.assertEqual(y2.shapes.to_pairs(),
-                (('f1', (4, 4)), ('f7', (4, 4)), ('f3', (4, 2)))
+                (('f1', (4, 4)), ('f3', (4, 4)), ('f7', (4, 2)))
                 )
 
     def test_yarn_loc_e(self) -> None:
@@ -437,6 +438,50 @@ class TestUnit(TestCase):
         self.assertEqual(y1.iloc[[1, 6]].shape, (2,))
         self.assertEqual(y1.iloc[y1.index.via_str.startswith('f3')].shape, (1,))
 
+    def test_yarn_iloc_b(self) -> None:
+        f1 = ff.parse('s(4,2)').rename('f1')
+        f2 = ff.parse('s(4,5)').rename('f2')
+        f3 = ff.parse('s(2,2)').rename('f3')
+        f4 = ff.parse('s(2,8)').rename('f4')
+        f5 = ff.parse('s(4,4)').rename('f5')
+
+        b1 = Bus.from_frames((f1, f2), name='b1')
+        b2 = Bus.from_frames((), name='b2')
+        b3 = Bus.from_frames((f3,), name='b3')
+        b4 = Bus.from_frames((f4, f5), name='b4')
+
+        y1 = Yarn.from_buses((b1, b2, b3, b4), retain_labels=False)
+        self.assertEqual(y1._offsets.tolist(), [0, 2, 2, 3, 5])
+
+        y2 = y1.iloc[1:4]
+        self.assertEqual(y2._series.index.values.tolist(), ['b1', 'b3', 'b4'])
+        self.assertEqual([f.name for f in y2.values], ['f2', 'f3', 'f4'])
+
+        # Frames are grouped by Bus in order of first occurrence
+        y3 = y1.iloc[[-1, 0, 3]]
+        self.assertEqual(y3.index.values.tolist(), ['f5', 'f4', 'f1'])
+        self.assertEqual([f.name for f in y3.values], y3.index.values.tolist())
+        self.assertEqual(y3._series.index.values.tolist(), ['b4', 'b1'])
+        self.assertEqual([f.name for f in y3._series['b4'].values], ['f5', 'f4'])
+        self.assertEqual(y3._hierarchy.values.tolist(), [['b4', 'f5'], ['b4', 'f4'], ['b1', 'f1']])
+        self.assertEqual(y3['f4'].name, 'f4')
+
+        # already grouped keys retain their order
+        y7 = y1.iloc[[4, 3, 1, 0]]
+        self.assertEqual(y7.index.values.tolist(), ['f5', 'f4', 'f2', 'f1'])
+        self.assertEqual([f.name for f in y7.values], y7.index.values.tolist())
+
+        y4 = y1.iloc[::-2]
+        self.assertEqual([f.name for f in y4.values], ['f5', 'f3', 'f1'])
+        self.assertEqual(y4.index.values.tolist(), ['f5', 'f3', 'f1'])
+
+        y5 = y1.iloc[np.array([False, False, True, False, False])]
+        self.assertEqual([f.name for f in y5.values], ['f3'])
+
+        y6 = y1.iloc[[]]
+        self.assertEqual(len(y6), 0)
+        self.assertEqual(len(y6._series), 0)
+
     #---------------------------------------------------------------------------
 
     def test_yarn_keys_a(self) -> None: